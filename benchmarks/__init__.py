@@ -0,0 +1,7 @@
+"""
+    :module_name: benchmarks
+    :module_summary: performance benchmarks for the hot paths of tilematch_tools
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    Run with ``python -m benchmarks --help`` from the repository root
+"""
@@ -0,0 +1,63 @@
+"""
+    :module_name: __main__
+    :module_summary: command line entry point of the benchmark suite
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    python -m benchmarks [--filter TEXT] [--max-cells N] [--output FILE]
+                         [--baseline FILE] [--threshold FRACTION] [--save-baseline FILE]
+"""
+
+import argparse
+import json
+import sys
+
+from . import harness
+from . import hot_paths, allocations, memory, tracing, imports # registers benchmarks
+
+def parse_args(argv: [str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--filter', action='append', default=[],
+                        help='only run benchmarks whose name contains this text (repeatable)')
+    parser.add_argument('--max-cells', type=int, default=None,
+                        help='skip benchmarks on boards with more cells than this')
+    parser.add_argument('--list', action='store_true', help='list benchmark names and exit')
+    parser.add_argument('--output', help='write results as JSON to this file instead of stdout')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='relative slowdown over the baseline counted as a regression (default 0.10)')
+    parser.add_argument('--save-baseline', help='also write results to this file for later comparisons')
+    return parser.parse_args(argv)
+
+def main(argv: [str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    selected = [
+            bench for bench in harness.REGISTRY
+            if (not args.filter or any(text in bench.name for text in args.filter))
+            and (args.max_cells is None or bench.cells <= args.max_cells)
+            ]
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+
+    def report(result):
+        print(f'{result.name:<60} {result.value:>16.1f} {result.unit}', file=sys.stderr)
+
+    results = harness.run(selected, report)
+    data = harness.to_json(results)
+    if args.output:
+        harness.save(data, args.output)
+    else:
+        print(json.dumps(data, indent=2, sort_keys=True))
+    if args.save_baseline:
+        harness.save(data, args.save_baseline)
+
+    if args.baseline:
+        regressions = harness.compare(results, harness.load(args.baseline), args.threshold)
+        for name, before, after, change in regressions:
+            print(f'REGRESSION {name}: {before:.1f} -> {after:.1f} (+{change:.0%})', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+    :module_name: allocations
+    :module_summary: memory allocation benchmarks for operations that empty board cells
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import tracemalloc
+from contextlib import contextmanager
+
+from tilematch_tools.core import GameState
+from tilematch_tools.model import Scoring, Tile, TileAppearance, TileColor, RunMatchCondition
+
+from .harness import measured, board_params
+from .hot_paths import Shift
+
+SIZES = ((10, 20), (100, 100))
+CALLS = 100
+
+@contextmanager
+def counting(*classes):
+    """
+        Count instances created of the given classes while the context is active
+        :arg classes: classes whose __init__ is temporarily wrapped
+        :returns: a one element list holding the running count
+        :rtype: list
+    """
+    created = [0]
+    originals = {cls: cls.__dict__['__init__'] for cls in classes}
+    def wrap(init):
+        def __init__(self, *args, **kwargs):
+            created[0] += 1
+            init(self, *args, **kwargs)
+        return __init__
+    for cls, init in originals.items():
+        cls.__init__ = wrap(init)
+    try:
+        yield created
+    finally:
+        for cls, init in originals.items():
+            cls.__init__ = init
+
+def objects_per_call(operation: callable, calls: int = CALLS) -> float:
+    """
+        Average number of tiles and tile appearances created per call of operation
+        :arg operation: zero argument callable
+        :arg calls: how many times to call it
+        :returns: objects created per call
+        :rtype: float
+    """
+    operation() # warm up anything created once, e.g. interned appearances
+    with counting(Tile, TileAppearance) as created:
+        for _ in range(calls):
+            operation()
+    return created[0] / calls
+
+def peak_bytes(operation: callable, calls: int = CALLS) -> int:
+    """
+        Highest number of bytes allocated above the starting point while repeating operation
+        :arg operation: zero argument callable
+        :arg calls: how many times to call it
+        :returns: peak bytes traced by tracemalloc
+        :rtype: int
+    """
+    operation() # warm up anything created once, e.g. interned appearances
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(calls):
+            operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+def clear_match(board_type, width, height):
+    """Places a three tile run, then clears it"""
+    state = GameState(board_type(width, height), Scoring())
+    tiles = [Tile(**{'position': (x, 1), 'color': TileColor.RED}) for x in range(1, 4)]
+    def place_and_clear():
+        for tile in tiles:
+            state.board.place_tile(tile)
+        state.clear_match(RunMatchCondition.MatchFound(1, tiles))
+    return place_and_clear
+
+def swap_tiles(board_type, width, height):
+    state = GameState(board_type(width, height), Scoring())
+    first = Tile(**{'position': (1, 1), 'color': TileColor.RED})
+    second = Tile(**{'position': (1, 2), 'color': TileColor.BLUE})
+    state.board.place_tile(first)
+    state.board.place_tile(second)
+    return lambda: state.swap_tiles(first, second)
+
+def move(board_type, width, height):
+    """Moves a tile down, then back up"""
+    board = board_type(width, height)
+    tile = Tile(**{'position': (1, 2)})
+    board.place_tile(tile)
+    down, up = Shift(0, -1), Shift(0, 1)
+    def down_and_up():
+        down.move(board, tile)
+        up.move(board, tile)
+    return down_and_up
+
+for name, setup in (('clear_match', clear_match), ('swap_tiles', swap_tiles), ('move', move)):
+    measured(f'alloc.{name}.objects', 'objects/op', board_params(SIZES))(
+            lambda setup=setup, **params: objects_per_call(setup(**params))
+            )
+    measured(f'alloc.{name}.peak', 'bytes', board_params(SIZES))(
+            lambda setup=setup, **params: peak_bytes(setup(**params))
+            )
@@ -0,0 +1,168 @@
+"""
+    :module_name: harness
+    :module_summary: registration, measurement and baseline comparison of benchmarks
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import itertools
+import json
+import platform
+import sys
+import timeit
+from dataclasses import dataclass, asdict
+
+from tilematch_tools.model import GameBoard, ArrayGameBoard
+
+SIZES = ((10, 20), (50, 50), (100, 100), (200, 200), (500, 500))
+BOARD_TYPES = (GameBoard, ArrayGameBoard)
+
+@dataclass
+class Result:
+    """
+        One measurement. Lower values are better for every unit
+    """
+    name: str
+    value: float
+    unit: str
+
+@dataclass
+class Benchmark:
+    """
+        A registered benchmark
+        :name: full name, including its parameters
+        :run: callable returning the measured value
+        :unit: unit of the measured value
+        :cells: number of board cells involved, used to skip large boards
+    """
+    name: str
+    run: callable
+    unit: str
+    cells: int = 0
+
+REGISTRY = []
+
+def board_params(sizes: tuple = SIZES, board_types: tuple = BOARD_TYPES) -> [dict]:
+    """
+        Every combination of board type and size
+        :returns: list of keyword arguments for benchmark functions
+        :rtype: list
+    """
+    return [
+            {'board_type': board_type, 'width': width, 'height': height}
+            for board_type, (width, height) in itertools.product(board_types, sizes)
+            ]
+
+def _label(params: dict) -> str:
+    parts = []
+    if 'board_type' in params:
+        parts.append(params['board_type'].__name__)
+    if 'width' in params:
+        parts.append(f"{params['width']}x{params['height']}")
+    parts.extend(str(value) for key, value in params.items() if key not in ('board_type', 'width', 'height'))
+    return '-'.join(parts)
+
+def _register(name: str, params: [dict], unit: str, make_run: callable) -> None:
+    for kwargs in params or [{}]:
+        REGISTRY.append(Benchmark(
+            name=f'{name}[{_label(kwargs)}]' if kwargs else name,
+            run=make_run(kwargs),
+            unit=unit,
+            cells=kwargs.get('width', 0) * kwargs.get('height', 0)
+            ))
+
+def timed(name: str, params: [dict] = None):
+    """
+        Register a timing benchmark. The decorated function sets up the scenario and
+        returns the operation to time; the result is the best time per call in ns
+        :arg name: benchmark name
+        :arg params: keyword arguments to run the benchmark with, one benchmark each
+    """
+    def decorator(setup: callable) -> callable:
+        _register(name, params, 'ns/op', lambda kwargs: lambda: time_per_call(setup(**kwargs)))
+        return setup
+    return decorator
+
+def measured(name: str, unit: str, params: [dict] = None):
+    """
+        Register a benchmark whose decorated function returns the measured value itself
+        :arg name: benchmark name
+        :arg unit: unit of the returned value
+        :arg params: keyword arguments to run the benchmark with, one benchmark each
+    """
+    def decorator(measure: callable) -> callable:
+        _register(name, params, unit, lambda kwargs: lambda: measure(**kwargs))
+        return measure
+    return decorator
+
+def time_per_call(operation: callable, repeat: int = 5) -> float:
+    """
+        Best time per call of operation over several auto-ranged repeats
+        :arg operation: zero argument callable
+        :arg repeat: number of repeats
+        :returns: nanoseconds per call
+        :rtype: float
+    """
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+def run(selected: [Benchmark], report: callable = None) -> [Result]:
+    """
+        Run the selected benchmarks
+        :arg selected: the benchmarks to run
+        :arg report: called with each result as it is produced
+        :returns: the results
+        :rtype: list
+    """
+    results = []
+    for bench in selected:
+        result = Result(bench.name, float(bench.run()), bench.unit)
+        results.append(result)
+        if report:
+            report(result)
+    return results
+
+def to_json(results: [Result]) -> dict:
+    """
+        Machine-readable form of a set of results
+        :returns: results keyed by benchmark name, plus the environment they ran in
+        :rtype: dict
+    """
+    return {
+            'environment': {
+                'python': sys.version.split()[0],
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'system': platform.system()
+                },
+            'results': {result.name: asdict(result) for result in results}
+            }
+
+def load(path: str) -> dict:
+    with open(path, encoding='utf-8') as source:
+        return json.load(source)
+
+def save(data: dict, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as out:
+        json.dump(data, out, indent=2, sort_keys=True)
+        out.write('\n')
+
+def compare(results: [Result], baseline: dict, threshold: float) -> [tuple]:
+    """
+        Find results that got worse than their baseline by more than threshold
+        :arg results: current results
+        :arg baseline: data previously produced by to_json
+        :arg threshold: allowed relative slowdown, e.g. 0.1 for 10%
+        :returns: (name, baseline value, current value, relative change) for each regression
+        :rtype: list
+    """
+    regressions = []
+    previous = baseline.get('results', {})
+    for result in results:
+        before = previous.get(result.name)
+        if not before or before['unit'] != result.unit or before['value'] <= 0:
+            continue
+        change = result.value / before['value'] - 1
+        if change > threshold:
+            regressions.append((result.name, before['value'], result.value, change))
+    return regressions
@@ -0,0 +1,345 @@
+"""
+    :module_name: hot_paths
+    :module_summary: timing benchmarks for board, match, movement and loop hot paths
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import copy
+import itertools
+import os
+import pickle
+import random
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from tilematch_tools.core import (
+        GameState, GameLoop, TranspositionTable, serialization, Game, GameFactory, GameEnv,
+        HeadlessEngine, Replayer, record_game
+        )
+from tilematch_tools.model import (
+        Scoring, MovementRule, Tile, NullTile, TileColor, RunMatchCondition, ClusterMatchCondition,
+        ArrayGameBoard, TileGroup
+        )
+from tilematch_tools.model.match import ScanDelta, ORTHOGONAL
+from tilematch_tools.view.board_view import BoardView
+from tilematch_tools.view.raster_board_view import CellPainter
+
+from .harness import timed, board_params, SIZES
+
+PALETTE = (TileColor.RED, TileColor.GREEN, TileColor.BLUE, TileColor.YELLOW)
+
+def random_tile(rng: random.Random, x: int, y: int) -> Tile:
+    return Tile(**{'position': (x, y), 'color': rng.choice(PALETTE)})
+
+def random_board(board_type, width, height, seed=0):
+    """A board with every cell holding a randomly colored tile"""
+    rng = random.Random(seed)
+    board = board_type(width, height)
+    for x in range(1, width + 1):
+        for y in range(1, height + 1):
+            board.place_tile(random_tile(rng, x, y))
+    return board
+
+def null_tile(x: int, y: int) -> NullTile:
+    return NullTile(**{'position': (x, y), 'color': NullTile.EMPTY_COLOR})
+
+class UncheckedShift(MovementRule):
+    """Moves a tile by a fixed offset, finding out it is blocked when placing fails"""
+    def __init__(self, dx, dy):
+        super().__init__()
+        self._dx = dx
+        self._dy = dy
+
+    def apply(self, board, tile):
+        tile.position = (tile.position.x + self._dx, tile.position.y + self._dy)
+        board.place_tile(tile)
+
+class Shift(UncheckedShift):
+    """Moves a tile by a fixed offset, checking the destination ahead"""
+    def destination(self, board, tile):
+        return (tile.position.x + self._dx, tile.position.y + self._dy)
+
+@timed('board.tile_at', board_params())
+def tile_at(board_type, width, height):
+    board = random_board(board_type, width, height)
+    rng = random.Random(1)
+    positions = itertools.cycle([
+        (rng.randint(1, width), rng.randint(1, height)) for _ in range(1024)
+        ])
+    return lambda: board.tile_at(*next(positions))
+
+@timed('board.place_tile', board_params())
+def place_tile(board_type, width, height):
+    """Places a tile on an empty cell, then frees the cell again"""
+    board = board_type(width, height)
+    tile = Tile(**{'position': (width // 2 + 1, height // 2 + 1)})
+    empty = null_tile(width // 2 + 1, height // 2 + 1)
+    def place_and_free():
+        board.place_tile(tile)
+        board.place_tile(empty)
+    return place_and_free
+
+@timed('board.iterate', board_params())
+def iterate(board_type, width, height):
+    board = random_board(board_type, width, height)
+    def visit_all():
+        for _ in board:
+            pass
+    return visit_all
+
+@timed('state.clear_match', board_params())
+def clear_match(board_type, width, height):
+    """Places a three tile run, then clears it"""
+    state = GameState(board_type(width, height), Scoring())
+    tiles = [Tile(**{'position': (x, 1), 'color': TileColor.RED}) for x in range(1, 4)]
+    def place_and_clear():
+        for tile in tiles:
+            state.board.place_tile(tile)
+        state.clear_match(RunMatchCondition.MatchFound(1, tiles))
+    return place_and_clear
+
+@timed('state.swap_tiles', board_params())
+def swap_tiles(board_type, width, height):
+    state = GameState(board_type(width, height), Scoring())
+    first = Tile(**{'position': (1, 1), 'color': TileColor.RED})
+    second = Tile(**{'position': (1, 2), 'color': TileColor.BLUE})
+    state.board.place_tile(first)
+    state.board.place_tile(second)
+    return lambda: state.swap_tiles(first, second)
+
+@timed('movement.move', board_params())
+def move(board_type, width, height):
+    """Moves a tile down, then back up"""
+    board = board_type(width, height)
+    tile = Tile(**{'position': (1, 2)})
+    board.place_tile(tile)
+    down, up = Shift(0, -1), Shift(0, 1)
+    def down_and_up():
+        down.move(board, tile)
+        up.move(board, tile)
+    return down_and_up
+
+@timed('movement.move_blocked', board_params())
+def move_blocked(board_type, width, height):
+    """Tries to move a tile off the bottom of the board"""
+    board = board_type(width, height)
+    tile = Tile(**{'position': (1, 1)})
+    board.place_tile(tile)
+    down = Shift(0, -1)
+    return lambda: down.move(board, tile)
+
+@timed('movement.move_blocked_unchecked', board_params(((10, 20), (50, 50), (100, 100))))
+def move_blocked_unchecked(board_type, width, height):
+    """The blocked move through apply and revert, what it cost before can_move, for comparison"""
+    board = board_type(width, height)
+    tile = Tile(**{'position': (1, 1)})
+    board.place_tile(tile)
+    down = UncheckedShift(0, -1)
+    return lambda: down.move(board, tile)
+
+def placed_group(board, x, y):
+    """A T of four tiles centered at (x, y), placed on board"""
+    tiles = [Tile(**{'position': (x, y)}) for _ in range(4)]
+    group = TileGroup(tiles[0])
+    for tile, (dx, dy) in zip(tiles[1:], ((-1, 0), (1, 0), (0, 1))):
+        group.add_sibling_tile(tile, dx, dy)
+    for tile in tiles:
+        board.place_tile(tile)
+    return group
+
+@timed('movement.group_shift', board_params(((10, 20), (50, 50), (100, 100))))
+def group_shift(board_type, width, height):
+    """Shifts a four tile group down, then back up"""
+    board = board_type(width, height)
+    group = placed_group(board, 2, 2)
+    def down_and_up():
+        group.shift(board, 0, -1)
+        group.shift(board, 0, 1)
+    return down_and_up
+
+@timed('movement.group_rotate', board_params(((10, 20), (50, 50), (100, 100))))
+def group_rotate(board_type, width, height):
+    board = board_type(width, height)
+    group = placed_group(board, 2, 2)
+    return lambda: group.rotate(board)
+
+@timed('board.snapshot_restore', board_params())
+def snapshot_restore(board_type, width, height):
+    """Swaps two tiles, then undoes the swap from a snapshot"""
+    state = GameState(random_board(board_type, width, height), Scoring())
+    snapshot = state.board.snapshot()
+    def swap_and_undo():
+        state.swap_tiles(state.board.tile_at(1, 1), state.board.tile_at(2, 1))
+        state.board.restore(snapshot)
+    return swap_and_undo
+
+@timed('board.clone_swap', board_params())
+def clone_swap(board_type, width, height):
+    """Clones the board and swaps two tiles on the clone, as a lookahead search would"""
+    board = random_board(board_type, width, height)
+    def clone_and_swap():
+        twin = GameState(board.clone(), Scoring())
+        twin.swap_tiles(twin.board.tile_at(1, 1), twin.board.tile_at(2, 1))
+    return clone_and_swap
+
+@timed('board.deepcopy', board_params(((10, 20), (50, 50), (100, 100))))
+def deepcopy(board_type, width, height):
+    """What cloning cost before snapshots and clones, for comparison"""
+    board = random_board(board_type, width, height)
+    return lambda: copy.deepcopy(board)
+
+@timed('board.hashed_swap', board_params())
+def hashed_swap(board_type, width, height):
+    """Swaps two tiles while the board maintains its Zobrist hash"""
+    state = GameState(random_board(board_type, width, height), Scoring())
+    state.board.state_hash # start maintaining the hash
+    def swap():
+        state.swap_tiles(state.board.tile_at(1, 1), state.board.tile_at(2, 1))
+        return state.board.state_hash
+    return swap
+
+@timed('board.transposition_probe', board_params())
+def transposition_probe(board_type, width, height):
+    """Swaps two tiles and looks the resulting state up, as a lookahead search would"""
+    state = GameState(random_board(board_type, width, height), Scoring())
+    table = TranspositionTable()
+    def swap_and_probe():
+        state.swap_tiles(state.board.tile_at(1, 1), state.board.tile_at(2, 1))
+        key = state.board.state_hash
+        if table.get(key) is None:
+            table.put(key, 0)
+    return swap_and_probe
+
+@timed('state.dumps', board_params())
+def state_dumps(board_type, width, height):
+    state = GameState(random_board(board_type, width, height), Scoring())
+    return lambda: serialization.dumps(state)
+
+@timed('state.loads', board_params())
+def state_loads(board_type, width, height):
+    data = serialization.dumps(GameState(random_board(board_type, width, height), Scoring()))
+    return lambda: serialization.loads(data)
+
+@timed('state.pickle_round_trip', board_params(((10, 20), (50, 50), (100, 100))))
+def pickle_round_trip(board_type, width, height):
+    """Pickling every tile, what checkpoints cost before the binary format, for comparison"""
+    board = random_board(board_type, width, height)
+    return lambda: pickle.loads(pickle.dumps(list(board)))
+
+@timed('match.run_find_all', board_params())
+def run_find_all(board_type, width, height):
+    board = random_board(board_type, width, height)
+    rule = RunMatchCondition((ScanDelta.RIGHT, ScanDelta.UP), 1, run_length=3)
+    return lambda: rule.find_all(board)
+
+@timed('match.cluster_find_all', board_params())
+def cluster_find_all(board_type, width, height):
+    board = random_board(board_type, width, height)
+    rule = ClusterMatchCondition(ORTHOGONAL, 1, min_size=4)
+    return lambda: rule.find_all(board)
+
+class SwapLoop(GameLoop):
+    """Swaps two random neighbours each tick and refills cleared cells"""
+
+    def __init__(self, state, view, delay, rng):
+        super().__init__(state, view, delay)
+        self._rng = rng
+        self._cleared = []
+
+    def tick(self):
+        board = self.state.board
+        x = self._rng.randint(1, board.num_cols - 1)
+        y = self._rng.randint(1, board.num_rows)
+        self.state.swap_tiles(board.tile_at(x, y), board.tile_at(x + 1, y))
+
+    def find_matches(self, match_rules):
+        return super().find_matches(match_rules)
+
+    def clear_matches(self, matches_found):
+        for match in matches_found:
+            self._cleared.extend((tile.position.x, tile.position.y) for tile in match.matching_tiles)
+        super().clear_matches(matches_found)
+
+    def clean_up_state(self):
+        for x, y in self._cleared:
+            if type(self.state.board.tile_at(x, y)) == NullTile:
+                self.state.board.place_tile(random_tile(self._rng, x, y))
+        self._cleared.clear()
+
+class IncrementalSwapLoop(SwapLoop):
+    INCREMENTAL_MATCHING = True
+
+@timed('loop.step', [
+    dict(params, incremental=incremental)
+    for params in board_params()
+    for incremental in (False, True)
+    ])
+def loop_step(board_type, width, height, incremental):
+    state = GameState(random_board(board_type, width, height), Scoring())
+    state.add_match_condition(RunMatchCondition((ScanDelta.RIGHT, ScanDelta.UP), 1))
+    loop_class = IncrementalSwapLoop if incremental else SwapLoop
+    loop = loop_class(state, Mock(), 0, random.Random(2))
+    loop.step() # settle the initial board with a full check
+    return loop.step
+
+def swap_factory(board_type, width, height) -> type:
+    """A factory of random boards whose loop swaps random neighbours and clears runs"""
+    class SwapFactory(GameFactory):
+        @staticmethod
+        def create_game():
+            state = GameState(random_board(board_type, width, height), Scoring())
+            state.add_match_condition(RunMatchCondition((ScanDelta.RIGHT, ScanDelta.UP), 1))
+            return Game(state, lambda *args: IncrementalSwapLoop(*args, random.Random(2)), None, 0)
+    return SwapFactory
+
+@timed('env.step', board_params(((10, 20), (50, 50), (100, 100))))
+def env_step(board_type, width, height):
+    """One environment step with no agent action: a loop step plus the observation"""
+    env = GameEnv(swap_factory(board_type, width, height), lambda state, action: None)
+    env.reset(seed=0)
+    return lambda: env.step(None)
+
+@timed('replay.seek', board_params(((10, 20), (50, 50), (100, 100))))
+def replay_seek(board_type, width, height):
+    """Seeks 25 ticks past a keyframe of a recorded game and back to its start"""
+    class RecordedSwapFactory(GameFactory):
+        @staticmethod
+        def create_game():
+            state = GameState(random_board(board_type, width, height), Scoring())
+            state.add_match_condition(RunMatchCondition((ScanDelta.RIGHT, ScanDelta.UP), 1))
+            return Game(state, lambda *args: IncrementalSwapLoop(*args, random), None, 0)
+    path = os.path.join(tempfile.mkdtemp(), 'game.tmir')
+    game = record_game(RecordedSwapFactory, path, seed=0, keyframe_interval=50)
+    loop = HeadlessEngine([game]).loops[0]
+    for _ in range(200):
+        loop.step()
+    game.recorder.close()
+    replayer = Replayer(RecordedSwapFactory, path)
+    def seek_and_rewind():
+        replayer.seek(175)
+        replayer.seek(0)
+    return seek_and_rewind
+
+@timed('view.position_at', board_params(sorted(SIZES + ((300, 300),)), (ArrayGameBoard,)))
+def position_at(board_type, width, height):
+    """Hit tests random clicks on a board view, without needing a display"""
+    side = BoardView.tile_side_length
+    view = SimpleNamespace(
+            watching=board_type(width, height),
+            tile_side_length=side,
+            board_height=side * height
+            )
+    rng = random.Random(3)
+    clicks = itertools.cycle([
+        (rng.randrange(width * side), rng.randrange(height * side)) for _ in range(1024)
+        ])
+    return lambda: BoardView.position_at(view, *next(clicks))
+
+@timed('view.raster_row', board_params(sorted(SIZES + ((300, 300),)), (ArrayGameBoard,)))
+def raster_row(board_type, width, height):
+    """Builds the image data redrawing one full row of a raster board view"""
+    board = random_board(board_type, width, height)
+    painter = CellPainter(BoardView.tile_side_length)
+    row = [board.tile_at(x, 1) for x in range(1, width + 1)]
+    return lambda: painter.data_for(row)
@@ -0,0 +1,41 @@
+"""
+    :module_name: imports
+    :module_summary: cold start benchmarks, importing the package in a fresh interpreter
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from .harness import measured
+
+STATEMENTS = {
+        'tilematch_tools': 'import tilematch_tools',
+        'core': 'import tilematch_tools.core',
+        'model': 'import tilematch_tools.model',
+        'view': 'from tilematch_tools.view import GameView',
+        }
+
+def cold_start(statement: str, repeat: int = 5) -> float:
+    """
+        Best wall time of running statement in a fresh interpreter, less the time
+        the interpreter takes to start and exit with nothing to do
+        :arg statement: python source to run
+        :arg repeat: number of runs to take the best of
+        :returns: milliseconds
+        :rtype: float
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    def best_of(source):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            subprocess.run([sys.executable, '-c', source], env=env, check=True)
+            times.append(time.perf_counter_ns() - start)
+        return min(times)
+    return (best_of(statement) - best_of('pass')) / 1e6
+
+for name, statement in STATEMENTS.items():
+    measured(f'import.{name}', 'ms')(lambda statement=statement: cold_start(statement))
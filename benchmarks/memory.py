@@ -0,0 +1,39 @@
+"""
+    :module_name: memory
+    :module_summary: benchmarks of how many bytes a board needs per cell
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import tracemalloc
+
+from .harness import measured, board_params
+from .hot_paths import random_board
+
+SIZES = ((10, 20), (100, 100), (200, 200))
+
+def bytes_per_cell(build: callable, cells: int) -> float:
+    """
+        Bytes traced by tracemalloc while building something and keeping it alive
+        :arg build: zero argument callable creating the object to measure
+        :arg cells: number of cells to divide the total by
+        :returns: bytes per cell
+        :rtype: float
+    """
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        kept = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (current - start) / cells
+
+@measured('memory.empty_board', 'bytes/cell', board_params(SIZES))
+def empty_board(board_type, width, height):
+    return bytes_per_cell(lambda: board_type(width, height), width * height)
+
+@measured('memory.full_board', 'bytes/cell', board_params(SIZES))
+def full_board(board_type, width, height):
+    """Every cell holds its own randomly colored tile"""
+    return bytes_per_cell(lambda: random_board(board_type, width, height), width * height)
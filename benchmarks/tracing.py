@@ -0,0 +1,67 @@
+"""
+    :module_name: tracing
+    :module_summary: benchmarks of hot paths with hot path logging switched on and off
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    The switch is read once at import time, so each measurement runs in a fresh
+    interpreter with the `hotpathlog` environment variable set accordingly.
+    Both runs use the default `release` log configuration.
+"""
+
+import os
+import subprocess
+import sys
+
+from .harness import measured
+
+SCENARIOS = {
+        'tile_eq': """
+from tilematch_tools.model import Tile, TileColor
+first = Tile(**{'position': (1, 1), 'color': TileColor.RED})
+second = Tile(**{'position': (2, 1), 'color': TileColor.RED})
+operation = lambda: first == second
+""",
+        'iterate': """
+from tilematch_tools.model import GameBoard
+from benchmarks.hot_paths import random_board
+board = random_board(GameBoard, 100, 100)
+def operation():
+    for tile in board:
+        tile.position.x
+""",
+        'place_tile': """
+from tilematch_tools.model import GameBoard, Tile
+board = GameBoard(10, 20)
+tile = Tile(**{'position': (5, 5)})
+def operation():
+    board.place_tile(tile)
+    board.clear_tile(5, 5)
+""",
+        }
+
+RUNNER = """
+{scenario}
+from benchmarks.harness import time_per_call
+print(time_per_call(operation))
+"""
+
+def time_in_subprocess(scenario: str, hotpathlog: str) -> float:
+    """
+        Time a scenario in a fresh interpreter
+        :arg scenario: source defining a zero argument callable named operation
+        :arg hotpathlog: value of the hot path logging switch, 'on' or 'off'
+        :returns: nanoseconds per call
+        :rtype: float
+    """
+    env = dict(os.environ, logconf='release', hotpathlog=hotpathlog)
+    env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+    out = subprocess.run(
+            [sys.executable, '-c', RUNNER.format(scenario=scenario)],
+            env=env, capture_output=True, text=True, check=True
+            )
+    return float(out.stdout.strip().splitlines()[-1])
+
+for name, scenario in SCENARIOS.items():
+    measured(f'tracing.{name}', 'ns/op', [{'hotpathlog': value} for value in ('on', 'off')])(
+            lambda scenario=scenario, **params: time_in_subprocess(scenario, **params)
+            )
@@ -6,10 +6,25 @@
 
 import logging
 import os
+from pathlib import Path
 
-from dotenv import load_dotenv
+def _find_dotenv() -> Path or None:
+    """
+        Look for a .env file in this package's directory and each of its parents
+        :returns: the closest .env file, None if there is none
+        :rtype: Path or None
+    """
+    here = Path(__file__).resolve().parent
+    for directory in (here, *here.parents):
+        candidate = directory / '.env'
+        if candidate.is_file():
+            return candidate
+    return None
 
-load_dotenv()
+_DOTENV = _find_dotenv()
+if _DOTENV is not None: # python-dotenv is only needed when there is something to load
+    from dotenv import load_dotenv
+    load_dotenv(_DOTENV)
 
 LOGGER = logging.getLogger(__name__)
 LOG_HANDLER = logging.StreamHandler()
@@ -28,6 +43,27 @@ LOGGER.addHandler(LOG_HANDLER)
 
 __version__ = (0, 0, 1)
 
-from .core import *
-from .model import *
-from .view import *
+from . import core, model, view
+
+_LAZY_EXPORTS = {name: package for package in (core, model, view) for name in package._LAZY_EXPORTS}
+__all__ = [name for package in (core, model, view) for name in package.__all__]
+globals().update(
+        (name, getattr(package, name))
+        for package in (core, model, view) for name in package.__all__
+        if name not in package._LAZY_EXPORTS
+        )
+
+def __getattr__(name: str):
+    """
+        Resolve the lazy exports of core, model and view on first use, so importing
+        this package never imports tkinter, numpy or multiprocessing by itself
+        :arg name: the attribute being looked up
+        :returns: the exported object
+        :raises: AttributeError if no subpackage exports name
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_LAZY_EXPORTS[name], name)
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
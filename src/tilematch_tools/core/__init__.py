@@ -2,11 +2,61 @@
     :module_name: core
     :module_summary: a collection of classes for creating and running tile-matching games
     :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    GameEngine drives games through a Tk window, so it is only imported on first use
+    and the rest of this package can be imported on hosts without tkinter. Batch runs,
+    environments, recording and profiling pull in multiprocessing or numpy and are
+    imported on first use too, keeping the cold start of a single game short
 """
 
+import importlib
+
 from .tile_builder import TileBuilder
 from .board_factory import BoardFactory
-from .game_state import GameState
+from .game_state import GameState, StateSnapshot
 from .game_loop import GameLoop
-from .game_engine import GameEngine
-from .game_factory import GameFactory, Game
\ No newline at end of file
+from .game_factory import GameFactory, Game
+from .headless_engine import HeadlessEngine
+from .tick_scheduler import TickScheduler
+from .render_scheduler import RenderScheduler
+from .transposition_table import TranspositionTable
+
+_LAZY_EXPORTS = {
+        'GameEngine': '.game_engine',
+        'BatchRunner': '.batch_runner',
+        'SimulationJob': '.batch_runner',
+        'SimulationResult': '.batch_runner',
+        'GameEnv': '.environment',
+        'VectorGameEnv': '.environment',
+        'InputRecorder': '.recording',
+        'Replayer': '.recording',
+        'record_game': '.recording',
+        'TickProfiler': '.profiling',
+        'DurationHistogram': '.profiling',
+        'ProfileDumper': '.profiling',
+        'NullProfiler': '.profiling',
+        'PHASES': '.profiling'
+        }
+
+__all__ = [
+        'TileBuilder', 'BoardFactory', 'GameState', 'StateSnapshot', 'GameLoop',
+        'GameFactory', 'Game', 'HeadlessEngine', 'TickScheduler', 'RenderScheduler',
+        'TranspositionTable',
+        *_LAZY_EXPORTS
+        ]
+
+def __getattr__(name: str):
+    """
+        Import Tk-, numpy- and multiprocessing-dependent exports the first time they are requested
+        :arg name: the attribute being looked up
+        :returns: the exported object
+        :raises: AttributeError if name is not exported by this package
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
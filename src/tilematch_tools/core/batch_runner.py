@@ -0,0 +1,117 @@
+"""
+    :module_name: batch_runner
+    :module_summary: classes for simulating many seeded games across a process pool
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+import os
+import random
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Type
+
+from .game_factory import GameFactory
+from .headless_engine import HeadlessEngine
+
+LOGGER = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class SimulationJob:
+    """
+        One game to simulate
+        :seed: value passed to random.seed before the game is created
+        :script: (tick, action) pairs; action(state) is called once the loop has run tick ticks.
+            Actions must be picklable, e.g. module level functions or functools.partial
+        :max_ticks: the most ticks the game is allowed to run
+    """
+    seed: int
+    script: tuple = ()
+    max_ticks: int = 10_000
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """
+        Outcome of a simulated game
+    """
+    seed: int
+    score: int
+    ticks: int
+    matches: int
+    ended: bool
+
+def simulate(factory: Type[GameFactory], job: SimulationJob) -> SimulationResult:
+    """
+        Create, set up and run one game headlessly
+        :arg factory: the factory creating the game
+        :arg job: the seed, input script and tick budget of the game
+        :arg type: GameFactory class
+        :arg type: SimulationJob
+        :returns: the game's final score, completed tick count and match count
+        :rtype: SimulationResult
+    """
+    random.seed(job.seed)
+    game = factory.create_game()
+    game.setup()
+    engine = HeadlessEngine([game])
+    loop = engine.loops[0]
+    ticks = 0
+    for tick, action in sorted(job.script, key=lambda entry: entry[0]):
+        if tick > job.max_ticks:
+            break
+        ticks += engine.run(max_ticks=tick - ticks)
+        if not engine.active:
+            break
+        action(game.state)
+    ticks += engine.run(max_ticks=job.max_ticks - ticks)
+    return SimulationResult(
+            seed=job.seed,
+            score=game.state.score.score,
+            ticks=ticks,
+            matches=loop.matches_found,
+            ended=not engine.active or game.state.gameover()
+            )
+
+class BatchRunner:
+    """
+        Simulates independent games from one factory across a pool of worker processes
+        :arg factory: the factory creating every game; must be importable by the workers
+        :arg max_workers: number of worker processes, all cores by default. 0 runs in process
+        :arg chunksize: jobs handed to a worker at a time
+    """
+
+    def __init__(self, factory: Type[GameFactory], max_workers: int = None, chunksize: int = 16):
+        self._factory = factory
+        self._max_workers = os.cpu_count() if max_workers is None else max_workers
+        self._chunksize = chunksize
+
+    def run(self, jobs: Iterable[SimulationJob]) -> Iterator[SimulationResult]:
+        """
+            Simulate every job, yielding results in job order as they become available
+            :arg jobs: the games to simulate
+            :arg type: iterable
+            :returns: a generator of results
+            :rtype: generator
+        """
+        play = partial(simulate, self._factory)
+        if self._max_workers == 0:
+            LOGGER.info('Simulating games in process')
+            yield from map(play, jobs)
+            return
+        LOGGER.info('Simulating games across %d worker processes', self._max_workers)
+        with ProcessPoolExecutor(max_workers=self._max_workers) as pool:
+            yield from pool.map(play, jobs, chunksize=self._chunksize)
+
+    def run_seeds(self, seeds: Iterable[int], max_ticks: int = 10_000) -> Iterator[SimulationResult]:
+        """
+            Simulate one unscripted game per seed
+            :arg seeds: the seeds to simulate
+            :arg max_ticks: the most ticks each game is allowed to run
+            :arg type: iterable
+            :arg type: int
+            :returns: a generator of results
+            :rtype: generator
+        """
+        return self.run(SimulationJob(seed, max_ticks=max_ticks) for seed in seeds)
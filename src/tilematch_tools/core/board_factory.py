@@ -9,6 +9,8 @@ from abc import ABC
 from collections.abc import Iterable
 
 from ..model.board.game_board import GameBoard
+from ..model.tiles import Tile
+from ..model.exceptions import IllegalBoardContentException
 
 LOGGER = logging.getLogger(__name__)
 
@@ -53,3 +55,52 @@ class BoardFactory(ABC):
             LOGGER.debug('Place the tile at (%d, %d)', tile.position.x, tile.position.y)
 
         return the_board
+
+    @staticmethod
+    def create_board_from_codes(board_type: GameBoard, tables: tuple, kinds, colors, shapes, borders) -> GameBoard:
+        """
+            Factory method that bulk loads a new board from arrays of cell codes, e.g. a
+            saved game. The codes are range checked once per array instead of validating
+            every tile, and no journal sees the cells being filled
+            :arg board_type: the board to create
+            :arg tables: the (kind, color, shape) tables the codes index. Borders use the color table
+            :arg kinds: kind codes indexed [x - 1, y - 1]; the board is as wide and tall as this array
+            :arg colors: color codes, same shape
+            :arg shapes: shape codes, same shape
+            :arg borders: border color codes, same shape
+            :arg type: GameBoard class
+            :arg type: tuple
+            :arg type: numpy.ndarray
+            :arg type: numpy.ndarray
+            :arg type: numpy.ndarray
+            :arg type: numpy.ndarray
+            :returns: the game board holding the decoded tiles
+            :rtype: GameBoard
+            :raises: IllegalBoardContentException if board_type is not a board, kinds are not tiles,
+                or the arrays do not fit each other or their tables
+        """
+        if not (isinstance(board_type, type) and issubclass(board_type, GameBoard)):
+            LOGGER.error('Attempted to load cell codes into a non-board type')
+            raise IllegalBoardContentException(f"board_type must be a GameBoard type, not {board_type!r}")
+        kind_table, color_table, shape_table = tables
+        arrays = (kinds, colors, shapes, borders)
+        if kinds.ndim != 2 or kinds.size == 0 or any(arr.shape != kinds.shape for arr in arrays):
+            LOGGER.error('Cell code arrays have mismatched shapes')
+            raise IllegalBoardContentException(
+                    f"Cell code arrays must share one non-empty 2D shape, not {[arr.shape for arr in arrays]}"
+                    )
+        for arr, table in zip(arrays, (kind_table, color_table, shape_table, color_table)):
+            if int(arr.max()) >= len(table):
+                LOGGER.error('Cell codes refer past the end of their table')
+                raise IllegalBoardContentException(
+                        f"Code {int(arr.max())} has no entry in a table of {len(table)} values"
+                        )
+        if not all(isinstance(kind, type) and issubclass(kind, Tile) for kind in kind_table):
+            LOGGER.error('Attempted to load a non-tile type onto the board')
+            raise IllegalBoardContentException(f"Every kind must be a Tile type, not {kind_table}")
+
+        width, height = kinds.shape
+        LOGGER.info('Loading %dx%d board from cell codes', width, height)
+        the_board = board_type(width, height)
+        the_board._load_codes(tables, kinds, colors, shapes, borders)
+        return the_board
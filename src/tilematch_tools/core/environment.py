@@ -0,0 +1,357 @@
+"""
+    :module_name: environment
+    :module_summary: Gym-style reinforcement learning environments over headless games
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    Environments follow the Gymnasium calling convention without depending on it:
+    reset(seed) returns (observation, info) and step(action) returns
+    (observation, reward, terminated, truncated, info). Observations are
+    TileEncoder codes of the board, indexed [x - 1, y - 1]; rewards are the change
+    in score. Games run without a view and without wall-clock gating.
+"""
+
+import logging
+import multiprocessing
+import random
+from collections.abc import Iterable
+from typing import Type
+
+import numpy as np
+
+from .exceptions import GameEndedException
+from .game_factory import GameFactory
+from ..model.board import TileEncoder
+from ..view.null_view import NullView
+
+LOGGER = logging.getLogger(__name__)
+
+class GameEnv:
+    """
+        One game from a factory as a reinforcement learning environment. Each step
+        applies the agent's action, then runs one loop iteration: the game's tick
+        followed by match clearing. Observations are kept up to date from a change
+        journal, so each step only re-encodes the cells that changed
+        :arg factory: the factory creating a new game for every episode
+        :arg act: called as act(state, action) to apply an agent's action; None actions are skipped
+        :arg encoder: assigns observation codes to tiles, a new one by default
+        :arg max_ticks: episodes are truncated after this many steps, never by default
+    """
+
+    def __init__(self, factory: Type[GameFactory], act: callable,
+                 encoder: TileEncoder = None, max_ticks: int = None):
+        self._factory = factory
+        self._act = act
+        self._encoder = encoder or TileEncoder()
+        self._max_ticks = max_ticks
+        self._loop = None
+        self._changes = None
+        self._observation = None
+        self._score = 0
+        self._done = True
+
+    def reset(self, seed: int = None) -> (np.ndarray, dict):
+        """
+            Start a new episode
+            :arg seed: value passed to random.seed before the game is created; the
+                random module is left as it is if None
+            :arg type: int or None
+            :returns: the first observation and an info dict
+            :rtype: tuple
+        """
+        if seed is not None:
+            random.seed(seed)
+        game = self._factory.create_game()
+        game.setup()
+        self._loop = game.loop(game.state, NullView(None, game.state), game.tick_speed)
+        board = game.state.board
+        self._changes = board.open_journal()
+        self._observation = self._encoder.encode(board)
+        self._score = game.state.score.score
+        self._done = game.state.gameover()
+        return self._observation.copy(), self._info()
+
+    def step(self, action) -> (np.ndarray, int, bool, bool, dict):
+        """
+            Apply an action and advance the game by one loop iteration
+            :arg action: passed to act, or None to only advance the game
+            :returns: observation, reward, terminated, truncated and an info dict
+            :rtype: tuple
+            :raises: GameEndedException if the episode is over and reset was not called
+        """
+        if self._done:
+            raise GameEndedException('The episode has ended. Call reset before stepping again')
+        state = self._loop.state
+        if action is not None:
+            self._act(state, action)
+        if not state.gameover():
+            self._loop.step()
+        self._observe()
+        score = state.score.score
+        reward, self._score = score - self._score, score
+        terminated = state.gameover()
+        truncated = not terminated and self._max_ticks is not None and self._loop.ticks >= self._max_ticks
+        self._done = terminated or truncated
+        return self._observation.copy(), reward, terminated, truncated, self._info()
+
+    def _observe(self) -> None:
+        """
+            Re-encode the cells changed since the last observation, or the whole board if most changed
+        """
+        changed = self._changes.drain()
+        if 4 * len(changed) > self._observation.size:
+            self._observation = self._encoder.encode(self._loop.state.board)
+        else:
+            self._encoder.update(self._loop.state.board, self._observation, changed)
+
+    def _info(self) -> dict:
+        return {'score': self._score, 'ticks': self._loop.ticks}
+
+    @property
+    def observation_shape(self) -> (int, int):
+        """
+            The shape of observations, known once reset has been called
+            :returns: (num_cols, num_rows)
+            :rtype: tuple
+        """
+        return self._observation.shape
+
+    @property
+    def state(self):
+        """
+            The game state of the current episode, None before the first reset
+            :returns: the game state
+            :rtype: GameState or None
+        """
+        return None if self._loop is None else self._loop.state
+
+class _Batch:
+    """
+        Arrays holding the latest step of every environment of a vector environment,
+        laid out in one buffer that worker processes write into directly
+    """
+    FIELDS = (
+            ('rewards', np.int64), ('scores', np.int64), ('ticks', np.int64),
+            ('observations', TileEncoder.DTYPE), ('terminated', np.bool_), ('truncated', np.bool_)
+            )
+
+    def __init__(self, buffer, num_envs: int, shape: (int, int)):
+        offset = 0
+        for name, dtype in self.FIELDS:
+            dims = (num_envs, *shape) if name == 'observations' else (num_envs,)
+            arr = np.ndarray(dims, dtype=dtype, buffer=buffer, offset=offset)
+            setattr(self, name, arr)
+            offset = -(-(offset + arr.nbytes) // 8) * 8
+
+    @classmethod
+    def size_of(cls, num_envs: int, shape: (int, int)) -> int:
+        size = 0
+        for name, dtype in cls.FIELDS:
+            count = num_envs * shape[0] * shape[1] if name == 'observations' else num_envs
+            size = -(-(size + count * np.dtype(dtype).itemsize) // 8) * 8
+        return size
+
+class _EnvSlice:
+    """
+        The environments start to stop of a vector environment, writing their results
+        into the batch arrays. Finished episodes are reset within the same step
+    """
+
+    def __init__(self, factory, act, encoder, max_ticks, start, stop, buffer, num_envs, shape):
+        self._envs = [GameEnv(factory, act, encoder, max_ticks) for _ in range(start, stop)]
+        self._start = start
+        self._batch = _Batch(buffer, num_envs, shape)
+
+    def reset(self, seeds: list) -> None:
+        batch = self._batch
+        for i, (env, seed) in enumerate(zip(self._envs, seeds), start=self._start):
+            batch.observations[i], info = env.reset(seed)
+            batch.rewards[i] = 0
+            batch.terminated[i] = batch.truncated[i] = False
+            batch.scores[i], batch.ticks[i] = info['score'], info['ticks']
+
+    def step(self, actions: list) -> None:
+        batch = self._batch
+        for i, (env, action) in enumerate(zip(self._envs, actions), start=self._start):
+            observation, batch.rewards[i], terminated, truncated, info = env.step(action)
+            batch.terminated[i], batch.truncated[i] = terminated, truncated
+            batch.scores[i], batch.ticks[i] = info['score'], info['ticks']
+            if terminated or truncated:
+                observation, _ = env.reset()
+            batch.observations[i] = observation
+
+def _serve(connection, slice_args: tuple) -> None:
+    """
+        Worker process main loop: run commands for one slice of environments until closed
+    """
+    envs = _EnvSlice(*slice_args)
+    while True:
+        command, payload = connection.recv()
+        if command == 'close':
+            break
+        try:
+            getattr(envs, command)(payload)
+        except Exception as err: # handed to the parent, which raises it
+            LOGGER.exception('Environment worker failed to %s', command)
+            connection.send(err)
+            continue
+        connection.send(None)
+    connection.close()
+
+class VectorGameEnv:
+    """
+        num_envs games from one factory stepped in lockstep, either in this process or
+        split across worker processes. Results are written into shared batch arrays,
+        so stepping returns numpy arrays of shape (num_envs, ...) without pickling
+        observations. An episode that terminates or is truncated is reset within the
+        same step, and its slot then holds the new episode's first observation.
+        Games drawing from the random module share it with the other environments
+        of the same process, so episodes are only reproducible per seed with one
+        environment per worker. Workers get a frozen copy of encoder, so a code means
+        the same tile in every slot. Every tile a game can show must therefore be
+        declared up front, through tile_keys or keys already registered with encoder;
+        the tiles of a freshly set up game are added to them. A tile that first shows
+        up mid-episode without being declared makes stepping raise
+        UnregisteredTileKeyException. Environments stepped in this process register
+        new tiles as they appear and need no declaration
+        :arg factory: the factory creating every game; must be importable by the workers
+        :arg act: called as act(state, action); must be picklable for worker processes
+        :arg num_envs: number of environments
+        :arg max_workers: number of worker processes; 0 steps every environment in this process
+        :arg encoder: assigns observation codes to tiles, e.g. TileEncoder(keys)
+        :arg max_ticks: episodes are truncated after this many steps, never by default
+        :arg tile_keys: (tile type, color, shape) of every tile the games can show
+        :raises: ValueError if worker processes are asked for without any declared tile keys
+    """
+
+    def __init__(self, factory: Type[GameFactory], act: callable, num_envs: int, max_workers: int = 0,
+                 encoder: TileEncoder = None, max_ticks: int = None, tile_keys: Iterable = ()):
+        self._num_envs = num_envs
+        encoder = encoder or TileEncoder()
+        for key in tile_keys:
+            encoder.code_for_key(*key)
+        workers = min(max_workers, num_envs)
+        if workers > 0 and not encoder.keys:
+            raise ValueError(
+                    'Worker processes cannot register tiles that show up mid-episode; '
+                    'declare every tile key with tile_keys or the encoder'
+                    )
+        rng_state = random.getstate() # building the probe game must not advance the caller's seed
+        try:
+            probe = factory.create_game()
+            probe.setup()
+        finally:
+            random.setstate(rng_state)
+        board = probe.state.board
+        encoder.encode(board)
+        self._shape = (board.num_cols, board.num_rows)
+        bounds = [num_envs * w // max(workers, 1) for w in range(max(workers, 1) + 1)]
+        size = _Batch.size_of(num_envs, self._shape)
+        self._connections = []
+        self._processes = []
+        if workers == 0:
+            buffer = bytearray(size)
+            self._local = _EnvSlice(factory, act, encoder, max_ticks, 0, num_envs, buffer, num_envs, self._shape)
+        else:
+            LOGGER.info('Stepping %d environments across %d worker processes', num_envs, workers)
+            context = multiprocessing.get_context()
+            buffer = context.RawArray('b', size)
+            encoder = encoder.frozen()
+            self._local = None
+            for start, stop in zip(bounds, bounds[1:]):
+                parent, child = context.Pipe()
+                process = context.Process(
+                        target=_serve,
+                        args=(child, (factory, act, encoder, max_ticks, start, stop, buffer, num_envs, self._shape)),
+                        daemon=True
+                        )
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+        self._bounds = bounds
+        self._batch = _Batch(buffer, num_envs, self._shape)
+
+    def reset(self, seed: int or Iterable = None) -> (np.ndarray, dict):
+        """
+            Start a new episode in every environment
+            :arg seed: one seed per environment, or a base seed that environment i adds i to.
+                A base seed is drawn from the random module if None
+            :arg type: int, iterable or None
+            :returns: observations of shape (num_envs, num_cols, num_rows) and an info dict of arrays
+            :rtype: tuple
+        """
+        if seed is None:
+            seed = random.randrange(1 << 31)
+        seeds = [seed + i for i in range(self._num_envs)] if isinstance(seed, int) else list(seed)
+        if len(seeds) != self._num_envs:
+            raise ValueError(f"Expected {self._num_envs} seeds, got {len(seeds)}")
+        self._dispatch('reset', seeds)
+        return self._batch.observations.copy(), self._infos()
+
+    def step(self, actions: Iterable) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict):
+        """
+            Apply one action per environment and advance every game by one loop iteration
+            :arg actions: one action per environment, None to only advance that game
+            :arg type: iterable
+            :returns: observations, rewards, terminated and truncated flags, and an info
+                dict of arrays, each with one entry per environment
+            :rtype: tuple
+        """
+        actions = list(actions)
+        if len(actions) != self._num_envs:
+            raise ValueError(f"Expected {self._num_envs} actions, got {len(actions)}")
+        self._dispatch('step', actions)
+        batch = self._batch
+        return (
+                batch.observations.copy(), batch.rewards.copy(),
+                batch.terminated.copy(), batch.truncated.copy(), self._infos()
+                )
+
+    def close(self) -> None:
+        """
+            Stop the worker processes. The environment cannot be stepped afterwards
+            :returns: nothing
+            :rtype: None
+        """
+        for connection in self._connections:
+            connection.send(('close', None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections, self._processes = [], []
+
+    def _dispatch(self, command: str, payload: list) -> None:
+        """
+            Run a command on every slice of environments, in parallel across workers
+        """
+        if self._local is not None:
+            getattr(self._local, command)(payload)
+            return
+        for connection, start, stop in zip(self._connections, self._bounds, self._bounds[1:]):
+            connection.send((command, payload[start:stop]))
+        errors = [connection.recv() for connection in self._connections]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def _infos(self) -> dict:
+        return {'score': self._batch.scores.copy(), 'ticks': self._batch.ticks.copy()}
+
+    @property
+    def num_envs(self) -> int:
+        return self._num_envs
+
+    @property
+    def observation_shape(self) -> (int, int):
+        """
+            The shape of one environment's observations
+            :returns: (num_cols, num_rows)
+            :rtype: tuple
+        """
+        return self._shape
+
+    def __enter__(self) -> 'VectorGameEnv':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
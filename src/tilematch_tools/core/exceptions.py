@@ -13,3 +13,13 @@ class GameEndedException(BaseTileMatchCoreException):
     """
         Raised when a game loop is executed with a gamestate that has ended
     """
+
+class InvalidSaveDataException(BaseTileMatchCoreException):
+    """
+        Raised when saved game data is truncated, corrupt or of an unsupported version
+    """
+
+class InvalidRecordingException(BaseTileMatchCoreException):
+    """
+        Raised when an input recording is corrupt or of an unsupported version
+    """
@@ -3,12 +3,16 @@
 
 from abc import ABC
 from dataclasses import dataclass
+from functools import partial
 from collections.abc import Iterable
 import logging
 import tkinter as tk
 
 from .exceptions import GameEndedException
 from .game_factory import Game
+from .tick_scheduler import TickScheduler
+from .profiling import ProfileDumper
+from .render_scheduler import RenderScheduler
 
 
 LOGGER=logging.getLogger(__name__)
@@ -16,12 +20,24 @@ LOGGER=logging.getLogger(__name__)
 
 
 class GameEngine(ABC):
-    REFRESH_LATENCY = 100
+    """
+        Runs games in a Tk window. Each game ticks on its own tick_speed and the engine
+        sleeps until the next game is due. A late game catches up by at most MAX_CATCH_UP
+        ticks, skipping the rest. Rendering is decoupled from ticking: a game's view is
+        marked dirty only when a tick or an input handler left it something new to draw,
+        and dirty views are redrawn together in idle-time passes, at most MAX_FPS per second
+    """
+    MAX_FPS = 30
+    MAX_CATCH_UP = 1
 
     def __init__(self, games: Iterable[Game]):
         self._root = tk.Tk()
         self._games = games
         self._active = []
+        self._scheduler = TickScheduler(max_catch_up=self.MAX_CATCH_UP)
+        self._renderer = RenderScheduler(self._root, max_fps=self.MAX_FPS)
+        self._profiling = False
+        self._dumper = None
 
 
     def run(self) -> None:
@@ -30,28 +46,79 @@ class GameEngine(ABC):
         """
         for slot, game in enumerate(self._games):
             loop = game.loop(game.state, game.view(self._root, game.state), game.tick_speed)
+            if getattr(game, 'recorder', None) is not None:
+                game.recorder.attach(loop)
+            loop.view.on_delivered = partial(self._renderer.mark_if_changed, loop)
             self._active.append(loop)
+            self._scheduler.schedule(loop, game.tick_speed)
+            if self._profiling:
+                loop.enable_profiling()
             loop.view.grid(row=0, column=slot)
-        self._root.after(self.REFRESH_LATENCY, self.update_games)
+        self.update_views()
+        self._wake_when_due()
         self._root.mainloop()
 
 
 
     def update_games(self) -> None:
         """
-            Update all the games
+            Tick the games that are due and mark the views they changed as dirty
         """
 
-        for game in self._active:
+        for game, runs in self._scheduler.pop_due():
+            if game is self._dumper:
+                self._dumper.dump()
+                continue
             try:
-                game()
-                game.view.update()
+                for _ in range(runs):
+                    game.step()
             except GameEndedException as err:
                 LOGGER.error('%s', str(err))
-                game.view.update()
+                self._scheduler.cancel(game)
+                self._renderer.mark_dirty(game)
+            else:
+                self._renderer.mark_if_changed(game)
+
+        self._wake_when_due()
 
+    def update_views(self) -> None:
+        """
+            Mark every game's view dirty, redrawing all of them in the next render pass
+        """
+        for game in self._active:
+            self._renderer.mark_dirty(game)
 
-        self._root.after(self.REFRESH_LATENCY, self.update_games)
+    def enable_profiling(self, dump_path: str = None, dump_interval: int = 5_000) -> None:
+        """
+            Record per-phase tick durations of every game
+            :arg dump_path: file the profiles are appended to as JSON lines, if any
+            :arg dump_interval: milliseconds between dumps
+            :arg type: str or None
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        self._profiling = True
+        for game in self._active:
+            game.enable_profiling()
+        if dump_path:
+            self._dumper = ProfileDumper(dump_path, self._active)
+            self._scheduler.schedule(self._dumper, dump_interval * 1_000_000)
 
+    def profiles(self) -> [dict]:
+        """
+            Snapshot of the profile of every game, in slot order
+            :returns: list of profiles, None for games not being profiled
+            :rtype: list
+        """
+        return [game.profiler.snapshot() if game.profiler else None for game in self._active]
 
+    @property
+    def renderer(self) -> RenderScheduler:
+        return self._renderer
 
+    def _wake_when_due(self) -> None:
+        delay = self._scheduler.time_until_due()
+        if delay is None:
+            return
+        self._root.after(-(-delay // 1_000_000), self.update_games)
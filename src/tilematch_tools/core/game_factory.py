@@ -1,19 +1,22 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Type
+from typing import Type, TYPE_CHECKING
 
 from .game_state import GameState
 from .game_loop import GameLoop
-from ..view import GameView
+
+if TYPE_CHECKING:
+    from ..view import GameView
 
 LOGGER = logging.getLogger(__name__)
 
 class Game(ABC):
-    def __init__(self, state: GameState, loop_class: Type[GameLoop], view_class: Type[GameView], tick_speed: int):
+    def __init__(self, state: GameState, loop_class: Type[GameLoop], view_class: Type['GameView'], tick_speed: int):
         self.state = state
         self.loop = loop_class
         self.view = view_class
         self.tick_speed = tick_speed
+        self.recorder = None # an InputRecorder the engine attaches to the game's loop and view
 
     @staticmethod
     def setup():
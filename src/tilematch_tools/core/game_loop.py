@@ -8,35 +8,113 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from enum import IntEnum
+from typing import TYPE_CHECKING
 
 from .game_state import GameState
 from .exceptions import GameEndedException
-from ..view import GameView
+from .profiling import TickProfiler, NullProfiler
 from ..model.match import MatchCondition
 
+if TYPE_CHECKING:
+    from ..view import GameView
+
 LOGGER = logging.getLogger(__name__)
 
+_UNPROFILED = NullProfiler()
+
 
 class GameLoop(ABC):
-    """A class that template a game loop"""
+    """A class that template a game loop
+        :INCREMENTAL_MATCHING: when true, match checks after the first only look at
+            positions changed since the previous check (see touched)
+    """
+    INCREMENTAL_MATCHING = False
 
-    def __init__(self, state: GameState, view: GameView, delay: int = 1_000_000_000):
+    def __init__(self, state: GameState, view: 'GameView', delay: int = 1_000_000_000):
         self._state = state
         self._view = view
         self._loop_delay = delay
         self._last_call = time.time_ns()
+        self._changes = state.board.open_journal() if self.INCREMENTAL_MATCHING else None
+        self._touched = None
+        self._full_check_pending = True
+        self._ticks = 0
+        self._matches_found = 0
+        self._profiler = None
+        self._recorder = None
 
     def __call__(self):
         """Go thru one iteration of the game loop"""
+        self._ensure_running()
+        if self.can_advance():
+            self._process_input()
+            self._advance()
+
+    def step(self) -> None:
+        """Go thru one iteration of the game loop without the wall-clock gate of can_advance"""
+        self._ensure_running()
+        self._process_input()
+        self._advance()
+
+    def _process_input(self) -> None:
+        """Handle the input the view queued since the last tick, if it queues input"""
+        process_input = getattr(self._view, 'process_input', None)
+        if process_input is not None:
+            process_input()
+
+    def _ensure_running(self) -> None:
         if self.state.gameover():
             raise GameEndedException(
                     'The game has already ended. No further loop iterations are allowed'
                     )
-        if self.can_advance():
-            self.tick()
-            while matches := self.find_matches(self._state.match_rules):
-                self.clear_matches(matches)
-                self.clean_up_state()
+
+    def _advance(self) -> None:
+        if self._recorder is not None:
+            self._recorder.before_tick(self._ticks)
+        self._ticks += 1
+        profiler = self._profiler or _UNPROFILED
+        profiler.timed('tick', self.tick)
+        self._touch()
+        cascades = 0
+        while matches := profiler.timed('find_matches', self.find_matches, self._state.match_rules):
+            cascades += 1
+            self._matches_found += len(matches)
+            profiler.timed('clear_matches', self.clear_matches, matches)
+            profiler.timed('clean_up_state', self.clean_up_state)
+            self._touch()
+        profiler.record_cascades(cascades)
+
+    def update_view(self) -> None:
+        """Redraw this loop's view, timing it when profiling"""
+        (self._profiler or _UNPROFILED).timed('view_update', self._view.update)
+
+    def needs_view_update(self) -> bool:
+        """
+            Whether this loop's view has anything new to draw.
+            Views without a needs_update method are assumed to always have
+            :returns: true if the view should be redrawn, false otherwise
+            :rtype: bool
+        """
+        needs_update = getattr(self._view, 'needs_update', None)
+        return True if needs_update is None else bool(needs_update())
+
+    def enable_profiling(self) -> TickProfiler:
+        """
+            Start recording per-phase durations of this loop
+            :returns: the profiler recording this loop
+            :rtype: TickProfiler
+        """
+        if self._profiler is None:
+            self._profiler = TickProfiler()
+        return self._profiler
+
+    def disable_profiling(self) -> None:
+        """
+            Stop recording per-phase durations and drop what was recorded
+            :returns: nothing
+            :rtype: None
+        """
+        self._profiler = None
 
     @abstractmethod
     def tick(self) -> None:
@@ -46,15 +124,16 @@ class GameLoop(ABC):
         """
         pass
     
-    @abstractmethod
     def find_matches(self, match_rules: [MatchCondition]) -> [MatchCondition.MatchFound]:
-        """Look for matches that satisfy the given match conditions
+        """Look for matches that satisfy the given match conditions. Overriding this is
+            optional: the default searches only through the touched positions, for
+            conditions whose find_all supports it
             :arg match_rules: list of match conditions to look for
             :arg type: list
             :returns: list of matches found
             :rtype: list
         """
-        return []
+        return self._state.find_matches(match_rules, self.touched)
 
     @abstractmethod
     def clear_matches(self, matches_found: [MatchCondition.MatchFound]) -> None:
@@ -91,6 +170,78 @@ class GameLoop(ABC):
         self._last_call = time.time_ns()
         return True
 
+    def _touch(self) -> None:
+        """
+            Collect the positions changed since the previous match check
+            The first check always covers the whole board
+            :returns: nothing
+            :rtype: None
+        """
+        if self._changes is None:
+            return
+        changed = self._changes.drain()
+        self._touched = None if self._full_check_pending else changed
+        self._full_check_pending = False
+
+    @property
+    def touched(self) -> set or None:
+        """
+            Positions changed since the previous match check, or None when the whole board
+            should be checked (incremental matching disabled or first check)
+            :returns: set of (x, y) positions or None
+            :rtype: set or None
+        """
+        return self._touched
+
+    @property
+    def delay(self) -> int:
+        """
+            Nanoseconds this loop waits between iterations
+            :returns: loop delay
+            :rtype: int
+        """
+        return self._loop_delay
+
+    @property
+    def ticks(self) -> int:
+        """
+            Number of iterations this loop has advanced through
+            :returns: tick count
+            :rtype: int
+        """
+        return self._ticks
+
+    @property
+    def matches_found(self) -> int:
+        """
+            Number of matches this loop has found and cleared
+            :returns: match count
+            :rtype: int
+        """
+        return self._matches_found
+
+    @property
+    def profiler(self) -> TickProfiler or None:
+        """
+            The profiler recording this loop, None when profiling is disabled
+            :returns: the profiler
+            :rtype: TickProfiler or None
+        """
+        return self._profiler
+
+    @property
+    def recorder(self):
+        """
+            The input recorder or replayer told about every tick before it runs, if any
+            :returns: the recorder
+            :rtype: InputRecorder or None
+        """
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder) -> None:
+        self._recorder = recorder
+
     @property
     def state(self) -> GameState:
         """
@@ -101,7 +252,7 @@ class GameLoop(ABC):
         return self._state
 
     @property
-    def view(self) -> GameView:
+    def view(self) -> 'GameView':
         """
             Return a reference to current game view
             :returns: game view
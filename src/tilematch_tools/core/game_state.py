@@ -4,15 +4,29 @@
     :module_author: Nathan Mendoza (nathancm@uci.edu), Matthew Isayan
 """
 
+import copy
 import logging
+from dataclasses import dataclass
+from types import MappingProxyType
 
-from .tile_builder import TileBuilder
 from ..model import GameBoard, Scoring, MatchCondition, MovementRule
+from ..model.board import BoardSnapshot
 from ..model.tiles import Tile, NullTile
 from ..model.exceptions import IllegalTileMovementException, InvalidBoardPositionError
+from ..tracing import HOT_PATH_LOGGING
 
 LOGGER = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """
+        A game state captured by GameState.snapshot
+        :board: the board's contents
+        :score: the score's attributes
+    """
+    board: BoardSnapshot
+    score: MappingProxyType
+
 class GameState:
     """
         Class responsible for holding the gameboard and score 
@@ -55,6 +69,29 @@ class GameState:
                 )
         return match_condition.check_match(self.board, start_x, start_y)
  
+    def find_matches(self, match_conditions: [MatchCondition], positions = None) -> [MatchCondition.MatchFound]:
+        """Find every match satisfying any of the given match conditions
+
+        Args:
+            match_conditions ([MatchCondition]): the match conditions to satisfy
+            positions (set or None): only look for matches through these (x, y) positions;
+                None searches the whole board
+        Returns:
+            A list of objects describing the matches found
+        """
+        LOGGER.info(
+                'Checking for %d match conditions over %s',
+                len(match_conditions),
+                'the whole board' if positions is None else f'{len(positions)} positions'
+                )
+        if positions is not None and not positions:
+            return []
+        return [
+                match
+                for condition in match_conditions
+                for match in condition.find_all(self.board, positions)
+                ]
+
     def adjust_score(self, match: MatchCondition.MatchFound) -> None:
         """Update the score with the discovered match
 
@@ -75,43 +112,66 @@ class GameState:
             None
         """
         for tile in match.matching_tiles:
-            LOGGER.debug(
-                    'Replacing tile at (%d, %d) with null as it is part of a match',
-                    tile.position.x,
-                    tile.position.y
-                    )
-            self.board.place_tile( TileBuilder() \
-                        .add_position(tile.position.x, tile.position.y) \
-                        .add_color('#D3D3D3') \
-                        .construct(tile_type=NullTile)
-            )
+            if HOT_PATH_LOGGING:
+                LOGGER.debug(
+                        'Replacing tile at (%d, %d) with null as it is part of a match',
+                        tile.position.x,
+                        tile.position.y
+                        )
+            self.board.clear_tile(tile.position.x, tile.position.y)
 
     def swap_tiles(self, tile1: Tile, tile2: Tile) -> None:
-        """Swap two tiles
+        """Swap two tiles. A blank null tile is not moved itself; its new position is
+        cleared instead, so the board keeps sharing its own null tiles. Null tiles with
+        any other appearance are moved like any tile, keeping how they look
         Args:
             tile1 (Tile): first tile to swap
             tile2 (Tile): second tile to swap
         Returns:
             None
         """
-        self.board.place_tile(TileBuilder() \
-                            .add_position(tile1.position.x, tile1.position.y) \
-                            .add_color(tile1.color) \
-                            .construct(tile_type=NullTile))
-        self.board.place_tile(TileBuilder() \
-                            .add_position(tile2.position.x, tile2.position.y) \
-                            .add_color(tile2.color) \
-                            .construct(tile_type=NullTile))
-        temp_x = tile1.position.x
-        temp_y = tile1.position.y
-
-        tile1.position = (tile2.position.x, tile2.position.y)
-        tile2.position = (temp_x, temp_y)
-        
-        self.board.place_tile(tile1)
-        self.board.place_tile(tile2)
+        x1, y1 = tile1.position.x, tile1.position.y
+        x2, y2 = tile2.position.x, tile2.position.y
+        self.board.clear_tile(x1, y1)
+        self.board.clear_tile(x2, y2)
+
+        for tile, x, y in ((tile1, x2, y2), (tile2, x1, y1)):
+            if type(tile) == NullTile and tile.is_blank_at(tile.position.x, tile.position.y):
+                continue
+            tile.position = (x, y)
+            self.board.place_tile(tile)
     
  
+    def snapshot(self) -> StateSnapshot:
+        """Capture the board and score so they can be restored later, e.g. to undo a move
+        Returns:
+            StateSnapshot: the captured state
+        """
+        return StateSnapshot(self._board.snapshot(), MappingProxyType(dict(vars(self._score))))
+
+    def restore(self, snapshot: StateSnapshot) -> None:
+        """Put the board and score back to how they were when snapshot was taken
+
+        Args:
+            snapshot (StateSnapshot): a snapshot taken from this game state
+        Returns:
+            None
+        """
+        self._board.restore(snapshot.board)
+        vars(self._score).update(snapshot.score)
+
+    def clone(self) -> 'GameState':
+        """A copy of this game state for lookahead. The board is a copy-on-write clone,
+        the score is copied and the match conditions are shared
+        Returns:
+            GameState: the copy
+        """
+        twin = copy.copy(self)
+        twin._board = self._board.clone()
+        twin._score = copy.copy(self._score)
+        twin._match_conditions = list(self._match_conditions)
+        return twin
+
     def gameover(self) -> bool:
         """Check if the game has ended
             :returns: true if game over, false otherwise
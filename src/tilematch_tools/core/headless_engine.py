@@ -0,0 +1,131 @@
+"""
+    :module_name: headless_engine
+    :module_summary: a game engine that runs games on a virtual clock without tkinter
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+from collections.abc import Iterable
+
+from .exceptions import GameEndedException
+from .game_factory import Game
+from .game_loop import GameLoop
+from .tick_scheduler import TickScheduler
+from ..view.null_view import NullView
+
+LOGGER = logging.getLogger(__name__)
+
+class HeadlessEngine:
+    """
+        Runs games without a display, as fast as the game logic allows.
+        Time is a virtual clock in nanoseconds: each loop is stepped whenever the clock
+        reaches its next due time, one game's tick_speed after its previous step,
+        so no wall-clock time is spent waiting
+        :arg games: the games to run
+        :arg view_class: the view every game is given; draws nothing by default
+    """
+
+    def __init__(self, games: Iterable[Game], view_class: type = NullView):
+        self._games = list(games)
+        self._view_class = view_class
+        self._clock = 0
+        self._scheduler = TickScheduler(clock=lambda: self._clock)
+        self._loops = []
+        self._active = []
+        self._finished = []
+        for game in self._games:
+            loop = game.loop(game.state, view_class(None, game.state), game.tick_speed)
+            if getattr(game, 'recorder', None) is not None:
+                game.recorder.attach(loop)
+            self._loops.append(loop)
+            self._active.append(loop)
+            self._scheduler.schedule(loop, game.tick_speed)
+
+    def run(self, max_ticks: int = None, until: int = None) -> int:
+        """
+            Step the games until they all end, max_ticks loop steps have run,
+            or the virtual clock would pass until
+            :arg max_ticks: the most loop steps to run, across all games
+            :arg until: virtual time in nanoseconds to stop at
+            :arg type: int or None
+            :arg type: int or None
+            :returns: the number of loop steps completed; a step that finds its game
+                ended retires the loop and is not counted
+            :rtype: int
+        """
+        steps = 0
+        while self._active and (max_ticks is None or steps < max_ticks):
+            due = self._scheduler.next_due()
+            if until is not None and due > until:
+                self._clock = until
+                break
+            self._clock = due
+            remaining = None if max_ticks is None else max_ticks - steps
+            for loop, _ in self._scheduler.pop_due(limit=remaining):
+                steps += self.step(loop)
+        return steps
+
+    def advance(self, duration: int) -> int:
+        """
+            Run every step due within the next duration nanoseconds of virtual time
+            :arg duration: nanoseconds to advance the virtual clock by
+            :arg type: int
+            :returns: the number of loop steps completed
+            :rtype: int
+        """
+        return self.run(until=self._clock + duration)
+
+    def step(self, loop: GameLoop) -> bool:
+        """
+            Step a single loop now, retiring it if its game has ended
+            :arg loop: one of this engine's active loops
+            :arg type: GameLoop
+            :returns: true if the step completed, false if the loop was retired instead
+            :rtype: bool
+        """
+        try:
+            loop.step()
+            loop.update_view()
+        except GameEndedException as err:
+            LOGGER.info('%s', str(err))
+            self._scheduler.cancel(loop)
+            self._active.remove(loop)
+            self._finished.append(loop)
+            return False
+        return True
+
+    @property
+    def clock(self) -> int:
+        """
+            Current virtual time in nanoseconds
+            :returns: virtual time
+            :rtype: int
+        """
+        return self._clock
+
+    @property
+    def loops(self) -> [GameLoop]:
+        """
+            Every loop driven by this engine, in the order the games were given
+            :returns: list of game loops
+            :rtype: list
+        """
+        return list(self._loops)
+
+    @property
+    def active(self) -> [GameLoop]:
+        """
+            The loops whose games have not ended
+            :returns: list of game loops
+            :rtype: list
+        """
+        return list(self._active)
+
+    @property
+    def finished(self) -> [GameLoop]:
+        """
+            The loops whose games have ended, in the order they ended
+            :returns: list of game loops
+            :rtype: list
+        """
+        return list(self._finished)
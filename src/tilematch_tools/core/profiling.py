@@ -0,0 +1,216 @@
+"""
+    :module_name: profiling
+    :module_summary: fixed-size histograms recording how long each phase of a game loop takes
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import json
+import logging
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+PHASES = ('tick', 'find_matches', 'clear_matches', 'clean_up_state', 'view_update')
+
+class DurationHistogram:
+    """
+        Histogram of nanosecond durations in power-of-two buckets.
+        Bucket i counts durations d with 2**(i - 1) <= d < 2**i, so memory stays fixed
+        :arg buckets: number of buckets; longer durations land in the last one
+    """
+
+    def __init__(self, buckets: int = 48):
+        self._buckets = [0] * buckets
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    def record(self, duration: int) -> None:
+        """
+            Add one duration to the histogram
+            :arg duration: nanoseconds
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        self._buckets[min(duration.bit_length(), len(self._buckets) - 1)] += 1
+        self._count += 1
+        self._total += duration
+        self._max = max(self._max, duration)
+
+    def percentile(self, fraction: float) -> int:
+        """
+            Upper bound of the bucket holding the given fraction of recorded durations
+            :arg fraction: between 0 and 1, e.g. 0.99
+            :arg type: float
+            :returns: nanoseconds, 0 if nothing was recorded
+            :rtype: int
+        """
+        if not self._count:
+            return 0
+        wanted = fraction * self._count
+        seen = 0
+        for bucket, count in enumerate(self._buckets):
+            seen += count
+            if seen >= wanted:
+                return min(2 ** bucket, self._max)
+        return self._max
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    def as_dict(self) -> dict:
+        """
+            Summary of the histogram suitable for JSON
+            :returns: count, total, mean, max, p50, p99 and the raw buckets
+            :rtype: dict
+        """
+        return {
+                'count': self._count,
+                'total_ns': self._total,
+                'mean_ns': self.mean,
+                'max_ns': self._max,
+                'p50_ns': self.percentile(0.5),
+                'p99_ns': self.percentile(0.99),
+                'buckets': list(self._buckets)
+                }
+
+class TickProfiler:
+    """
+        Per-game record of phase durations and of how many times the cascade of
+        find_matches/clear_matches/clean_up_state repeated per tick
+        :arg max_cascades: cascade counts at or above this share the last bucket
+    """
+
+    def __init__(self, max_cascades: int = 16):
+        self._phases = {phase: DurationHistogram() for phase in PHASES}
+        self._cascades = [0] * (max_cascades + 1)
+
+    def record(self, phase: str, duration: int) -> None:
+        """
+            Record how long one phase took
+            :arg phase: one of PHASES
+            :arg duration: nanoseconds
+            :arg type: str
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        self._phases[phase].record(duration)
+
+    def timed(self, phase: str, func: callable, *args):
+        """
+            Call func, recording how long it took as one run of phase
+            :arg phase: one of PHASES
+            :arg func: the phase's work
+            :arg type: str
+            :arg type: callable
+            :returns: whatever func returns
+            :rtype: object
+        """
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            self._phases[phase].record(time.perf_counter_ns() - start)
+
+    def record_cascades(self, iterations: int) -> None:
+        """
+            Record how many cascade iterations a tick went through
+            :arg iterations: times matches were found and cleared during the tick
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        self._cascades[min(iterations, len(self._cascades) - 1)] += 1
+
+    def phase(self, phase: str) -> DurationHistogram:
+        """
+            The histogram of a single phase
+            :arg phase: one of PHASES
+            :arg type: str
+            :returns: the phase's histogram
+            :rtype: DurationHistogram
+        """
+        return self._phases[phase]
+
+    @property
+    def cascades(self) -> [int]:
+        """
+            Number of ticks per cascade iteration count
+            :returns: list indexed by iteration count
+            :rtype: list
+        """
+        return list(self._cascades)
+
+    def snapshot(self) -> dict:
+        """
+            Summary of every phase and of cascade iterations, suitable for JSON
+            :returns: the profile
+            :rtype: dict
+        """
+        return {
+                'phases': {phase: hist.as_dict() for phase, hist in self._phases.items()},
+                'cascades': self.cascades
+                }
+
+class NullProfiler:
+    """
+        Stand-in for a TickProfiler that only runs each phase, so an unprofiled game
+        loop goes through the same code path as a profiled one
+    """
+
+    def timed(self, phase: str, func: callable, *args):
+        """
+            Call func without timing it
+            :arg phase: ignored
+            :arg func: the phase's work
+            :arg type: str
+            :arg type: callable
+            :returns: whatever func returns
+            :rtype: object
+        """
+        return func(*args)
+
+    def record_cascades(self, iterations: int) -> None:
+        """
+            Ignore a tick's cascade count
+            :arg iterations: ignored
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+
+class ProfileDumper:
+    """
+        Appends the profiles of a set of game loops to a local file as JSON lines
+        :arg path: file to append to
+        :arg loops: the game loops whose profilers are dumped
+    """
+
+    def __init__(self, path: str, loops: list):
+        self._path = path
+        self._loops = loops
+
+    def dump(self) -> None:
+        """
+            Append one line holding the current profile of every profiled loop
+            :returns: nothing
+            :rtype: None
+        """
+        record = {
+                'time_ns': time.time_ns(),
+                'games': [
+                    dict(slot=slot, ticks=loop.ticks, **loop.profiler.snapshot())
+                    for slot, loop in enumerate(self._loops)
+                    if loop.profiler is not None
+                    ]
+                }
+        LOGGER.info('Dumping profile of %d games to %s', len(record['games']), self._path)
+        with open(self._path, 'a', encoding='utf-8') as out:
+            out.write(json.dumps(record) + '\n')
@@ -0,0 +1,412 @@
+"""
+    :module_name: recording
+    :module_summary: recording a game's input to a file and replaying it headlessly
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    A recorded game is created right after random.seed(seed), and the random module
+    is reseeded from (seed, tick) before every tick and from (seed, tick, n) before
+    the n-th input event of a tick. A game's randomness therefore only depends on
+    its seed and its input, whatever other games draw in between, and a replay can
+    start from any keyframe. The file is append-only, all little-endian:
+
+        header    magic b'TMIR', version (u16), seed (u64), keyframe interval (u32)
+        tick      b'T', ticks run so far (u32), nanoseconds since recording began (u64)
+        event     b'E', ticks run so far (u32), nanoseconds (u64), kind (u8), x (i32),
+                  y (i32), then the lengths (u8 each) and UTF-8 text of the key sequence
+                  or mouse button, keysym and char
+        keyframe  b'K', ticks run so far (u32), nanoseconds (u64), length (u32), then the
+                  game state saved by serialization.dumps
+"""
+
+import hashlib
+import logging
+import random
+import struct
+import time
+from dataclasses import dataclass
+from typing import Type
+
+from . import serialization
+from .exceptions import GameEndedException, InvalidRecordingException
+from .game_factory import Game, GameFactory
+from .game_loop import GameLoop
+from ..view.input_dispatch import KEY, CLICK
+from ..view.null_view import NullView
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b'TMIR'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHQI')
+TICK = struct.Struct('<cIQ')
+EVENT = struct.Struct('<cIQBiiBBB')
+KEYFRAME = struct.Struct('<cIQI')
+RESEED = struct.Struct('<QQQ')
+KINDS = (KEY, CLICK)
+
+def reseed(seed: int, tick: int, event: int = 0) -> None:
+    """
+        Reseed the random module for a tick, or for the event-th input event of a tick.
+        The seed is derived with a fixed hash, so it is the same on every interpreter
+        :arg seed: the recording's seed
+        :arg tick: ticks run so far
+        :arg event: 0 for the tick itself, n for the n-th event delivered before it
+        :arg type: int
+        :arg type: int
+        :arg type: int
+        :returns: nothing
+        :rtype: None
+    """
+    digest = hashlib.blake2b(RESEED.pack(seed, tick, event), digest_size=8).digest()
+    random.seed(int.from_bytes(digest, 'little'))
+
+@dataclass(frozen=True, slots=True)
+class RecordedEvent:
+    """
+        An input event read back from a recording. Handlers receive it in place of
+        the Tk event, so it carries the Tk event attributes handlers commonly read
+        :tick: ticks run when the event arrived
+        :time: nanoseconds since recording began
+        :kind: KEY or CLICK
+        :sequence: the key sequence or mouse button the handler was bound to
+    """
+    tick: int
+    time: int
+    kind: str
+    sequence: str
+    x: int = 0
+    y: int = 0
+    keysym: str = ''
+    char: str = ''
+
+class InputRecorder:
+    """
+        Appends a game's input events, tick boundaries and periodic keyframes to a
+        file. Attach it to a game through Game.recorder, or call attach with the loop
+        :arg path: the file to create or replace
+        :arg seed: the seed the game was created with, see record_game
+        :arg keyframe_interval: ticks between keyframes, 0 for none
+        :arg clock: callable returning the current time in nanoseconds, monotonic by default
+    """
+    KEYFRAME_INTERVAL = 1000
+
+    def __init__(self, path: str, seed: int, keyframe_interval: int = KEYFRAME_INTERVAL,
+                 clock: callable = time.monotonic_ns):
+        self._seed = seed
+        self._interval = keyframe_interval
+        self._clock = clock
+        self._start = clock()
+        self._loop = None
+        self._events = 0 # events delivered since the last tick
+        self._out = open(path, 'wb')
+        self._out.write(HEADER.pack(MAGIC, FORMAT_VERSION, seed, keyframe_interval))
+
+    def attach(self, loop: GameLoop) -> None:
+        """
+            Start recording the ticks of loop and the events delivered to its view
+            :arg loop: the loop running the recorded game
+            :arg type: GameLoop
+            :returns: nothing
+            :rtype: None
+        """
+        self._loop = loop
+        loop.recorder = self
+        loop.view.recorder = self
+
+    def before_tick(self, tick: int) -> None:
+        """
+            Called by the loop before each tick: writes a keyframe when one is due,
+            the tick boundary, and reseeds the random module for the tick
+            :arg tick: ticks run so far
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        now = self._clock() - self._start
+        if self._interval and tick % self._interval == 0:
+            data = serialization.dumps(self._loop.state)
+            self._out.write(KEYFRAME.pack(b'K', tick, now, len(data)))
+            self._out.write(data)
+            self._out.flush()
+        self._out.write(TICK.pack(b'T', tick, now))
+        self._events = 0
+        reseed(self._seed, tick)
+
+    def record(self, kind: str, sequence: str, event) -> None:
+        """
+            Called by the view before an event reaches its handler: writes the event
+            and reseeds the random module for it
+            :arg kind: KEY or CLICK
+            :arg sequence: the key sequence or mouse button the handler is bound to
+            :arg event: the Tk event
+            :arg type: str
+            :arg type: str
+            :arg type: tk.Event
+            :returns: nothing
+            :rtype: None
+        """
+        tick = self._loop.ticks
+        texts = [
+                str(text).encode('utf-8')[:255]
+                for text in (sequence, getattr(event, 'keysym', ''), getattr(event, 'char', ''))
+                ]
+        self._out.write(EVENT.pack(
+            b'E', tick, self._clock() - self._start, KINDS.index(kind),
+            _coordinate(getattr(event, 'x', 0)), _coordinate(getattr(event, 'y', 0)),
+            *map(len, texts)
+            ))
+        self._out.write(b''.join(texts))
+        self._out.flush()
+        self._events += 1
+        reseed(self._seed, tick, self._events)
+
+    def flush(self) -> None:
+        self._out.flush()
+
+    def close(self) -> None:
+        """
+            Write out everything recorded and close the file
+            :returns: nothing
+            :rtype: None
+        """
+        self._out.close()
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    def __enter__(self) -> 'InputRecorder':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def record_game(factory: Type[GameFactory], path: str, seed: int = None,
+                keyframe_interval: int = InputRecorder.KEYFRAME_INTERVAL) -> Game:
+    """
+        Create and set up a game from a fresh seed, ready to be recorded once an engine runs it
+        :arg factory: the factory creating the game
+        :arg path: the recording to create
+        :arg seed: the seed to create the game from, drawn from the random module if None
+        :arg keyframe_interval: ticks between keyframes, 0 for none
+        :returns: the game, with its recorder set
+        :rtype: Game
+    """
+    if seed is None:
+        seed = random.randrange(1 << 63)
+    LOGGER.info('Recording game input to %s with seed %d', path, seed)
+    random.seed(seed)
+    game = factory.create_game()
+    game.setup()
+    game.recorder = InputRecorder(path, seed, keyframe_interval)
+    return game
+
+class Replayer:
+    """
+        Replays a recording through a headless loop as fast as the game logic allows.
+        Snapshots are kept every keyframe_interval ticks as the replay goes, and the
+        recording's own keyframes are used to seek ahead of the replay, so seeking
+        only replays the ticks since the closest keyframe. Keyframes capture the game
+        state (board and score), not the loop's or handlers' own attributes, and
+        seeking does not rewind GameLoop.ticks; games keeping other state should
+        replay from the start
+        :arg factory: the factory the recorded game was created by
+        :arg path: the recording
+        :arg view_class: the view given to the loop; it must bind the same handlers as the recorded view
+        :arg keyframe_interval: ticks between snapshots kept while replaying, the recording's by default
+    """
+
+    def __init__(self, factory: Type[GameFactory], path: str, view_class: type = NullView,
+                 keyframe_interval: int = None):
+        with open(path, 'rb') as source:
+            self._parse(source.read())
+        if keyframe_interval is not None:
+            self._interval = keyframe_interval
+        random.seed(self._seed)
+        game = factory.create_game()
+        game.setup()
+        self._loop = game.loop(game.state, view_class(None, game.state), game.tick_speed)
+        self._loop.recorder = self
+        self._origin = game.state.snapshot()
+        self._snapshots = {}
+        self._tick = 0
+        self._pending = True # whether the events that arrived at self._tick are still to deliver
+        self._ended = False
+
+    def run(self, until: int = None) -> int:
+        """
+            Replay forward until until ticks have run and the input that followed them
+            is delivered, the recording ends, or the game ends
+            :arg until: the tick to stop at, the end of the recording by default
+            :arg type: int or None
+            :returns: ticks run so far
+            :rtype: int
+        """
+        target = self._recorded_ticks if until is None else until
+        while not self._ended:
+            if self._pending:
+                self._deliver(self._tick)
+            if self._tick >= target:
+                break
+            try:
+                self._loop.step()
+            except GameEndedException:
+                LOGGER.info('Replayed game ended after %d ticks', self._tick)
+                self._ended = True
+                break
+            self._tick += 1
+            self._pending = True
+        return self._tick
+
+    def seek(self, tick: int) -> int:
+        """
+            Jump to tick, restoring the closest keyframe before it instead of replaying
+            from the current position when that is shorter or the tick is behind it
+            :arg tick: the tick to stop at, see run
+            :arg type: int
+            :returns: ticks run so far
+            :rtype: int
+        """
+        keyframe = max(
+                (k for k in set(self._snapshots) | set(self._keyframes) if k <= tick),
+                default=None
+                )
+        if tick < self._tick or (keyframe is not None and keyframe > self._tick):
+            self._restore(keyframe)
+        return self.run(tick)
+
+    def before_tick(self, tick: int) -> None:
+        """
+            Called by the loop before each tick: keeps a snapshot when one is due and
+            reseeds the random module as the recorder did
+        """
+        if self._interval and self._tick % self._interval == 0 and self._tick not in self._snapshots:
+            self._snapshots[self._tick] = self._loop.state.snapshot()
+        reseed(self._seed, self._tick)
+
+    def _deliver(self, tick: int) -> None:
+        for n, event in enumerate(self._events.get(tick, ()), start=1):
+            reseed(self._seed, tick, n)
+            self._loop.view.deliver(event.kind, event.sequence, event)
+        self._pending = False
+
+    def _restore(self, keyframe: int or None) -> None:
+        state = self._loop.state
+        if keyframe is None:
+            LOGGER.debug('Rewinding replay to the start')
+            state.restore(self._origin)
+            self._tick, self._pending = 0, True
+        else:
+            LOGGER.debug('Restoring replay keyframe at tick %d', keyframe)
+            if keyframe not in self._snapshots:
+                saved = serialization.loads(self._keyframes[keyframe], board_type=type(state.board))
+                self._snapshots[keyframe] = saved.snapshot()
+            state.restore(self._snapshots[keyframe])
+            self._tick, self._pending = keyframe, False
+        self._ended = False
+
+    def _parse(self, data: bytes) -> None:
+        """
+            Read the header, events, tick times and keyframes of a recording. A record
+            cut short at the end, e.g. by a crash while recording, is ignored
+        """
+        if len(data) < HEADER.size:
+            raise InvalidRecordingException(f"Recording is truncated: {len(data)} bytes")
+        magic, version, self._seed, self._interval = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise InvalidRecordingException(f"Not an input recording: starts with {magic!r}")
+        if version > FORMAT_VERSION:
+            raise InvalidRecordingException(f"Recording format {version} is newer than {FORMAT_VERSION}")
+        self._events = {}
+        self._times = {}
+        self._keyframes = {}
+        position = HEADER.size
+        while position < len(data):
+            kind = data[position:position + 1]
+            try:
+                if kind == b'T':
+                    _, tick, now = TICK.unpack_from(data, position)
+                    self._times[tick] = now
+                    position += TICK.size
+                elif kind == b'E':
+                    _, tick, now, code, x, y, *lengths = EVENT.unpack_from(data, position)
+                    position += EVENT.size
+                    if position + sum(lengths) > len(data):
+                        raise struct.error('event text is cut short')
+                    texts = []
+                    for length in lengths:
+                        texts.append(data[position:position + length].decode('utf-8'))
+                        position += length
+                    self._events.setdefault(tick, []).append(RecordedEvent(tick, now, KINDS[code], texts[0], x, y, *texts[1:]))
+                elif kind == b'K':
+                    _, tick, now, length = KEYFRAME.unpack_from(data, position)
+                    position += KEYFRAME.size
+                    if position + length > len(data):
+                        raise struct.error('keyframe is cut short')
+                    self._keyframes[tick] = data[position:position + length]
+                    position += length
+                else:
+                    raise InvalidRecordingException(f"Unknown record {kind!r} at byte {position}")
+            except struct.error:
+                LOGGER.warning('Ignoring a record cut short at byte %d of the recording', position)
+                break
+        ticks = [tick + 1 for tick in self._times] + list(self._events) + list(self._keyframes)
+        self._recorded_ticks = max(ticks, default=0)
+
+    def time_at(self, tick: int) -> int or None:
+        """
+            When a tick began during recording
+            :arg tick: ticks run before it
+            :arg type: int
+            :returns: nanoseconds since recording began, None if the tick was not recorded
+            :rtype: int or None
+        """
+        return self._times.get(tick)
+
+    @property
+    def tick(self) -> int:
+        """
+            Ticks replayed so far
+            :returns: tick count
+            :rtype: int
+        """
+        return self._tick
+
+    @property
+    def recorded_ticks(self) -> int:
+        """
+            Ticks run by the recorded game
+            :returns: tick count
+            :rtype: int
+        """
+        return self._recorded_ticks
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def loop(self) -> GameLoop:
+        return self._loop
+
+    @property
+    def state(self):
+        """
+            The replayed game state
+            :returns: the game state
+            :rtype: GameState
+        """
+        return self._loop.state
+
+    @property
+    def events(self) -> [RecordedEvent]:
+        """
+            Every recorded input event, in the order it arrived
+            :returns: list of events
+            :rtype: list
+        """
+        return [event for tick in sorted(self._events) for event in self._events[tick]]
+
+def _coordinate(value) -> int:
+    """Tk reports '??' for coordinates an event does not have"""
+    return value if isinstance(value, int) else 0
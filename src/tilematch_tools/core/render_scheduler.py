@@ -0,0 +1,92 @@
+"""
+    :module_name: render_scheduler
+    :module_summary: coalesces view updates of many games into capped-rate render passes
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+class RenderScheduler:
+    """
+        Collects game loops whose views are dirty and redraws all of them in a single
+        idle-time pass, at most max_fps passes per second. Views that still have
+        something to draw after a pass (e.g. an animating score) are marked dirty again
+        :arg root: the Tk root, or anything with after and after_idle
+        :arg max_fps: the most render passes per second
+        :arg clock: callable returning the current time in nanoseconds, monotonic by default
+    """
+
+    def __init__(self, root, max_fps: int = 30, clock: callable = time.monotonic_ns):
+        self._root = root
+        self._frame_interval = 1_000_000_000 // max(max_fps, 1)
+        self._clock = clock
+        self._dirty = {} # insertion ordered set of loops
+        self._pending = False
+        self._last_frame = None
+        self._frames = 0
+
+    def mark_dirty(self, loop) -> None:
+        """
+            Ask for loop's view to be redrawn in the next render pass, requesting one if needed
+            :arg loop: the game loop whose view changed
+            :arg type: GameLoop
+            :returns: nothing
+            :rtype: None
+        """
+        self._dirty[loop] = None
+        if self._pending:
+            return
+        self._pending = True
+        wait = 0 if self._last_frame is None else self._last_frame + self._frame_interval - self._clock()
+        if wait <= 0:
+            self._root.after_idle(self.render)
+        else:
+            self._root.after(-(-wait // 1_000_000), self._root.after_idle, self.render)
+
+    def mark_if_changed(self, loop) -> None:
+        """
+            Mark loop dirty only if its view reports something new to draw
+            :arg loop: the game loop that may have changed
+            :arg type: GameLoop
+            :returns: nothing
+            :rtype: None
+        """
+        if loop not in self._dirty and loop.needs_view_update():
+            self.mark_dirty(loop)
+
+    def render(self) -> None:
+        """
+            Redraw every dirty view now. Normally called by the Tk event loop once idle
+            :returns: nothing
+            :rtype: None
+        """
+        self._pending = False
+        self._last_frame = self._clock()
+        dirty, self._dirty = self._dirty, {}
+        for loop in dirty:
+            loop.update_view()
+        self._frames += 1
+        LOGGER.debug('Rendered %d views in frame %d', len(dirty), self._frames)
+        for loop in dirty:
+            self.mark_if_changed(loop)
+
+    @property
+    def dirty(self) -> [object]:
+        """
+            The loops waiting for the next render pass
+            :returns: loops in the order they were marked
+            :rtype: list
+        """
+        return list(self._dirty)
+
+    @property
+    def frames(self) -> int:
+        """
+            Number of render passes so far
+            :returns: pass count
+            :rtype: int
+        """
+        return self._frames
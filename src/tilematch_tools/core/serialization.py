@@ -0,0 +1,260 @@
+"""
+    :module_name: serialization
+    :module_summary: a compact, versioned binary format for checkpointing game states
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    A saved game holds a board and its score, not the game's rules: match
+    conditions and other game specific state are supplied again after loading.
+    Board and tile types are saved by module and qualified name, and loading only
+    finds them in modules that are already imported.
+    Layout, all little-endian:
+
+        header  magic b'TMGS', format version (u16), flags (u16), columns (u32),
+                rows (u32), score (i64), multiplier (i64), tables length (u32)
+        tables  UTF-8 JSON: board type, kind, color and shape tables
+        cells   kind (u8), color (u16), shape (u8) and border color (u16) codes,
+                one array each, indexed [x - 1, y - 1] and 8 byte aligned
+"""
+
+import json
+import logging
+import mmap
+import struct
+import sys
+from functools import reduce
+
+import numpy as np
+
+from .board_factory import BoardFactory
+from .game_state import GameState
+from .exceptions import InvalidSaveDataException
+from ..model import GameBoard, ArrayGameBoard, Scoring
+from ..model.tiles import Tile, NullTile, TileColor, TileShape
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b'TMGS'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHIIqqI')
+CELL_DTYPES = (np.dtype('<u1'), np.dtype('<u2'), np.dtype('<u1'), np.dtype('<u2'))
+ALIGNMENT = 8
+
+def dumps(state: GameState) -> bytes:
+    """
+        Serialize the board and score of a game state
+        :arg state: the game to save
+        :arg type: GameState
+        :returns: the saved game
+        :rtype: bytes
+    """
+    encoded = _encode(state)
+    buffer = bytearray(_size_of(encoded))
+    _write(encoded, buffer, 0)
+    return bytes(buffer)
+
+def dump_into(state: GameState, buffer, offset: int = 0) -> int:
+    """
+        Serialize a game state into a writable buffer, e.g. a region of a memory map
+        shared by many checkpoints
+        :arg state: the game to save
+        :arg buffer: where to write, at least offset + the saved size long
+        :arg offset: where in buffer the save starts
+        :arg type: GameState
+        :arg type: writable buffer
+        :arg type: int
+        :returns: the number of bytes written
+        :rtype: int
+    """
+    encoded = _encode(state)
+    size = _size_of(encoded)
+    if offset + size > len(buffer):
+        raise ValueError(f"Saving needs {size} bytes at offset {offset}, the buffer holds {len(buffer)}")
+    _write(encoded, buffer, offset)
+    return size
+
+def save(state: GameState, path: str) -> int:
+    """
+        Save a game state to a file, written through a memory map
+        :arg state: the game to save
+        :arg path: the file to create or replace
+        :arg type: GameState
+        :arg type: str
+        :returns: the file size in bytes
+        :rtype: int
+    """
+    encoded = _encode(state)
+    size = _size_of(encoded)
+    with open(path, 'w+b') as out:
+        out.truncate(size)
+        with mmap.mmap(out.fileno(), size) as mapped:
+            _write(encoded, mapped, 0)
+    LOGGER.info('Saved %dx%d game to %s in %d bytes', state.board.num_cols, state.board.num_rows, path, size)
+    return size
+
+def loads(data, offset: int = 0, board_type: type = None,
+          score_type: type = Scoring, state_type: callable = GameState) -> GameState:
+    """
+        Deserialize a game state. Array boards use writable cell data in place,
+        so loading from a copy-on-write memory map copies nothing up front
+        :arg data: saved game data, e.g. bytes, a memory map or a numpy array of bytes
+        :arg offset: where in data the save starts
+        :arg board_type: the board to load into, the saved board's type by default
+        :arg score_type: the Scoring type to create
+        :arg state_type: called with the board and score to build the game state
+        :returns: the restored game, without match conditions
+        :rtype: GameState
+        :raises: InvalidSaveDataException if data is not a save this version can read
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)[offset:]
+    if raw.size < HEADER.size:
+        raise InvalidSaveDataException(f"Saved game is truncated: {raw.size} bytes")
+    magic, version, _, width, height, points, multiplier, tables_length = HEADER.unpack(raw[:HEADER.size].tobytes())
+    if magic != MAGIC:
+        raise InvalidSaveDataException(f"Not a saved game: starts with {magic!r}")
+    if version > FORMAT_VERSION:
+        raise InvalidSaveDataException(f"Saved game format {version} is newer than {FORMAT_VERSION}")
+
+    position = HEADER.size + tables_length
+    try:
+        tables = json.loads(raw[HEADER.size:position].tobytes().decode('utf-8'))
+        saved_board_type = _resolve(tables['board'], GameBoard)
+        kind_table = [_resolve(name, Tile) for name in tables['kinds']]
+        color_table = [_color(value) for value in tables['colors']]
+        shape_table = [_shape(value) for value in tables['shapes']]
+    except (ValueError, KeyError, TypeError) as err:
+        raise InvalidSaveDataException(f"Saved game tables are corrupt: {err}") from err
+
+    cells = []
+    for dtype in CELL_DTYPES:
+        position = _aligned(position)
+        end = position + width * height * dtype.itemsize
+        if end > raw.size:
+            raise InvalidSaveDataException(f"Saved game is truncated: needs {end} bytes, has {raw.size}")
+        cells.append(raw[position:end].view(dtype).reshape(width, height))
+        position = end
+
+    board = BoardFactory.create_board_from_codes(
+            board_type or saved_board_type, (kind_table, color_table, shape_table), *cells
+            )
+    score = score_type()
+    vars(score).update(_points=points, _multiplier=multiplier)
+    return state_type(board, score)
+
+def load(path: str, board_type: type = None,
+         score_type: type = Scoring, state_type: callable = GameState) -> GameState:
+    """
+        Load a game state saved to a file, reading it through a copy-on-write memory map.
+        Array boards keep using the mapped cells, so pages are only read as they are
+        touched and changes never reach the file
+        :arg path: the saved game
+        :arg board_type: the board to load into, the saved board's type by default
+        :arg score_type: the Scoring type to create
+        :arg state_type: called with the board and score to build the game state
+        :returns: the restored game, without match conditions
+        :rtype: GameState
+        :raises: InvalidSaveDataException if the file is not a save this version can read
+    """
+    LOGGER.info('Loading saved game from %s', path)
+    return loads(np.memmap(path, dtype=np.uint8, mode='c'), 0, board_type, score_type, state_type)
+
+def _encode(state: GameState) -> tuple:
+    """
+        The header fields, tables and cell arrays of a game state
+    """
+    board, score = state.board, state.score
+    tables, cells = _codes_of(board)
+    kind_table, color_table, shape_table = tables
+    names = json.dumps({
+        'board': _name_of(type(board)),
+        'kinds': [_name_of(kind) for kind in kind_table],
+        'colors': [str(color) for color in color_table],
+        'shapes': [int(shape) if isinstance(shape, int) else str(shape) for shape in shape_table]
+        }, separators=(',', ':')).encode('utf-8')
+    header = HEADER.pack(
+            MAGIC, FORMAT_VERSION, 0, board.num_cols, board.num_rows,
+            score.score, score.multiplier, len(names)
+            )
+    cells = [np.ascontiguousarray(arr, dtype=dtype) for arr, dtype in zip(cells, CELL_DTYPES)]
+    return header, names, cells
+
+def _codes_of(board: GameBoard) -> (tuple, list):
+    """
+        The code tables and cell code arrays of any board. Array boards already hold them
+    """
+    if isinstance(board, ArrayGameBoard):
+        return (
+                (board.kind_table, board.color_table, board.shape_table),
+                [board.kinds, board.colors, board.shapes, board.borders]
+                )
+    tables = ([NullTile], [NullTile.EMPTY_COLOR, TileColor.GRAY], [TileShape.SQUARE])
+    indexes = tuple({value: code for code, value in enumerate(table)} for table in tables)
+    kinds, colors, shapes = indexes
+    by_look = {}
+    codes = []
+    for tile in board:
+        look = (type(tile), tile.color, tile.shape, tile.border)
+        cell = by_look.get(look)
+        if cell is None:
+            cell = by_look[look] = tuple(
+                    index.setdefault(value, len(index))
+                    for index, value in zip((kinds, colors, shapes, colors), look)
+                    )
+        codes.append(cell)
+    tables = tuple(list(index) for index in indexes) # dicts keep codes in insertion order
+    cells = np.array(codes, dtype=np.uint16).reshape(board.num_cols, board.num_rows, 4)
+    return tables, [cells[:, :, i] for i in range(4)]
+
+def _size_of(encoded: tuple) -> int:
+    header, names, cells = encoded
+    size = len(header) + len(names)
+    for arr in cells:
+        size = _aligned(size) + arr.nbytes
+    return size
+
+def _write(encoded: tuple, buffer, offset: int) -> None:
+    header, names, cells = encoded
+    out = np.frombuffer(buffer, dtype=np.uint8)[offset:]
+    position = len(header) + len(names)
+    out[:position] = np.frombuffer(header + names, dtype=np.uint8)
+    for arr in cells:
+        start = _aligned(position)
+        out[position:start] = 0
+        position = start + arr.nbytes
+        out[start:position] = arr.reshape(-1).view(np.uint8)
+
+def _aligned(position: int) -> int:
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+def _name_of(kind: type) -> str:
+    return f'{kind.__module__}:{kind.__qualname__}'
+
+def _resolve(name: str, base: type) -> type:
+    """
+        The class saved under name by _name_of. Save data is untrusted, so names are only
+        looked up in modules that are already imported, never importing anything, and
+        anything but a subclass of base is rejected before it can be called
+    """
+    module, _, qualname = name.partition(':')
+    if module not in sys.modules:
+        LOGGER.error('Saved game refers to %s, whose module is not imported', name)
+        raise InvalidSaveDataException(f"Saved game refers to {name}, whose module is not imported")
+    try:
+        found = reduce(getattr, qualname.split('.'), sys.modules[module])
+    except AttributeError as err:
+        raise InvalidSaveDataException(f"Saved game refers to {name}, which does not exist") from err
+    if not (isinstance(found, type) and issubclass(found, base)):
+        LOGGER.error('Saved game refers to %s, which is not a %s', name, base.__name__)
+        raise InvalidSaveDataException(f"Saved game refers to {name}, which is not a {base.__name__} type")
+    return found
+
+def _color(value: str):
+    try:
+        return TileColor(value)
+    except ValueError:
+        return value
+
+def _shape(value):
+    try:
+        return TileShape(value)
+    except ValueError:
+        return value
@@ -0,0 +1,127 @@
+"""
+    :module_name: tick_scheduler
+    :module_summary: a min-heap scheduler that knows when each game is next due to tick
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import heapq
+import itertools
+import logging
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+class TickScheduler:
+    """
+        Keeps every scheduled item in a min-heap ordered by its next due time.
+        Items that are popped late owe one run per interval missed; up to max_catch_up
+        of those runs are handed back and the rest are skipped, keeping the item on its
+        original cadence
+        :arg clock: callable returning the current time in nanoseconds, monotonic by default
+        :arg max_catch_up: the most runs handed back for a single late item
+    """
+
+    def __init__(self, clock: callable = time.monotonic_ns, max_catch_up: int = 1):
+        self._clock = clock
+        self._max_catch_up = max(max_catch_up, 1)
+        self._heap = []
+        self._entries = {}
+        self._intervals = {}
+        self._sequence = itertools.count()
+        self._skipped = 0
+
+    def schedule(self, item, interval: int, due: int = None) -> None:
+        """
+            Schedule item to come due every interval nanoseconds, replacing any earlier schedule
+            :arg item: the thing to schedule, e.g. a game loop
+            :arg interval: nanoseconds between runs; values below 1 are treated as 1
+            :arg due: when the item is first due, one interval from now by default
+            :arg type: object
+            :arg type: int
+            :arg type: int or None
+            :returns: nothing
+            :rtype: None
+        """
+        interval = max(interval, 1)
+        self._intervals[item] = interval
+        self._push(item, self._clock() + interval if due is None else due)
+
+    def cancel(self, item) -> None:
+        """
+            Stop scheduling item. Does nothing if it is not scheduled
+            :arg item: the scheduled thing
+            :arg type: object
+            :returns: nothing
+            :rtype: None
+        """
+        self._intervals.pop(item, None)
+        self._entries.pop(item, None)
+
+    def next_due(self) -> int or None:
+        """
+            When the earliest item is due
+            :returns: time in nanoseconds, None if nothing is scheduled
+            :rtype: int or None
+        """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def time_until_due(self) -> int or None:
+        """
+            Nanoseconds from now until the earliest item is due, never negative
+            :returns: nanoseconds, None if nothing is scheduled
+            :rtype: int or None
+        """
+        due = self.next_due()
+        return None if due is None else max(due - self._clock(), 0)
+
+    def pop_due(self, now: int = None, limit: int = None) -> [tuple]:
+        """
+            Take every item due at or before now and reschedule it
+            :arg now: the time to compare due times against, the clock's time by default
+            :arg limit: the most items to take; the rest stay due
+            :arg type: int or None
+            :arg type: int or None
+            :returns: (item, runs) pairs in due order, runs being how many times to run it
+            :rtype: list
+        """
+        now = self._clock() if now is None else now
+        due_items = []
+        while (limit is None or len(due_items) < limit) and self.next_due() is not None:
+            due, _, item = self._heap[0]
+            if due > now:
+                break
+            heapq.heappop(self._heap)
+            interval = self._intervals[item]
+            owed = (now - due) // interval + 1
+            runs = min(owed, self._max_catch_up)
+            if owed > runs:
+                LOGGER.info('Skipping %d late runs of %s', owed - runs, str(item))
+                self._skipped += owed - runs
+            self._push(item, due + owed * interval)
+            due_items.append((item, runs))
+        return due_items
+
+    @property
+    def skipped(self) -> int:
+        """
+            Total runs skipped because items were popped too late to catch up
+            :returns: skipped run count
+            :rtype: int
+        """
+        return self._skipped
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def _push(self, item, due: int) -> None:
+        sequence = next(self._sequence)
+        self._entries[item] = sequence
+        heapq.heappush(self._heap, (due, sequence, item))
+
+    def _discard_stale(self) -> None:
+        """
+            Drop heap entries left behind by cancel or reschedule
+        """
+        while self._heap and self._entries.get(self._heap[0][2]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
@@ -0,0 +1,101 @@
+"""
+    :module_name: transposition_table
+    :module_summary: a bounded, least recently used cache of search results keyed by board hash
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class TranspositionTable:
+    """
+        Remembers values computed for board states, e.g. evaluations found by a lookahead
+        search, so states reached again through a different order of moves are not
+        searched twice. Keys are normally GameBoard.state_hash, optionally combined with
+        other search state such as depth. Once full, storing a new key evicts the least
+        recently read or stored one
+        :arg capacity: the most entries kept, at least 1
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self._capacity = max(capacity, 1)
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None):
+        """
+            The value stored under key, marking it recently used
+            :arg key: the state to look up
+            :arg default: returned if key is not stored
+            :arg type: hashable
+            :arg type: object
+            :returns: the stored value or default
+            :rtype: object
+        """
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value) -> None:
+        """
+            Store value under key, evicting the least recently used entry when full
+            :arg key: the state the value was computed for
+            :arg value: what to remember
+            :arg type: hashable
+            :arg type: object
+            :returns: nothing
+            :rtype: None
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self._capacity:
+            entries.popitem(last=False)
+        entries[key] = value
+
+    def clear(self) -> None:
+        """
+            Forget every entry and reset the hit and miss counts
+            :returns: nothing
+            :rtype: None
+        """
+        LOGGER.debug('Clearing %d transposition table entries', len(self._entries))
+        self._entries.clear()
+        self._hits = self._misses = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def hits(self) -> int:
+        """
+            Number of get calls that found their key
+            :returns: hit count
+            :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+            Number of get calls that did not find their key
+            :returns: miss count
+            :rtype: int
+        """
+        return self._misses
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,10 +2,44 @@
     :module_name: model
     :module_summary: a collection of classes that simplify modeling of a tile-matching game
     :module_author: Nathan Mendoze (nathancm@uci.edu)
+
+    Exports that need numpy are only imported on first use
 """
 
+import importlib
+
 from .score import Scoring
 from .match import MatchCondition
 from .movement import MovementRule
-from .tiles import *
-from .board import *
+from .tiles import TileAppearance, TileShape, TileColor, Tile, NullTile, TileGroup
+from .board import GameBoard, ChangeJournal, BoardSnapshot
+
+_LAZY_EXPORTS = {
+        'RunMatchCondition': '.match',
+        'ClusterMatchCondition': '.match',
+        'ArrayGameBoard': '.board',
+        'TileEncoder': '.board'
+        }
+
+__all__ = [
+        'Scoring', 'MatchCondition', 'MovementRule',
+        'TileAppearance', 'TileShape', 'TileColor', 'Tile', 'NullTile', 'TileGroup',
+        'GameBoard', 'ChangeJournal', 'BoardSnapshot',
+        *_LAZY_EXPORTS
+        ]
+
+def __getattr__(name: str):
+    """
+        Import numpy-backed exports the first time they are requested
+        :arg name: the attribute being looked up
+        :returns: the exported object
+        :raises: AttributeError if name is not exported by this package
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -2,6 +2,35 @@
     :module_name: board
     :module_summary: a collection of classes that represent the board of a tile-matching game
     :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    ArrayGameBoard and TileEncoder need numpy, so they are only imported on first use
 """
 
+import importlib
+
 from .game_board import GameBoard
+from .change_journal import ChangeJournal
+from .snapshot import BoardSnapshot
+
+_LAZY_EXPORTS = {
+        'ArrayGameBoard': '.array_board',
+        'TileEncoder': '.encoding'
+        }
+
+__all__ = ['GameBoard', 'ChangeJournal', 'BoardSnapshot', *_LAZY_EXPORTS]
+
+def __getattr__(name: str):
+    """
+        Import numpy-backed exports the first time they are requested
+        :arg name: the attribute being looked up
+        :returns: the exported object
+        :raises: AttributeError if name is not exported by this package
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
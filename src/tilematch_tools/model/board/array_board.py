@@ -0,0 +1,312 @@
+"""
+    :module_name: array_board
+    :module_summary: a game board that keeps cell state in contiguous NumPy arrays
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+
+import numpy as np
+
+from .game_board import GameBoard
+from ..tiles import Tile, NullTile, TileColor, TileShape
+from ..exceptions import IllegalBoardContentException
+
+LOGGER = logging.getLogger(__name__)
+
+class ArrayGameBoard(GameBoard):
+    """
+        A game board that stores each cell as a handful of small integer codes
+        (kind, color, shape, border, occupancy) instead of a Tile object.
+        Tiles are materialized on demand by tile_at and __iter__, so tiles read
+        from this board are values: mutating one does not change the board,
+        place it again instead. Tile kinds are rebuilt from their position,
+        color, shape and border properties; default empty cells read back as
+        the board's shared null tiles. Clones share the cell arrays until either
+        board writes to them, then copy all of them once.
+    """
+    EMPTY_COLOR = NullTile.EMPTY_COLOR
+    KIND_DTYPE = np.uint8
+    COLOR_DTYPE = np.uint16
+    SHAPE_DTYPE = np.uint8
+    ARRAYS = ('_kinds', '_colors', '_shapes', '_borders', '_occupied')
+
+    def _init_board(self) -> None:
+        """
+            initialize the code tables and arrays so every cell holds a default null tile
+            :returns: nothing
+            :rtype: None
+        """
+        self._kind_table = [NullTile]
+        self._color_table = [self.EMPTY_COLOR, TileColor.GRAY]
+        self._shape_table = [TileShape.SQUARE]
+        self._kind_codes = {NullTile: 0}
+        self._color_codes = {self.EMPTY_COLOR: 0, TileColor.GRAY: 1}
+        self._shape_codes = {TileShape.SQUARE: 0}
+
+        dims = (self._num_cols, self._num_rows) # indexed [x - 1, y - 1] like the list board
+        self._kinds = np.zeros(dims, dtype=self.KIND_DTYPE)
+        self._colors = np.zeros(dims, dtype=self.COLOR_DTYPE)
+        self._shapes = np.zeros(dims, dtype=self.SHAPE_DTYPE)
+        self._borders = np.ones(dims, dtype=self.COLOR_DTYPE)
+        self._occupied = np.zeros(dims, dtype=np.bool_)
+        self._empty_tiles = {} # shared null tiles, created as empty cells are read
+        self._shared = False # whether a clone shares the cell arrays
+
+    @property
+    def board(self):
+        """
+            Materialize the whole board as a list of columns, mirroring GameBoard.board
+            :returns: list of columns of tiles
+            :rtype: list
+        """
+        return [
+                [self._read_cell(x, y) for y in range(1, self._num_rows + 1)]
+                for x in range(1, self._num_cols + 1)
+                ]
+
+    @property
+    def kinds(self) -> np.ndarray:
+        """
+            Read only view of the kind code of every cell. Code 0 is NullTile
+            :returns: array of shape (num_cols, num_rows)
+            :rtype: numpy.ndarray
+        """
+        return self._read_only(self._kinds)
+
+    @property
+    def colors(self) -> np.ndarray:
+        """
+            Read only view of the color code of every cell
+            :returns: array of shape (num_cols, num_rows)
+            :rtype: numpy.ndarray
+        """
+        return self._read_only(self._colors)
+
+    @property
+    def shapes(self) -> np.ndarray:
+        """
+            Read only view of the shape code of every cell
+            :returns: array of shape (num_cols, num_rows)
+            :rtype: numpy.ndarray
+        """
+        return self._read_only(self._shapes)
+
+    @property
+    def borders(self) -> np.ndarray:
+        """
+            Read only view of the border color code of every cell
+            :returns: array of shape (num_cols, num_rows)
+            :rtype: numpy.ndarray
+        """
+        return self._read_only(self._borders)
+
+    @property
+    def occupied(self) -> np.ndarray:
+        """
+            Read only view of cell occupancy. True wherever the cell is not a NullTile
+            :returns: array of shape (num_cols, num_rows)
+            :rtype: numpy.ndarray
+        """
+        return self._read_only(self._occupied)
+
+    @property
+    def kind_table(self) -> tuple:
+        """
+            The tile types indexed by kind code
+            :returns: tuple of tile classes
+            :rtype: tuple
+        """
+        return tuple(self._kind_table)
+
+    @property
+    def color_table(self) -> tuple:
+        """
+            The colors indexed by color code. Borders share this table
+            :returns: tuple of colors
+            :rtype: tuple
+        """
+        return tuple(self._color_table)
+
+    @property
+    def shape_table(self) -> tuple:
+        """
+            The shapes indexed by shape code
+            :returns: tuple of shapes
+            :rtype: tuple
+        """
+        return tuple(self._shape_table)
+
+    @property
+    def nbytes(self) -> int:
+        """
+            The number of bytes used by the cell arrays
+            :returns: byte count
+            :rtype: int
+        """
+        return sum(
+                arr.nbytes
+                for arr in (self._kinds, self._colors, self._shapes, self._borders, self._occupied)
+                )
+
+    def _read_cell(self, x: int, y: int) -> Tile:
+        i, j = x - 1, y - 1
+        if not (self._kinds[i, j] or self._colors[i, j] or self._shapes[i, j]) and self._borders[i, j] == 1:
+            return self._empty_tile(x, y)
+        return self._kind_table[self._kinds[i, j]](**{
+            'position': (x, y),
+            'color': self._color_table[self._colors[i, j]],
+            'shape': self._shape_table[self._shapes[i, j]],
+            'border': self._color_table[self._borders[i, j]]
+            })
+
+    def _write_cell(self, x: int, y: int, tile: Tile) -> None:
+        if self._shared:
+            self._unshare()
+        i, j = x - 1, y - 1
+        kind = type(tile)
+        self._kinds[i, j] = self._code_for(kind, self._kind_table, self._kind_codes, self.KIND_DTYPE)
+        self._colors[i, j] = self._code_for(
+                tile.color, self._color_table, self._color_codes, self.COLOR_DTYPE
+                )
+        self._shapes[i, j] = self._code_for(
+                tile.shape, self._shape_table, self._shape_codes, self.SHAPE_DTYPE
+                )
+        self._borders[i, j] = self._code_for(
+                tile.border, self._color_table, self._color_codes, self.COLOR_DTYPE
+                )
+        self._occupied[i, j] = kind != NullTile
+
+    def _clear_cell(self, x: int, y: int) -> None:
+        if self._shared:
+            self._unshare()
+        i, j = x - 1, y - 1
+        self._kinds[i, j] = 0
+        self._colors[i, j] = 0
+        self._shapes[i, j] = 0
+        self._borders[i, j] = 1
+        self._occupied[i, j] = False
+
+    def _empty_tile(self, x: int, y: int) -> NullTile:
+        tile = self._empty_tiles.get((x, y))
+        if tile is None or not tile.is_blank_at(x, y):
+            tile = self._empty_tiles[(x, y)] = NullTile.blank(x, y)
+        return tile
+
+    def _cell_key(self, x: int, y: int) -> (type, object, object):
+        i, j = x - 1, y - 1
+        return (
+                self._kind_table[self._kinds[i, j]],
+                self._color_table[self._colors[i, j]],
+                self._shape_table[self._shapes[i, j]]
+                )
+
+    def _cell_is_empty(self, x: int, y: int) -> bool:
+        return not self._occupied[x - 1, y - 1]
+
+    def _snapshot_cells(self) -> tuple:
+        """
+            Read only copies of the cell arrays followed by the kind, color and shape tables
+        """
+        arrays = tuple(self._read_only(getattr(self, name).copy()) for name in self.ARRAYS)
+        return arrays + (tuple(self._kind_table), tuple(self._color_table), tuple(self._shape_table))
+
+    def _restore_cells(self, cells: tuple) -> [(int, int)]:
+        arrays, tables = cells[:len(self.ARRAYS)], cells[len(self.ARRAYS):]
+        current = (self._kind_table, self._color_table, self._shape_table)
+        recoded = any(list(table) != now[:len(table)] for table, now in zip(tables, current))
+        if recoded:
+            LOGGER.debug('Snapshot codes differ from the current ones, restoring its code tables')
+            self._kind_table, self._color_table, self._shape_table = (list(table) for table in tables)
+            self._kind_codes, self._color_codes, self._shape_codes = (
+                    {value: code for code, value in enumerate(table)} for table in tables
+                    )
+        differs = np.full((self._num_cols, self._num_rows), recoded, dtype=np.bool_)
+        for name, captured in zip(self.ARRAYS, arrays):
+            differs |= getattr(self, name) != captured
+            setattr(self, name, captured.copy())
+        self._shared = False
+        return [(int(i) + 1, int(j) + 1) for i, j in zip(*np.nonzero(differs))]
+
+    def _load_codes(self, tables: tuple, kinds, colors, shapes, borders) -> None:
+        """
+            Adopt the code arrays as this board's cells. Codes that mean the same as this
+            board's are used as they are, without copying writable arrays such as
+            copy-on-write memory maps; others are translated with one lookup per array
+        """
+        own = (
+                (self._kind_table, self._kind_codes, self.KIND_DTYPE),
+                (self._color_table, self._color_codes, self.COLOR_DTYPE),
+                (self._shape_table, self._shape_codes, self.SHAPE_DTYPE)
+                )
+        lookups = [
+                np.array([self._code_for(value, *codes) for value in table], dtype=codes[2])
+                for table, codes in zip(tables, own)
+                ]
+        cells = []
+        for arr, lookup, dtype in zip(
+                (kinds, colors, shapes, borders),
+                lookups + [lookups[1]],
+                (self.KIND_DTYPE, self.COLOR_DTYPE, self.SHAPE_DTYPE, self.COLOR_DTYPE)
+                ):
+            if not np.array_equal(lookup, np.arange(len(lookup))):
+                arr = lookup[arr]
+            arr = arr.astype(dtype, copy=False)
+            cells.append(arr if arr.flags.writeable else arr.copy())
+        self._kinds, self._colors, self._shapes, self._borders = cells
+        self._occupied = self._kinds != 0
+        self._empty_tiles = {}
+        self._shared = False
+        self._hash = None
+
+    def _share_storage(self, twin: 'ArrayGameBoard') -> None:
+        self._shared = twin._shared = True
+        twin._empty_tiles = {}
+
+    def _unshare(self) -> None:
+        """
+            Copy the cell arrays before the first write after cloning
+        """
+        for name in self.ARRAYS:
+            setattr(self, name, getattr(self, name).copy())
+        self._shared = False
+
+    @staticmethod
+    def _code_for(value, table: list, codes: dict, dtype) -> int:
+        """
+            Look up the code of a value, registering it if it has not been seen before
+            :arg value: the kind, color or shape to encode
+            :arg table: code -> value table the value belongs in
+            :arg codes: value -> code index of the table
+            :arg dtype: the array type codes are stored as
+            :returns: the code of value
+            :rtype: int
+            :raises: IllegalBoardContentException if the table cannot hold another code
+        """
+        code = codes.get(value)
+        if code is None:
+            code = len(table)
+            if code > np.iinfo(dtype).max:
+                LOGGER.error('Ran out of codes while registering %s', str(value))
+                raise IllegalBoardContentException(
+                        f"Board cannot encode more than {code} distinct values like {value}"
+                        )
+            LOGGER.debug('Registering %s with code %d', str(value), code)
+            table.append(value)
+            codes[value] = code
+        return code
+
+    @staticmethod
+    def _read_only(arr: np.ndarray) -> np.ndarray:
+        view = arr.view()
+        view.flags.writeable = False
+        return view
+
+    def __iter__(self):
+        """
+            Return a generator that iterate over the board in column-major order
+            :rtype: generator
+        """
+        for x in range(1, self._num_cols + 1):
+            for y in range(1, self._num_rows + 1):
+                yield self._read_cell(x, y)
@@ -0,0 +1,60 @@
+"""
+    :module_name: change_journal
+    :module_summary: a class that records which board positions changed since it was last drained
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+class ChangeJournal:
+    """
+        Collects the positions of a game board that changed since the last drain.
+        Each consumer opens its own journal so draining one does not affect another
+    """
+
+    def __init__(self):
+        self._changed = set()
+
+    def record(self, x: int, y: int) -> None:
+        """
+            Record that the tile at (x, y) changed
+            :arg x: the x value of the changed position
+            :arg y: the y value of the changed position
+            :arg type: int
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        self._changed.add((x, y))
+
+    def record_many(self, positions) -> None:
+        """
+            Record that every (x, y) position in positions changed
+            :arg positions: the changed positions
+            :arg type: iterable
+            :returns: nothing
+            :rtype: None
+        """
+        self._changed.update(positions)
+
+    def drain(self) -> set:
+        """
+            Return the positions changed since the last drain and start a new record
+            :returns: set of (x, y) tuples
+            :rtype: set
+        """
+        changed = self._changed
+        self._changed = set()
+        LOGGER.debug('Draining %d changed positions', len(changed))
+        return changed
+
+    @property
+    def pending(self) -> int:
+        """
+            The number of positions recorded since the last drain
+            :returns: count of changed positions
+            :rtype: int
+        """
+        return len(self._changed)
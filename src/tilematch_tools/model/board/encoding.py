@@ -0,0 +1,159 @@
+"""
+    :module_name: encoding
+    :module_summary: a class that encodes the tiles of a game board as an integer array
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+
+import numpy as np
+
+from .game_board import GameBoard
+from .array_board import ArrayGameBoard
+from ..tiles import Tile, NullTile
+from ..exceptions import UnregisteredTileKeyException
+
+LOGGER = logging.getLogger(__name__)
+
+class TileEncoder:
+    """
+        Assigns every distinct (tile type, color, shape) a stable positive integer code.
+        Null tiles are always encoded as EMPTY. Two occupied cells share a code exactly
+        when their tiles have the same exact type, color and shape; borders are ignored.
+        This is stricter than Tile.__eq__, which also equates a tile with an instance of
+        a subclass of its type that has the same color and shape; agrees_with_tile_eq
+        tells whether that difference can show up among the registered keys
+    """
+    EMPTY = 0
+    DTYPE = np.int32
+
+    def __init__(self, keys = ()):
+        self._codes = {}
+        self._frozen = False
+        self._kinds_checked = 0
+        self._kinds_related = False
+        for key in keys:
+            self.code_for_key(*key)
+
+    def code_for(self, tile: Tile) -> int:
+        """
+            Return the code of a single tile
+            :arg tile: the tile to encode
+            :arg type: Tile
+            :returns: the tile's code
+            :rtype: int
+        """
+        if type(tile) == NullTile:
+            return self.EMPTY
+        return self.code_for_key(type(tile), tile.color, tile.shape)
+
+    def code_for_key(self, kind: type, color, shape) -> int:
+        """
+            Return the code of a tile described by its type, color and shape
+            :arg kind: the tile type
+            :arg color: the tile color
+            :arg shape: the tile shape
+            :arg type: type
+            :arg type: TileColor
+            :arg type: TileShape
+            :returns: the code, registering a new one if needed
+            :rtype: int
+        """
+        if kind == NullTile:
+            return self.EMPTY
+        key = (kind, color, shape)
+        code = self._codes.get(key)
+        if code is None:
+            if self._frozen:
+                LOGGER.error('Frozen encoder has no code for %s', str(key))
+                raise UnregisteredTileKeyException(
+                        f"No code is registered for {key}; register it before freezing the encoder"
+                        )
+            code = len(self._codes) + 1
+            LOGGER.debug('Registering tile code %d for %s', code, str(key))
+            self._codes[key] = code
+        return code
+
+    def frozen(self) -> 'TileEncoder':
+        """
+            A copy of this encoder that keeps its codes and refuses to register new ones,
+            so encoders copied into other processes can never disagree on a code
+            :returns: the frozen copy
+            :rtype: TileEncoder
+        """
+        twin = TileEncoder(self._codes)
+        twin._frozen = True
+        return twin
+
+    @property
+    def keys(self) -> [tuple]:
+        """
+            The registered (tile type, color, shape) keys, in code order
+            :returns: list of keys; the first has code 1
+            :rtype: list
+        """
+        return list(self._codes)
+
+    @property
+    def agrees_with_tile_eq(self) -> bool:
+        """
+            Whether codes compare tiles exactly as Tile.__eq__ does, which holds as long as
+            no registered tile type is a subclass of another registered tile type
+            :returns: true if equal codes mean equal tiles under Tile.__eq__, false otherwise
+            :rtype: bool
+        """
+        if self._kinds_checked != len(self._codes):
+            kinds = {kind for kind, _, _ in self._codes}
+            self._kinds_related = any(
+                    one is not other and issubclass(one, other) for one in kinds for other in kinds
+                    )
+            self._kinds_checked = len(self._codes)
+        return not self._kinds_related
+
+    def encode(self, board: GameBoard) -> np.ndarray:
+        """
+            Encode every cell of a board
+            :arg board: the board to encode
+            :arg type: GameBoard
+            :returns: array of codes of shape (num_cols, num_rows), indexed [x - 1, y - 1]
+            :rtype: numpy.ndarray
+        """
+        if isinstance(board, ArrayGameBoard):
+            return self._encode_arrays(board)
+        dims = (board.num_cols, board.num_rows)
+        return np.fromiter(
+                (self.code_for(tile) for tile in board),
+                dtype=self.DTYPE,
+                count=dims[0] * dims[1]
+                ).reshape(dims)
+
+    def update(self, board: GameBoard, codes: np.ndarray, positions) -> None:
+        """
+            Re-encode only the given cells of an array produced by encode, e.g. the
+            positions a change journal collected since it was last drained
+            :arg board: the encoded board
+            :arg codes: the board's codes, updated in place
+            :arg positions: (x, y) positions whose tiles may have changed
+            :arg type: GameBoard
+            :arg type: numpy.ndarray
+            :arg type: iterable
+            :returns: nothing
+            :rtype: None
+        """
+        for x, y in positions:
+            codes[x - 1, y - 1] = self.code_for_key(*board.tile_key_at(x, y))
+
+    def _encode_arrays(self, board: ArrayGameBoard) -> np.ndarray:
+        """
+            Vectorized encoding that only visits each distinct cell state once
+        """
+        packed = (board.kinds.astype(np.int64) << 32) \
+                | (board.colors.astype(np.int64) << 8) \
+                | board.shapes
+        distinct, inverse = np.unique(packed, return_inverse=True)
+        kinds, colors, shapes = board.kind_table, board.color_table, board.shape_table
+        lookup = np.array([
+                self.code_for_key(kinds[p >> 32], colors[(p >> 8) & 0xFFFFFF], shapes[p & 0xFF])
+                for p in distinct.tolist()
+                ], dtype=self.DTYPE)
+        return lookup[inverse].reshape(packed.shape)
@@ -5,21 +5,38 @@
 """
 
 import logging
+import operator
+import weakref
 from abc import ABC
 
 from ..tiles import Tile, NullTile
 from ..exceptions import InvalidBoardPositionError, IllegalBoardContentException
+from .change_journal import ChangeJournal
+from .snapshot import BoardSnapshot
+from . import zobrist
+from ...tracing import HOT_PATH_LOGGING
 
 LOGGER = logging.getLogger(__name__)
 
+# copy-on-write state of a column of a cloned list board
+_OWNED = 0 # only this board holds the column
+_LENT = 1 # a clone shares the column list; copy the list before writing
+_BORROWED = 2 # the column belongs to the board this was cloned from; copy it and its tiles on access
+
+_APPEARANCE = operator.attrgetter('_appearance')
+_BLANK = NullTile.blank(1, 1)._appearance
+
 class GameBoard(ABC):
     def __init__(self,width, height):
         self._num_rows = height
         self._num_cols = width
-        self.__init_board()
+        self._journals = weakref.WeakSet()
+        self._hash = None # Zobrist hash, maintained once state_hash is first read
+        self._init_board()
 
     @property
     def board(self):
+        self._own_all_columns()
         return self._board
         
     @property
@@ -30,16 +47,36 @@ class GameBoard(ABC):
     def num_cols(self):
         return self._num_cols
 
-    def __init_board(self) -> None:
+    @property
+    def state_hash(self) -> int:
+        """
+            Zobrist hash of the board's contents: equal for boards holding equal tiles
+            (same type, color and shape, borders ignored) in the same cells. The first
+            read computes it in O(cells); from then on every place, clear and restore
+            keeps it up to date with two XORs per changed cell
+            :returns: 64-bit hash, 0 for an empty board
+            :rtype: int
+        """
+        if self._hash is None:
+            state = 0
+            for x in range(1, self._num_cols + 1):
+                for y in range(1, self._num_rows + 1):
+                    state ^= zobrist.key_value(x, y, *self._cell_key(x, y))
+            self._hash = state
+        return self._hash
+
+    def _init_board(self) -> None:
         """
-            initialize the game board full of default tiles
+            initialize the game board full of default tiles. Storage backends override this
             :returns: nothing
             :rtype: None
         """
-        self._board = [ # positions will be represented as positve cartesian coordinates
-                [ NullTile(**{'position': (x, y),'color':'#D3D3D3'}) for y in range(1, self._num_rows + 1)]
-                for x in range(1, self._num_cols + 1)
+        self._empty_tiles = [ # positions will be represented as positve cartesian coordinates
+                self._blank_column(x) for x in range(1, self._num_cols + 1)
                 ]
+        self._board = [column[:] for column in self._empty_tiles]
+        self._columns = None # copy-on-write state per column, None while every column is owned
+        self._appearances = None # per borrowed column, the appearances of its tiles when it was lent
 
     def tile_at(self, x: int, y: int) -> Tile:
         """
@@ -50,13 +87,33 @@ class GameBoard(ABC):
            :rtype: Tile
            :throws: InvalidBoardPositionError if the specified position is invalid
         """
-        LOGGER.info('Looking at tile located at (%d, %d)', x, y)
-        if not self.__board_position_is_valid(x, y):
+        if HOT_PATH_LOGGING:
+            LOGGER.info('Looking at tile located at (%d, %d)', x, y)
+        if not self._board_position_is_valid(x, y):
             LOGGER.error('(%d, %d) is out of bounds', x, y)
             raise InvalidBoardPositionError(
                 f"The position ({x}, {y}) is invalid for the given board"
                     )
-        return self._board[x - 1][y - 1] # Adjust from cartesian coordinates to valid indices
+        return self._read_cell(x, y)
+
+    def tile_key_at(self, x: int, y: int) -> (type, object, object):
+        """
+            The type, color and shape of the tile at the specified location, read without
+            materializing or copying the tile, e.g. to encode the cell
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: the tile's type, color and shape
+            :rtype: tuple
+            :throws: InvalidBoardPositionError if the specified position is invalid
+        """
+        if not self._board_position_is_valid(x, y):
+            LOGGER.error('(%d, %d) is out of bounds', x, y)
+            raise InvalidBoardPositionError(
+                f"The position ({x}, {y}) is invalid for the given board"
+                    )
+        return self._cell_key(x, y)
 
     def place_tile(self, tile: Tile) -> None:
         """
@@ -75,26 +132,422 @@ class GameBoard(ABC):
                     )
         x = tile.position.x
         y = tile.position.y
-        if not self.__board_position_is_valid(x, y):
+        if not self._board_position_is_valid(x, y):
             LOGGER.error('(%d, %d) is out of bounds', x, y)
             raise InvalidBoardPositionError(
                     f"The position ({x}, {y}) is invalid for the given board"
                     )
         if type(tile) == NullTile:
-            LOGGER.info('Placing a null tile at (%d, %d) -- skipping availablity checks', x, y)
-            self._board[x - 1][y - 1] = tile
+            if HOT_PATH_LOGGING:
+                LOGGER.info('Placing a null tile at (%d, %d) -- skipping availablity checks', x, y)
+            if self._hash is not None:
+                self._hash ^= zobrist.key_value(x, y, *self._cell_key(x, y))
+            self._write_cell(x, y, tile)
+            self.mark_changed(x, y)
             return
 
-        if not self.__board_position_is_available(x, y):
+        if not self._board_position_is_available(x, y):
             LOGGER.error('(%d, %d) is already occupied by another tile', x, y)
             raise InvalidBoardPositionError(
                     f"The position ({x}, {y}) is already occupied by another tile"
                     )
 
+        if self._hash is not None: # the cell was empty, so only the new tile's value goes in
+            self._hash ^= zobrist.tile_value(x, y, tile)
+        self._write_cell(x, y, tile)
+        self.mark_changed(x, y)
+
+    def clear_tile(self, x: int, y: int) -> None:
+        """
+            empty the given position. Unlike placing a new NullTile, this reuses the
+            board's shared null tile for the position and allocates nothing
+            :arg x: the x value of the coordinate to clear
+            :arg y: the y value of the coordinate to clear
+            :arg type: int
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+            :throws: InvalidBoardPositionError if the specified position is invalid
+        """
+        if not self._board_position_is_valid(x, y):
+            LOGGER.error('(%d, %d) is out of bounds', x, y)
+            raise InvalidBoardPositionError(
+                    f"The position ({x}, {y}) is invalid for the given board"
+                    )
+        if self._hash is not None:
+            self._hash ^= zobrist.key_value(x, y, *self._cell_key(x, y))
+        self._clear_cell(x, y)
+        self.mark_changed(x, y)
+
+    def relocate(self, moves: [(Tile, int, int)]) -> None:
+        """
+            Move placed tiles to new positions as one change, e.g. a whole tile group.
+            A target may be a cell another of the moved tiles leaves. Cells left empty
+            are cleared with the board's shared null tiles, and open journals record
+            every affected position in one entry
+            :arg moves: (tile, x, y) for every tile to move, each currently placed at its position
+            :arg type: list
+            :returns: nothing
+            :rtype: None
+            :throws: InvalidBoardPositionError if a target is out of bounds or occupied by a tile not moving
+        """
+        sources = {(tile.position.x, tile.position.y) for tile, _, _ in moves}
+        targets = {(x, y) for _, x, y in moves}
+        for x, y in targets:
+            if not self._board_position_is_valid(x, y):
+                LOGGER.error('(%d, %d) is out of bounds', x, y)
+                raise InvalidBoardPositionError(
+                        f"The position ({x}, {y}) is invalid for the given board"
+                        )
+            if (x, y) not in sources and not self._cell_is_empty(x, y):
+                LOGGER.error('(%d, %d) is already occupied by another tile', x, y)
+                raise InvalidBoardPositionError(
+                        f"The position ({x}, {y}) is already occupied by another tile"
+                        )
+        if self._hash is not None:
+            for x, y in sources:
+                self._hash ^= zobrist.key_value(x, y, *self._cell_key(x, y))
+        for x, y in sources - targets:
+            self._clear_cell(x, y)
+        for tile, x, y in moves:
+            tile.position = (x, y)
+            self._write_cell(x, y, tile)
+            if self._hash is not None:
+                self._hash ^= zobrist.tile_value(x, y, tile)
+        changed = sources | targets
+        for journal in self._journals:
+            journal.record_many(changed)
+
+    def is_available(self, x: int, y: int) -> bool:
+        """
+            Whether a tile could be placed at the given position: it is on the board and
+            holds a null tile. Answers without raising or logging, for dry runs of moves
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: true if the position is free, false otherwise
+            :rtype: bool
+        """
+        return self._board_position_is_available(x, y)
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+            Capture the contents of this board without copying any tile
+            :returns: an immutable record of every cell, see restore
+            :rtype: BoardSnapshot
+        """
+        return BoardSnapshot(
+                type(self), self._num_cols, self._num_rows, self._snapshot_cells(), self._hash
+                )
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """
+            Put back the contents captured by snapshot, in O(cells) and without creating tiles.
+            Tiles moved since are put back at their captured positions. Every position whose
+            contents differ is recorded in the open journals
+            :arg snapshot: a snapshot taken from this board, or one of the same type and size
+            :arg type: BoardSnapshot
+            :returns: nothing
+            :rtype: None
+            :raises: IllegalBoardContentException if the snapshot does not fit this board
+        """
+        if (snapshot.board_type is not type(self)
+                or (snapshot.num_cols, snapshot.num_rows) != (self._num_cols, self._num_rows)):
+            LOGGER.error('Attempted to restore a snapshot taken from a different kind of board')
+            raise IllegalBoardContentException(
+                    f"A {snapshot.num_cols}x{snapshot.num_rows} {snapshot.board_type.__name__} snapshot "
+                    f"cannot be restored into a {self._num_cols}x{self._num_rows} {type(self).__name__}"
+                    )
+        changed = self._restore_cells(snapshot.cells)
+        self._hash = snapshot.state_hash # unknown hashes are recomputed when next read
+        for journal in self._journals:
+            journal.record_many(changed)
+
+    def clone(self) -> 'GameBoard':
+        """
+            A copy-on-write copy of this board. The clone shares storage with this board
+            until either of them changes it, and tiles read from the clone are its own
+            copies, so moving them never affects this board. The look of every tile is
+            captured up front, so editing a tile in place (e.g. its border) after cloning
+            only shows on the board it was edited on
+            :returns: a board of the same type and contents, without open journals
+            :rtype: GameBoard
+        """
+        twin = object.__new__(type(self))
+        twin.__dict__.update(self.__dict__)
+        twin._journals = weakref.WeakSet()
+        self._share_storage(twin)
+        return twin
+
+    def open_journal(self) -> ChangeJournal:
+        """
+            Start recording the positions changed on this board from now on
+            The board only holds a weak reference, so the journal stops recording once dropped
+            :returns: a journal that collects every changed position until drained
+            :rtype: ChangeJournal
+        """
+        journal = ChangeJournal()
+        self._journals.add(journal)
+        return journal
+
+    def tile_changed(self, tile: Tile) -> None:
+        """
+            Record a change at tile's position if tile is stored there. Tiles stored on
+            this board call it when their appearance changes in place, e.g. a new border
+            :arg tile: the tile that changed
+            :arg type: Tile
+            :returns: nothing
+            :rtype: None
+        """
+        x, y = tile.position.x, tile.position.y
+        if self._board_position_is_valid(x, y) and self._board[x - 1][y - 1] is tile:
+            self.mark_changed(x, y)
+
+    def mark_changed(self, x: int, y: int) -> None:
+        """
+            Record a change at (x, y) in every open journal. place_tile calls this itself,
+            and so do border changes of placed tiles; call it after any other in-place
+            change of a placed tile that views draw
+            :arg x: the x value of the changed position
+            :arg y: the y value of the changed position
+            :arg type: int
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        for journal in self._journals:
+            journal.record(x, y)
+
+    def _read_cell(self, x: int, y: int) -> Tile:
+        """
+            Storage hook that returns the tile held at an already validated position
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: the tile at (x, y)
+            :rtype: Tile
+        """
+        if self._columns is not None and self._columns[x - 1] == _BORROWED:
+            self._own_column(x)
+        return self._board[x - 1][y - 1] # Adjust from cartesian coordinates to valid indices
+
+    def _write_cell(self, x: int, y: int, tile: Tile) -> None:
+        """
+            Storage hook that stores a tile at an already validated position
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg tile: the tile to store
+            :arg type: int
+            :arg type: int
+            :arg type: Tile
+            :returns: nothing
+            :rtype: None
+        """
+        if self._columns is not None and self._columns[x - 1] != _OWNED:
+            self._own_column(x)
         self._board[x - 1][y - 1] = tile
-            
+        tile._placed_on = self
+
+    def _clear_cell(self, x: int, y: int) -> None:
+        """
+            Storage hook that empties an already validated position
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        if self._columns is not None and self._columns[x - 1] != _OWNED:
+            self._own_column(x)
+        self._board[x - 1][y - 1] = self._empty_tile(x, y)
+
+    def _cell_key(self, x: int, y: int) -> (type, object, object):
+        """
+            Storage hook that returns the type, color and shape of the tile at an
+            already validated position, without materializing or copying it
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: the tile's type, color and shape
+            :rtype: tuple
+        """
+        tile = self._board[x - 1][y - 1]
+        return type(tile), tile.color, tile.shape
+
+    def _empty_tile(self, x: int, y: int) -> NullTile:
+        """
+            Storage hook that returns the shared null tile of an already validated position.
+            It is replaced by a fresh one if a caller moved it or changed its appearance
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: the empty marker of (x, y)
+            :rtype: NullTile
+        """
+        tile = self._empty_tiles[x - 1][y - 1]
+        if not tile.is_blank_at(x, y):
+            LOGGER.debug('Shared null tile of (%d, %d) was modified, replacing it', x, y)
+            tile = self._empty_tiles[x - 1][y - 1] = NullTile.blank(x, y)
+            tile._placed_on = self
+        return tile
+
+    def _blank_column(self, x: int) -> [NullTile]:
+        """
+            Fresh null tiles for every cell of column x, stored on this board
+        """
+        column = [NullTile.blank(x, y) for y in range(1, self._num_rows + 1)]
+        for tile in column:
+            tile._placed_on = self
+        return column
+
+    def _snapshot_cells(self) -> tuple:
+        """
+            Storage hook capturing every cell, see snapshot. Tiles are kept along with
+            their appearances, since a placed tile's border can change in place
+            :returns: immutable cell contents, a (tiles, appearances) pair per column
+            :rtype: tuple
+        """
+        self._own_all_columns()
+        return tuple((tuple(column), tuple(map(_APPEARANCE, column))) for column in self._board)
+
+    def _restore_cells(self, cells: tuple) -> [(int, int)]:
+        """
+            Storage hook putting back cells captured by _snapshot_cells
+            :arg cells: what _snapshot_cells returned
+            :arg type: tuple
+            :returns: the positions whose contents changed
+            :rtype: list
+        """
+        changed = []
+        for x, (captured, appearances) in enumerate(cells, start=1):
+            column = self._board[x - 1]
+            if all(map(operator.is_, column, captured)) and tuple(map(_APPEARANCE, column)) == appearances:
+                continue # same tiles looking the same in the same cells, so nothing changed
+            for y, (tile, appearance) in enumerate(zip(captured, appearances), start=1):
+                position = tile.position
+                if position.x != x or position.y != y:
+                    tile.position = (x, y)
+                if column[y - 1] is not tile or tile._appearance is not appearance:
+                    tile._appearance = appearance
+                    tile._placed_on = self
+                    changed.append((x, y))
+            self._board[x - 1] = list(captured)
+            if self._columns is not None:
+                self._columns[x - 1] = _OWNED
+        return changed
+
+    def _load_codes(self, tables: tuple, kinds, colors, shapes, borders) -> None:
+        """
+            Storage hook filling every cell of a freshly created board from code arrays,
+            without validating or journaling each tile. Cells of one appearance are copies
+            of a single prototype tile; default empty cells keep the shared null tiles
+            :arg tables: the kind, color and shape tables the codes index. Borders use the color table
+            :arg kinds: kind codes of shape (num_cols, num_rows)
+            :arg colors: color codes, same shape
+            :arg shapes: shape codes, same shape
+            :arg borders: border color codes, same shape
+            :arg type: tuple
+            :arg type: numpy.ndarray
+            :arg type: numpy.ndarray
+            :arg type: numpy.ndarray
+            :arg type: numpy.ndarray
+            :returns: nothing
+            :rtype: None
+        """
+        kind_table, color_table, shape_table = tables
+        prototypes = {}
+        self._own_all_columns()
+        for x, codes in enumerate(zip(kinds.tolist(), colors.tolist(), shapes.tolist(), borders.tolist()), start=1):
+            column = self._board[x - 1]
+            for y, cell in enumerate(zip(*codes), start=1):
+                prototype = prototypes.get(cell, column) # column marks a cell not seen yet
+                if prototype is column:
+                    kind, color, shape, border = cell
+                    prototype = prototypes[cell] = kind_table[kind](**{
+                        'position': (1, 1),
+                        'color': color_table[color],
+                        'shape': shape_table[shape],
+                        'border': color_table[border]
+                        })
+                    if type(prototype) == NullTile and prototype.is_blank_at(1, 1):
+                        prototype = prototypes[cell] = None
+                if prototype is not None:
+                    column[y - 1] = prototype.copy_at(x, y)
+                    column[y - 1]._placed_on = self
+        self._hash = None
+
+    def _share_storage(self, twin: 'GameBoard') -> None:
+        """
+            Storage hook making twin share this board's cells copy-on-write, see clone
+            :arg twin: a shallow copy of this board
+            :arg type: GameBoard
+            :returns: nothing
+            :rtype: None
+        """
+        columns = self._columns or [_OWNED] * self._num_cols
+        borrowed = self._appearances or [None] * self._num_cols
+        self._columns = [_BORROWED if state == _BORROWED else _LENT for state in columns]
+        twin._columns = [_BORROWED] * self._num_cols
+        twin._board = list(self._board)
+        twin._empty_tiles = list(self._empty_tiles) # columns are replaced as the twin copies them
+        twin._appearances = [ # tiles stay shared until copied, so their looks are fixed now
+                appearances if state == _BORROWED else tuple(map(_APPEARANCE, column))
+                for state, appearances, column in zip(columns, borrowed, self._board)
+                ]
+
+    def _own_column(self, x: int) -> None:
+        """
+            Give this board its own copy of column x. Borrowed columns are copied
+            along with their tiles, each placed at the cell it is copied from and looking
+            as it did when the column was lent, with fresh null tiles for empty cells
+            :arg x: the x value of the column
+            :arg type: int
+            :returns: nothing
+            :rtype: None
+        """
+        column = self._board[x - 1]
+        if self._columns[x - 1] == _BORROWED:
+            borrowed, appearances = column, self._appearances[x - 1]
+            self._empty_tiles[x - 1] = self._blank_column(x)
+            column = list(self._empty_tiles[x - 1])
+            for y, (tile, appearance) in enumerate(zip(borrowed, appearances), start=1):
+                if appearance is not _BLANK or type(tile) != NullTile:
+                    twin = column[y - 1] = tile.copy_at(x, y)
+                    twin._appearance = appearance
+                    twin._placed_on = self
+            self._appearances[x - 1] = None
+        else:
+            column = list(column)
+        self._board[x - 1] = column
+        self._columns[x - 1] = _OWNED
+
+    def _own_all_columns(self) -> None:
+        if self._columns is None:
+            return
+        for x, state in enumerate(self._columns, start=1):
+            if state != _OWNED:
+                self._own_column(x)
+        self._columns = None
+        self._appearances = None
+
+    def _cell_is_empty(self, x: int, y: int) -> bool:
+        """
+            Storage hook that reports whether an already validated position holds a null tile
+            :arg x: the x value of the coordinate
+            :arg y: the y value of the coordinate
+            :arg type: int
+            :arg type: int
+            :returns: true if the position holds a null tile, false otherwise
+            :rtype: bool
+        """
+        return type(self._board[x - 1][y - 1]) == NullTile
 
-    def __board_position_is_valid(self, x: int, y: int):
+    def _board_position_is_valid(self, x: int, y: int):
         """
             Returns true if the given (x, y) ordered pair is valid on this board. False otherwise
             :arg x: the x value of the coordinate
@@ -106,7 +559,7 @@ class GameBoard(ABC):
         """
         return 1 <= x <= self._num_cols and 1 <= y <= self._num_rows
 
-    def __board_position_is_available(self, x: int, y: int):
+    def _board_position_is_available(self, x: int, y: int):
         """
             Return true if the given (x, y) ordered pair has no tile in it. False otherwise
             :arg x: the x value of the coordinate
@@ -116,7 +569,7 @@ class GameBoard(ABC):
             :returns: true for availability, false for unavailability
             :rtype: bool
         """
-        return self.__board_position_is_valid(x, y) and type(self._board[x - 1][y - 1]) == NullTile
+        return self._board_position_is_valid(x, y) and self._cell_is_empty(x, y)
 
     def __iter__(self):
         """
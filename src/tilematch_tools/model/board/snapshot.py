@@ -0,0 +1,24 @@
+"""
+    :module_name: snapshot
+    :module_summary: an immutable capture of a game board's contents
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
+class BoardSnapshot:
+    """
+        The contents of a game board at one point in time, in whatever compact form
+        the board's storage chooses. Only the board type that took a snapshot can restore it
+        :board_type: the class of the board the snapshot was taken from
+        :num_cols: the board's width
+        :num_rows: the board's height
+        :cells: storage specific, immutable cell contents
+        :state_hash: the board's Zobrist hash, None if it was not being maintained
+    """
+    board_type: type
+    num_cols: int
+    num_rows: int
+    cells: tuple
+    state_hash: int = None
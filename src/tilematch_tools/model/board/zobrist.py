@@ -0,0 +1,70 @@
+"""
+    :module_name: zobrist
+    :module_summary: deterministic Zobrist values for tiles at board positions
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    A board's Zobrist hash is the XOR of one 64-bit value per occupied cell, so
+    replacing a tile updates it with two XORs. Values depend only on the position
+    and on the tile's exact type, color and shape, never on borders,
+    and are derived with a fixed hash so they are the same in every process.
+"""
+
+import hashlib
+
+from ..tiles import Tile, NullTile
+
+MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_SEEDS = {} # (kind, color, shape) -> seed
+
+def key_seed(kind: type, color, shape) -> int:
+    """
+        The 64-bit seed of a tile key, stable across processes
+        :arg kind: the tile type
+        :arg color: the tile color
+        :arg shape: the tile shape
+        :returns: the seed
+        :rtype: int
+    """
+    key = (kind, color, shape)
+    seed = _SEEDS.get(key)
+    if seed is None:
+        text = f'{kind.__module__}.{kind.__qualname__}|{color}|{shape}'
+        seed = _SEEDS[key] = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little')
+    return seed
+
+def key_value(x: int, y: int, kind: type, color, shape) -> int:
+    """
+        The Zobrist value of a tile described by its key at (x, y)
+        :arg x: the x value of the position
+        :arg y: the y value of the position
+        :arg kind: the tile type, NullTile for an empty cell
+        :arg color: the tile color
+        :arg shape: the tile shape
+        :returns: 64-bit value, 0 for an empty cell
+        :rtype: int
+    """
+    if kind is NullTile:
+        return 0
+    seed = _SEEDS.get((kind, color, shape))
+    if seed is None:
+        seed = key_seed(kind, color, shape)
+    # one splitmix64 step per cell of the key's own stream
+    value = (seed + ((x << 32) | y) * _GOLDEN) & MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK
+    return value ^ (value >> 31)
+
+def tile_value(x: int, y: int, tile: Tile) -> int:
+    """
+        The Zobrist value of tile at (x, y)
+        :arg x: the x value of the position
+        :arg y: the y value of the position
+        :arg tile: the tile
+        :arg type: int
+        :arg type: int
+        :arg type: Tile
+        :returns: 64-bit value, 0 for a null tile
+        :rtype: int
+    """
+    return key_value(x, y, type(tile), tile.color, tile.shape)
@@ -24,3 +24,6 @@ class TileGroupPositionOccupiedError(BaseInf122tmgeModelException):
 
 class IllegalTileMovementException(BaseInf122tmgeModelException):
     """Exception raised when a movement is not applicable to a tile"""
+
+class UnregisteredTileKeyException(BaseInf122tmgeModelException):
+    """Exception raised when a frozen TileEncoder meets a tile it has no code for"""
@@ -2,15 +2,20 @@
     :module_name: match
     :module_summary: class that controlls the match rules of a tile-matching game
     :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    The vectorized match conditions need numpy, so they are only imported on first use
 """
 
+import importlib
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 
 from ..board import GameBoard
 from ..tiles import Tile
+from ...tracing import hot_property
 
 class ScanDelta(Enum):
     """
@@ -63,8 +68,36 @@ class MatchCondition(ABC):
         """
         LOGGER.warning('Using default implementation. This is meant to be overridden!')
         pass
+
+    def find_all(self, board: GameBoard, positions = None) -> [MatchFound]:
+        """
+            Find every match on the board, or only those passing through the given positions.
+            The default implementation calls check_match from every position and drops
+            matches covering the same tiles. check_match only finds matches starting at
+            its position, and a match through a changed position may start anywhere, so
+            the default ignores positions and returns every match on the board. Subclasses
+            that can search through positions (e.g. RunMatchCondition) override this
+            :arg board: the board to check matches for
+            :arg positions: (x, y) positions matches must pass through; None checks the whole board
+            :arg type: GameBoard
+            :arg type: iterable or None
+            :returns: the distinct matches found
+            :rtype: list
+        """
+        positions = (
+                (x, y)
+                for x in range(1, board.num_cols + 1)
+                for y in range(1, board.num_rows + 1)
+                )
+        matches = {}
+        for x, y in positions:
+            match = self.check_match(board, x, y)
+            if match:
+                covered = frozenset((tile.position.x, tile.position.y) for tile in match.matching_tiles)
+                matches.setdefault(covered, match)
+        return list(matches.values())
             
-    @property
+    @hot_property(attrgetter('_point_value'))
     def point_value(self) -> int:
         """
             Read only view of the point value of this match condition
@@ -73,3 +106,25 @@ class MatchCondition(ABC):
         """
         LOGGER.debug('Match condition is worth: %d points', self._point_value)
         return self._point_value
+
+_LAZY_EXPORTS = {
+        'RunMatchCondition': '.run_match',
+        'ClusterMatchCondition': '.cluster_match',
+        'ORTHOGONAL': '.cluster_match'
+        }
+
+def __getattr__(name: str):
+    """
+        Import the numpy-backed match conditions the first time they are requested
+        :arg name: the attribute being looked up
+        :returns: the exported object
+        :raises: AttributeError if name is not exported by this package
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,156 @@
+"""
+    :module_name: cluster_match
+    :module_summary: a match condition satisfied by connected clusters of equal tiles
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterable
+
+from . import MatchCondition, ScanDelta
+from ..board import GameBoard
+from ..board.encoding import TileEncoder
+from ..tiles import Tile, NullTile
+
+LOGGER = logging.getLogger(__name__)
+
+ORTHOGONAL = (ScanDelta.UP, ScanDelta.DOWN, ScanDelta.LEFT, ScanDelta.RIGHT)
+
+class ClusterMatchCondition(MatchCondition):
+    """
+        Match condition satisfied by groups of at least min_size equal, non-null tiles
+        that are connected through neighbouring cells. Neighbours are the cells one
+        scan step away; a connection in one direction is a connection both ways
+        :scan: a ScanDelta or an iterable of them, e.g. ORTHOGONAL
+        :value: points awarded per cluster
+        :min_size: the minimum number of tiles in a cluster
+        :equality_rule: the function the determines if two tiles match
+    """
+
+    def __init__(
+            self,
+            scan: ScanDelta or Iterable,
+            value: int,
+            min_size: int = 4,
+            equality_rule: callable = Tile.__eq__
+            ):
+        scans = (scan,) if isinstance(scan, ScanDelta) else tuple(scan)
+        super().__init__(scans, value, equality_rule)
+        if min_size < 1:
+            raise ValueError(f"min_size must be at least 1, not {min_size}")
+        self._min_size = min_size
+        deltas = [delta.value if isinstance(delta, ScanDelta) else delta for delta in scans]
+        self._neighbours = tuple(dict.fromkeys(
+            d for dx, dy in deltas for d in ((dx, dy), (-dx, -dy))
+            ))
+        self._encoder = TileEncoder()
+
+    @property
+    def min_size(self) -> int:
+        """
+            Read only view of the minimum cluster size
+            :returns: minimum number of tiles in a cluster
+            :rtype: int
+        """
+        return self._min_size
+
+    def check_match(self, board: GameBoard, start_x: int, start_y: int) -> MatchCondition.MatchFound or None:
+        """
+            Check for a cluster containing the specified position
+            :arg board: the board to check a match for
+            :arg start_x: the x position of a tile in the cluster
+            :arg start_y: the y position of a tile in the cluster
+            :arg type: GameBoard
+            :arg type: int
+            :arg type: int
+            :returns: the cluster through (start_x, start_y) if large enough, None otherwise
+            :rtype: MatchFound or None
+        """
+        matches = self._find_through(board, [(start_x, start_y)])
+        return matches[0] if matches else None
+
+    def find_all(self, board: GameBoard, positions = None) -> [MatchCondition.MatchFound]:
+        """
+            Label every connected cluster in one breadth-first pass over the board.
+            When positions are given only the clusters containing them are explored
+            :arg board: the board to search
+            :arg positions: (x, y) positions clusters must contain; None searches the whole board
+            :arg type: GameBoard
+            :arg type: iterable or None
+            :returns: one MatchFound per cluster of at least min_size tiles
+            :rtype: list
+        """
+        if positions is not None:
+            return self._find_through(board, positions)
+        cols, rows = board.num_cols, board.num_rows
+        codes = self._encoder.encode(board).ravel().tolist() if self._eq is Tile.__eq__ else None
+        if codes is not None and self._encoder.agrees_with_tile_eq:
+            tiles = None
+            linked = lambda a, b: codes[a] == codes[b]
+            occupied = lambda a: codes[a] != TileEncoder.EMPTY
+        else: # subclass tiles: only the rule itself can tell if they match
+            tiles = list(board)
+            linked = lambda a, b: type(tiles[b]) != NullTile and bool(self._eq(tiles[a], tiles[b]))
+            occupied = lambda a: type(tiles[a]) != NullTile
+
+        visited = bytearray(cols * rows)
+        matches = []
+        for seed in range(cols * rows):
+            if visited[seed] or not occupied(seed):
+                continue
+            visited[seed] = 1
+            cluster = [seed]
+            frontier = deque(cluster)
+            while frontier:
+                cell = frontier.popleft()
+                i, j = divmod(cell, rows)
+                for dx, dy in self._neighbours:
+                    ni, nj = i + dx, j + dy
+                    if not (0 <= ni < cols and 0 <= nj < rows):
+                        continue
+                    neighbour = ni * rows + nj
+                    if not visited[neighbour] and linked(cell, neighbour):
+                        visited[neighbour] = 1
+                        cluster.append(neighbour)
+                        frontier.append(neighbour)
+            if len(cluster) >= self._min_size:
+                matches.append(self.MatchFound(self.point_value, [
+                    tiles[cell] if tiles is not None else board.tile_at(cell // rows + 1, cell % rows + 1)
+                    for cell in cluster
+                    ]))
+        LOGGER.info('Found %d clusters of at least %d tiles', len(matches), self._min_size)
+        return matches
+
+    def _find_through(self, board: GameBoard, positions) -> [MatchCondition.MatchFound]:
+        """
+            Flood fill from each position, reading only the tiles the clusters reach
+        """
+        cols, rows = board.num_cols, board.num_rows
+        visited = set()
+        matches = []
+        for x, y in positions:
+            seed = (x, y)
+            if seed in visited or not (1 <= seed[0] <= cols and 1 <= seed[1] <= rows):
+                continue
+            tile = board.tile_at(*seed)
+            if type(tile) == NullTile:
+                continue
+            visited.add(seed)
+            cluster = [tile]
+            frontier = deque([(seed, tile)])
+            while frontier:
+                (x, y), here = frontier.popleft()
+                for dx, dy in self._neighbours:
+                    near = (x + dx, y + dy)
+                    if near in visited or not (1 <= near[0] <= cols and 1 <= near[1] <= rows):
+                        continue
+                    there = board.tile_at(*near)
+                    if type(there) != NullTile and self._eq(here, there):
+                        visited.add(near)
+                        cluster.append(there)
+                        frontier.append((near, there))
+            if len(cluster) >= self._min_size:
+                matches.append(self.MatchFound(self.point_value, cluster))
+        LOGGER.info('Found %d clusters through the given positions', len(matches))
+        return matches
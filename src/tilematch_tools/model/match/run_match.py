@@ -0,0 +1,185 @@
+"""
+    :module_name: run_match
+    :module_summary: a match condition that finds runs of equal tiles across a whole board at once
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+from collections.abc import Iterable
+
+import numpy as np
+
+from . import MatchCondition, ScanDelta
+from ..board import GameBoard
+from ..board.encoding import TileEncoder
+from ..tiles import Tile, NullTile
+from ..exceptions import InvalidBoardPositionError
+
+LOGGER = logging.getLogger(__name__)
+
+class RunMatchCondition(MatchCondition):
+    """
+        Match condition satisfied by runs of at least run_length equal, non-null tiles
+        along any of the given scan directions. Opposite directions (e.g. UP and DOWN)
+        describe the same line and are only scanned once
+        :scan: a ScanDelta or an iterable of them
+        :value: points awarded per run
+        :run_length: the minimum number of tiles in a run
+        :equality_rule: the function the determines if two tiles match
+    """
+
+    def __init__(
+            self,
+            scan: ScanDelta or Iterable,
+            value: int,
+            run_length: int = 3,
+            equality_rule: callable = Tile.__eq__
+            ):
+        scans = (scan,) if isinstance(scan, ScanDelta) else tuple(scan)
+        super().__init__(scans, value, equality_rule)
+        if run_length < 2:
+            raise ValueError(f"run_length must be at least 2, not {run_length}")
+        self._run_length = run_length
+        self._axes = tuple(dict.fromkeys(self._axis_of(delta) for delta in scans))
+        self._encoder = TileEncoder()
+
+    @property
+    def run_length(self) -> int:
+        """
+            Read only view of the minimum run length
+            :returns: minimum number of tiles in a run
+            :rtype: int
+        """
+        return self._run_length
+
+    def check_match(self, board: GameBoard, start_x: int, start_y: int) -> MatchCondition.MatchFound or None:
+        """
+            Check for a run passing through the specified position
+            :arg board: the board to check a match for
+            :arg start_x: the x position the run must pass through
+            :arg start_y: the y position the run must pass through
+            :arg type: GameBoard
+            :arg type: int
+            :arg type: int
+            :returns: the first run found through (start_x, start_y), None otherwise
+            :rtype: MatchFound or None
+        """
+        for axis in self._axes:
+            run = self._run_through(board, start_x, start_y, axis)
+            if len(run) >= self._run_length:
+                return self.MatchFound(self.point_value, [board.tile_at(x, y) for x, y in run])
+        return None
+
+    def find_all(self, board: GameBoard, positions = None) -> [MatchCondition.MatchFound]:
+        """
+            Find every maximal run on the board in a single vectorized pass per axis.
+            When positions are given only the runs passing through them are examined
+            :arg board: the board to search
+            :arg positions: (x, y) positions runs must pass through; None searches the whole board
+            :arg type: GameBoard
+            :arg type: iterable or None
+            :returns: one MatchFound per run, tiles ordered along the scan axis
+            :rtype: list
+        """
+        if positions is not None:
+            return self._find_through(board, positions)
+        matches = []
+        codes = self._encoder.encode(board) if self._eq is Tile.__eq__ else None
+        if codes is not None and not self._encoder.agrees_with_tile_eq:
+            codes = None # subclass tiles: only Tile.__eq__ itself can tell if they match
+        for axis in self._axes:
+            same = self._same_as_next(board, codes, axis)
+            window = same
+            for step in range(1, self._run_length - 1):
+                window = window & _shifted(same, axis[0] * step, axis[1] * step, False)
+            starts = window & ~_shifted(window, -axis[0], -axis[1], False)
+            same = same.tolist()
+            for i, j in np.argwhere(starts).tolist():
+                run = [(i + 1, j + 1)]
+                while same[i][j]:
+                    i, j = i + axis[0], j + axis[1]
+                    run.append((i + 1, j + 1))
+                matches.append(
+                        self.MatchFound(self.point_value, [board.tile_at(x, y) for x, y in run])
+                        )
+        LOGGER.info('Found %d runs of at least %d tiles', len(matches), self._run_length)
+        return matches
+
+    def _find_through(self, board: GameBoard, positions) -> [MatchCondition.MatchFound]:
+        """
+            Walk the runs through each position, reporting each run once
+        """
+        runs = {}
+        for x, y in positions:
+            for axis in self._axes:
+                run = self._run_through(board, x, y, axis)
+                if len(run) >= self._run_length:
+                    runs.setdefault((axis, run[0]), run)
+        LOGGER.info('Found %d runs through the given positions', len(runs))
+        return [
+                self.MatchFound(self.point_value, [board.tile_at(x, y) for x, y in run])
+                for run in runs.values()
+                ]
+
+    def _same_as_next(self, board: GameBoard, codes: np.ndarray or None, axis: tuple) -> np.ndarray:
+        """
+            Build a mask that is true where a cell and its neighbour along axis are equal tiles
+        """
+        if codes is not None:
+            return (codes != TileEncoder.EMPTY) & (codes == _shifted(codes, *axis, TileEncoder.EMPTY))
+        same = np.zeros((board.num_cols, board.num_rows), dtype=np.bool_)
+        for x in range(1, board.num_cols + 1):
+            for y in range(1, board.num_rows + 1):
+                same[x - 1, y - 1] = self._tiles_match(board, (x, y), (x + axis[0], y + axis[1]))
+        return same
+
+    def _run_through(self, board: GameBoard, x: int, y: int, axis: tuple) -> [tuple]:
+        """
+            Walk both ways along axis from (x, y) and return the positions of the run through it
+        """
+        if not self._tiles_match(board, (x, y), (x, y)):
+            return []
+        start = (x, y)
+        while self._tiles_match(board, start, (start[0] - axis[0], start[1] - axis[1])):
+            start = (start[0] - axis[0], start[1] - axis[1])
+        run = [start]
+        while self._tiles_match(board, run[-1], (run[-1][0] + axis[0], run[-1][1] + axis[1])):
+            run.append((run[-1][0] + axis[0], run[-1][1] + axis[1]))
+        return run
+
+    def _tiles_match(self, board: GameBoard, here: tuple, there: tuple) -> bool:
+        """
+            True if both positions are on the board, hold non-null tiles and those tiles are equal
+        """
+        try:
+            this_tile = board.tile_at(*here)
+            that_tile = board.tile_at(*there)
+        except InvalidBoardPositionError:
+            return False
+        if type(this_tile) == NullTile or type(that_tile) == NullTile:
+            return False
+        return bool(self._eq(this_tile, that_tile))
+
+    @staticmethod
+    def _axis_of(delta: ScanDelta) -> tuple:
+        """
+            Normalize a scan direction so that opposite directions share one axis
+        """
+        dx, dy = delta.value if isinstance(delta, ScanDelta) else delta
+        return (dx, dy) if dx > 0 or (dx == 0 and dy > 0) else (-dx, -dy)
+
+
+def _shifted(arr: np.ndarray, dx: int, dy: int, fill) -> np.ndarray:
+    """
+        Return an array whose [i, j] entry is arr[i + dx, j + dy], or fill when that is off the board
+    """
+    out = np.full_like(arr, fill)
+    dst_x, src_x = _span(arr.shape[0], dx)
+    dst_y, src_y = _span(arr.shape[1], dy)
+    out[dst_x, dst_y] = arr[src_x, src_y]
+    return out
+
+def _span(size: int, offset: int) -> (slice, slice):
+    if offset >= 0:
+        return slice(0, max(size - offset, 0)), slice(offset, size)
+    return slice(-offset, size), slice(0, max(size + offset, 0))
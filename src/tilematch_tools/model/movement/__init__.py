@@ -7,15 +7,18 @@
 import logging
 from abc import ABC, abstractmethod
 
-from ..tiles import Tile, NullTile
+from ..tiles import Tile
 from ..board import GameBoard
 from ..exceptions import IllegalTileMovementException, InvalidBoardPositionError
+from ...tracing import HOT_PATH_LOGGING
 
 LOGGER = logging.getLogger(__name__)
 
 class MovementRule(ABC):
     """
-        Class that represents how a tile's position should adjust
+        Class that represents how a tile's position should adjust. Rules that override
+        destination let move skip blocked moves with plain board checks, instead of
+        applying them and reverting on the raised exception
         :arg callback: a callable object to be called after the movement is applied
     """
 
@@ -24,7 +27,7 @@ class MovementRule(ABC):
         self._origin_x = None
         self._origin_y = None
 
-    def move(self, board: GameBoard, tile_to_move: Tile, *callback_args) -> None:
+    def move(self, board: GameBoard, tile_to_move: Tile, *callback_args) -> bool:
         """
             Apply this movement rule to the given tile on the specific gameboard
             Then calls the callback if one exists
@@ -34,6 +37,8 @@ class MovementRule(ABC):
             :arg type: GameBoard
             :arg type: Tile
             :arg type: tuple
+            :returns: whether the tile moved
+            :rtype: bool
         """
         if not tile_to_move.mobile:
             LOGGER.error(
@@ -41,31 +46,81 @@ class MovementRule(ABC):
                     tile_to_move.position.x,
                     tile_to_move.position.y
                     )
-            return
+            return False
+        if not self.can_move(board, tile_to_move):
+            if HOT_PATH_LOGGING:
+                LOGGER.info(
+                        'Movement rule %s is blocked for tile at (%d, %d)',
+                        str(self),
+                        tile_to_move.position.x,
+                        tile_to_move.position.y
+                        )
+            if self._after:
+                self._after(*callback_args)
+            return False
+        moved = False
         self._origin_x = tile_to_move.position.x
         self._origin_y = tile_to_move.position.y
         try:
-            LOGGER.info(
-                    'Attempting to move tile at (%d, %d)', 
-                    tile_to_move.position.x,
-                    tile_to_move.position.y
-                    )
+            if HOT_PATH_LOGGING:
+                LOGGER.info(
+                        'Attempting to move tile at (%d, %d)',
+                        tile_to_move.position.x,
+                        tile_to_move.position.y
+                        )
             self.apply(board, tile_to_move)
         except (IllegalTileMovementException, InvalidBoardPositionError):
             LOGGER.error('Could not apply movement rule %s. Reverting tile state', str(self))
             self.revert(board, tile_to_move)
         else:
-            LOGGER.info(
-                    'Tile successfully moved from (%d, %d) -> (%d, %d)',
-                    self._origin_x,
-                    self._origin_y,
-                    tile_to_move.position.x,
-                    tile_to_move.position.y
-                    )
+            moved = True
+            if HOT_PATH_LOGGING:
+                LOGGER.info(
+                        'Tile successfully moved from (%d, %d) -> (%d, %d)',
+                        self._origin_x,
+                        self._origin_y,
+                        tile_to_move.position.x,
+                        tile_to_move.position.y
+                        )
             self._mark_null(board)
         finally:
             if self._after:
                 self._after(*callback_args)
+        return moved
+
+    def can_move(self, board: GameBoard, tile_to_move: Tile) -> bool:
+        """
+            Dry run of this movement rule: whether it could move the tile, answered with
+            board checks alone, so nothing is raised, logged or changed. Rules that do not
+            override destination cannot be checked ahead and are assumed to be able to move
+            :arg board: gameboard the move would be made on
+            :arg tile_to_move: tile that would be moved
+            :arg type: GameBoard
+            :arg type: Tile
+            :returns: false if the move would fail, true otherwise
+            :rtype: bool
+        """
+        if not tile_to_move.mobile:
+            return False
+        target = self.destination(board, tile_to_move)
+        if target is None:
+            return True
+        x, y = target
+        position = tile_to_move.position
+        return (x == position.x and y == position.y) or board.is_available(x, y)
+
+    def destination(self, board: GameBoard, tile_to_move: Tile) -> (int, int):
+        """
+            Where apply would put the tile, without moving it. Override this alongside
+            apply to enable can_move; the default does not know
+            :arg board: gameboard the move would be made on
+            :arg tile_to_move: tile that would be moved
+            :arg type: GameBoard
+            :arg type: Tile
+            :returns: the target (x, y), or None if it cannot be known ahead
+            :rtype: tuple or None
+        """
+        return None
 
     @abstractmethod
     def apply(self, board: GameBoard, tile_to_move: Tile) -> None:
@@ -92,12 +147,6 @@ class MovementRule(ABC):
         tile_to_move.position = (self._origin_x, self._origin_y)
 
     def _mark_null(self, board: GameBoard):
-        LOGGER.info('Marking (%d, %d) with a null tile', self._origin_x, self._origin_y)
-        board.place_tile(
-                NullTile(
-                    **{
-                        'position': (self._origin_x, self._origin_y),
-                        'color': '#D3D3D3'
-                    }
-                )
-        )
+        if HOT_PATH_LOGGING:
+            LOGGER.info('Marking (%d, %d) with a null tile', self._origin_x, self._origin_y)
+        board.clear_tile(self._origin_x, self._origin_y)
@@ -6,8 +6,10 @@
 
 import logging
 from abc import ABC, abstractmethod
+from operator import attrgetter
 
 from ..match import MatchCondition
+from ...tracing import hot_property
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,7 +20,7 @@ class Scoring(ABC):
         self._points = 0
         self._multiplier = 1
 
-    @property
+    @hot_property(attrgetter('_points'))
     def score(self) -> int:
         """
             read only view of current score
@@ -28,7 +30,7 @@ class Scoring(ABC):
         LOGGER.debug('Request read of score with value: %d', self._points)
         return self._points
 
-    @property
+    @hot_property(attrgetter('_multiplier'))
     def multiplier(self) -> int:
         """
             read only view of score multiplier
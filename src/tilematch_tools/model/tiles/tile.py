@@ -5,15 +5,18 @@
 """
 
 import logging
+from functools import cache
+from operator import attrgetter
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from .tile_appearance import TileAppearance, TileShape, TileColor
 from ..exceptions import MissingTilePropertyException
+from ...tracing import HOT_PATH_LOGGING, hot_property
 
 LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
         A class that represents a position on a 2d plane
@@ -23,8 +26,13 @@ class Position:
 
 class Tile(ABC):
     """
-        A class the represents a tile in a tile-matching game
+        A class the represents a tile in a tile-matching game.
+        Tiles use __slots__ so a board full of them carries no per-tile __dict__;
+        subclasses that do not declare __slots__ themselves get one back as usual.
+        A board storing a tile sets its _placed_on slot, so in-place appearance
+        changes (e.g. a new border) reach the board's change journals
     """
+    __slots__ = ('_position', '_appearance', '_movable', '_placed_on')
 
     def __init__(self, **properties):
         if not properties.get('position'):
@@ -33,7 +41,7 @@ class Tile(ABC):
                     f"{type(self)} requires a `position` property but was not present"
                     )
         self._position = Position(*properties.get('position'))
-        self._appearance = TileAppearance(
+        self._appearance = TileAppearance.intern(
                     properties.get('color', TileColor.RED),
                     properties.get('shape', TileShape.SQUARE),
                     properties.get('border', TileColor.GRAY)
@@ -63,7 +71,14 @@ class Tile(ABC):
             return False
         return self.color == other.color and self.shape == other.shape
 
-    @property
+    def __getstate__(self):
+        """Tiles are pickled and copied without the board they are placed on"""
+        state = super().__getstate__()
+        if isinstance(state, tuple) and '_placed_on' in state[1]:
+            state = (state[0], {name: value for name, value in state[1].items() if name != '_placed_on'})
+        return state
+
+    @hot_property(attrgetter('_position'))
     def position(self) -> Position:
         """
             Return the position of this tile
@@ -73,7 +88,33 @@ class Tile(ABC):
         LOGGER.debug('Requested read of position is: %s', str(self._position))
         return self._position
 
-    @property
+    def copy_at(self, x: int, y: int) -> 'Tile':
+        """
+            A copy of this tile placed at (x, y). The copy has its own position,
+            shares this tile's immutable appearance and is not stored on any board yet
+            :arg x: the x value of the copy's position
+            :arg y: the y value of the copy's position
+            :arg type: int
+            :arg type: int
+            :returns: the copy
+            :rtype: Tile
+        """
+        cls = type(self)
+        duplicate = cls.__new__(cls)
+        for name in _slots_of(cls):
+            if name == '_placed_on':
+                continue
+            try:
+                setattr(duplicate, name, getattr(self, name))
+            except AttributeError:
+                pass # an optional slot left unset
+        state = getattr(self, '__dict__', None)
+        if state:
+            duplicate.__dict__.update(state)
+        duplicate._position = Position(x, y)
+        return duplicate
+
+    @hot_property(attrgetter('_movable'))
     def mobile(self) -> bool:
         """
             Returns whether a tile can move
@@ -92,44 +133,100 @@ class Tile(ABC):
             :returns: nothing
             :rtype: None
         """
-        LOGGER.debug('Updating position: (%d, %d) -> (%d, %d)',
-                     self._position.x,
-                     self._position.y,
-                     new_pos[0],
-                     new_pos[1]
-                     )
+        if HOT_PATH_LOGGING:
+            LOGGER.debug('Updating position: (%d, %d) -> (%d, %d)',
+                         self._position.x,
+                         self._position.y,
+                         new_pos[0],
+                         new_pos[1]
+                         )
         self._position.x = new_pos[0]
         self._position.y = new_pos[1]
 
-    @property
+    @hot_property(attrgetter('_appearance.color'))
     def color(self):
         LOGGER.debug('Requested read of tile color is: %s', str(self._appearance.color))
         return self._appearance.color
 
-    @property
+    @hot_property(attrgetter('_appearance.shape'))
     def shape(self):
         LOGGER.debug('Requested read of tile shape is: %s', str(self._appearance.shape))
         return self._appearance.shape
-    @property
+
+    @hot_property(attrgetter('_appearance.border'))
     def border(self):
         LOGGER.debug('Requested read of tile border is: %s', str(self._appearance.border))
         return self._appearance.border
     
     @border.setter
     def border(self, color: TileColor):
-        """Sets the border color
+        """Sets the border color, telling the board the tile is placed on, if any
 
         Args:
             color (TileColor): border color to set to
         """
-        LOGGER.debug('Requested read of tile border is: %s', str(self._appearance.border))
-        self._appearance.border = color
+        LOGGER.debug('Updating tile border: %s -> %s', str(self._appearance.border), str(color))
+        self._appearance = TileAppearance.intern(self._appearance.color, self._appearance.shape, color)
+        board = getattr(self, '_placed_on', None)
+        if board is not None:
+            board.tile_changed(self)
 
 
 class NullTile(Tile):
     """
         A class that represents the absence of a tile
     """
+    __slots__ = ()
+    EMPTY_COLOR = TileColor.LIGHT_GRAY
+
     def __init__(self, **properties):
         super().__init__(**properties)
         self._movable = False
+
+    @classmethod
+    def blank(cls, x: int, y: int) -> 'NullTile':
+        """
+            Create a null tile with the default empty appearance
+            :arg x: the x value of the tile's position
+            :arg y: the y value of the tile's position
+            :arg type: int
+            :arg type: int
+            :returns: the new null tile
+            :rtype: NullTile
+        """
+        if cls is not NullTile: # subclasses may initialize more than appearance
+            return cls(**{'position': (x, y), 'color': cls.EMPTY_COLOR})
+        tile = cls.__new__(cls)
+        tile._position = Position(x, y)
+        tile._appearance = _BLANK_APPEARANCE
+        tile._movable = False
+        return tile
+
+    def is_blank_at(self, x: int, y: int) -> bool:
+        """
+            Check that this tile still looks like a tile made by blank(x, y),
+            so a board can keep sharing it as the empty marker of (x, y)
+            :arg x: the expected x value of the position
+            :arg y: the expected y value of the position
+            :arg type: int
+            :arg type: int
+            :returns: true if position and appearance are untouched, false otherwise
+            :rtype: bool
+        """
+        return (
+                self._position.x == x and self._position.y == y
+                and self._appearance is _BLANK_APPEARANCE
+                )
+
+@cache
+def _slots_of(cls: type) -> (str,):
+    """
+        Every slot a tile class declares, its own and inherited ones, so copies can fill them
+    """
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ('__dict__', '__weakref__'))
+
+_BLANK_APPEARANCE = TileAppearance.intern(NullTile.EMPTY_COLOR, TileShape.SQUARE, TileColor.GRAY)
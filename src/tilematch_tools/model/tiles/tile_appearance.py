@@ -27,11 +27,33 @@ class TileColor(StrEnum):
     GRAY = '#808080'
     LIGHT_GRAY = '#D3D3D3'
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TileAppearance(ABC):
     """
-        Class that stores appearance information of a tile
+        Class that stores appearance information of a tile.
+        Appearances are immutable so that tiles looking alike can share one instance, see intern
     """
     color: TileColor
     shape: TileShape
     border: TileColor
+
+    @classmethod
+    def intern(cls, color: TileColor, shape: TileShape, border: TileColor) -> 'TileAppearance':
+        """
+            Return the shared appearance with the given properties, creating it on first use
+            :arg color: the fill color
+            :arg shape: the shape
+            :arg border: the border color
+            :arg type: TileColor
+            :arg type: TileShape
+            :arg type: TileColor
+            :returns: the one appearance instance for (color, shape, border)
+            :rtype: TileAppearance
+        """
+        key = (cls, color, shape, border)
+        appearance = _INTERNED.get(key)
+        if appearance is None:
+            appearance = _INTERNED[key] = cls(color, shape, border)
+        return appearance
+
+_INTERNED = {}
@@ -6,23 +6,37 @@
 
 import logging
 from dataclasses import dataclass
+from operator import attrgetter
 
 from .tile import Tile, Position
 from ..exceptions import TileGroupDisbandedException, TileGroupPositionOccupiedError
+from ...tracing import HOT_PATH_LOGGING, hot_property
 
 LOGGER = logging.getLogger(__name__)
 
+ORIENTATIONS = 4
+
+def _turned(dx: int, dy: int, turns: int) -> (int, int):
+    """An offset rotated by quarter turns counterclockwise"""
+    for _ in range(turns % ORIENTATIONS):
+        dx, dy = -dy, dx
+    return dx, dy
+
 class TileGroup:
     """
-        A class that allows individual tiles to exist as a group
+        A class that allows individual tiles to exist as a group. A placed group moves
+        and rotates about its center tile as one unit: the whole target footprint is
+        checked against the board first, then every tile is committed at once
     """
 
     def __init__(self, center_tile: Tile):
         self._center = center_tile
         self._disbanded = False
+        self._orientation = 0
         self._tiles = {
                 (0, 0): self._center
                 }
+        self._masks = None
 
     def add_sibling_tile(self, new_tile: Tile, dx: int, dy: int) -> None:
         """
@@ -41,14 +55,15 @@ class TileGroup:
         if self.disbanded:
             LOGGER.error('Attempted to add a sibling to a disbanded group')
             raise TileGroupDisbandedException("Cannot add a sibling Tile to a disbanded TileGroup")
-        if self._tiles.get((dx, dy)):
+        if self._tiles.get(_turned(dx, dy, -self._orientation)):
             LOGGER.error('Attempted to add a sibling to a relative position that is already occupied')
             raise TileGroupPositionOccupiedError(
                     f"Relative position ({dx}, {dy}) is occupied by another tile"
                     )
         LOGGER.info('Adding sibling tile (%d, %d) offset from center', dx, dy)
         new_tile.position = (self._center.position.x + dx, self._center.position.y + dy)
-        self._tiles[(dx, dy)] = new_tile
+        self._tiles[_turned(dx, dy, -self._orientation)] = new_tile
+        self._masks = None
 
     """Deprecated
     def move(self, rule: MovementRule) -> None:
@@ -63,7 +78,136 @@ class TileGroup:
             tile.move(rule)
     """
 
-    @property
+    def shift(self, board: 'GameBoard', dx: int, dy: int) -> bool:
+        """
+            Move the whole group by an offset if every tile's target is free or left by
+            another tile of the group
+            :arg board: the board the group is placed on
+            :arg dx: horizontal offset
+            :arg dy: vertical offset
+            :arg type: GameBoard
+            :arg type: int
+            :arg type: int
+            :returns: whether the group moved
+            :rtype: bool
+            :raises: TileGroupDisbandedException if this tile group has disbanded
+        """
+        return self._commit(board, dx, dy, 0)
+
+    def rotate(self, board: 'GameBoard', turns: int = 1) -> bool:
+        """
+            Rotate the group about its center tile, if every tile's target is free or
+            left by another tile of the group
+            :arg board: the board the group is placed on
+            :arg turns: quarter turns, counterclockwise if positive and clockwise if negative
+            :arg type: GameBoard
+            :arg type: int
+            :returns: whether the group rotated
+            :rtype: bool
+            :raises: TileGroupDisbandedException if this tile group has disbanded
+        """
+        return self._commit(board, 0, 0, turns)
+
+    def can_shift(self, board: 'GameBoard', dx: int, dy: int) -> bool:
+        """
+            Dry run of shift, answered with board checks alone
+            :arg board: the board the group is placed on
+            :arg dx: horizontal offset
+            :arg dy: vertical offset
+            :arg type: GameBoard
+            :arg type: int
+            :arg type: int
+            :returns: whether shift would move the group
+            :rtype: bool
+        """
+        return self._fits(board, dx, dy, 0)
+
+    def can_rotate(self, board: 'GameBoard', turns: int = 1) -> bool:
+        """
+            Dry run of rotate, answered with board checks alone
+            :arg board: the board the group is placed on
+            :arg turns: quarter turns, counterclockwise if positive and clockwise if negative
+            :arg type: GameBoard
+            :arg type: int
+            :returns: whether rotate would turn the group
+            :rtype: bool
+        """
+        return self._fits(board, 0, 0, turns)
+
+    def footprint(self, dx: int = 0, dy: int = 0, turns: int = 0) -> [(int, int)]:
+        """
+            The positions the group's tiles would cover after shifting and rotating
+            :arg dx: horizontal offset
+            :arg dy: vertical offset
+            :arg turns: quarter turns, counterclockwise if positive
+            :arg type: int
+            :arg type: int
+            :arg type: int
+            :returns: one (x, y) per tile, in the order tiles were added
+            :rtype: list
+        """
+        offsets, _ = self._mask((self._orientation + turns) % ORIENTATIONS)
+        cx = self._center.position.x + dx
+        cy = self._center.position.y + dy
+        return [(cx + ox, cy + oy) for ox, oy in offsets]
+
+    def _fits(self, board: 'GameBoard', dx: int, dy: int, turns: int) -> bool:
+        """
+            Check the target footprint in one pass: its bounding box against the board
+            edges, then each cell the group does not already cover for occupancy
+        """
+        orientation = (self._orientation + turns) % ORIENTATIONS
+        offsets, (left, right, bottom, top) = self._mask(orientation)
+        cx = self._center.position.x + dx
+        cy = self._center.position.y + dy
+        if cx + left < 1 or cx + right > board.num_cols or cy + bottom < 1 or cy + top > board.num_rows:
+            return False
+        if not all(tile.mobile for tile in self._tiles.values()):
+            return False
+        covered = set(self.footprint())
+        return all(
+                (cx + ox, cy + oy) in covered or board.is_available(cx + ox, cy + oy)
+                for ox, oy in offsets
+                )
+
+    def _commit(self, board: 'GameBoard', dx: int, dy: int, turns: int) -> bool:
+        if self.disbanded:
+            LOGGER.error('Attempted to move a disbanded group')
+            raise TileGroupDisbandedException("Cannot move a disbanded TileGroup")
+        if not self._fits(board, dx, dy, turns):
+            if HOT_PATH_LOGGING:
+                LOGGER.info('Tile group is blocked from moving (%d, %d) and turning %d', dx, dy, turns)
+            return False
+        targets = self.footprint(dx, dy, turns)
+        board.relocate([(tile, x, y) for tile, (x, y) in zip(self._tiles.values(), targets)])
+        self._orientation = (self._orientation + turns) % ORIENTATIONS
+        return True
+
+    def _mask(self, orientation: int) -> (tuple, tuple):
+        """
+            The offsets of every tile in an orientation and their bounding box, computed
+            for all orientations once per group layout
+        """
+        if self._masks is None:
+            self._masks = []
+            for turns in range(ORIENTATIONS):
+                offsets = tuple(_turned(dx, dy, turns) for dx, dy in self._tiles)
+                xs = [ox for ox, _ in offsets]
+                ys = [oy for _, oy in offsets]
+                self._masks.append((offsets, (min(xs), max(xs), min(ys), max(ys))))
+        return self._masks[orientation]
+
+    @hot_property(attrgetter('_orientation'))
+    def orientation(self) -> int:
+        """
+            Quarter turns counterclockwise the group has rotated since it was formed
+            :returns: 0 to 3
+            :rtype: int
+        """
+        LOGGER.debug('Requested read of orientation property is: %d', self._orientation)
+        return self._orientation
+
+    @hot_property(attrgetter('_disbanded'))
     def disbanded(self) -> bool:
         """
             Determines if this tile group has disbanded
@@ -73,7 +217,7 @@ class TileGroup:
         LOGGER.debug('Requested read of disbanded property is: %s', str(self._disbanded))
         return self._disbanded
 
-    @property
+    @hot_property(lambda self: len(self._tiles))
     def size(self) -> int:
         """
             Returns the number of tiles in this group
@@ -0,0 +1,34 @@
+"""
+    :module_name: tracing
+    :module_summary: an import time switch that removes logging from model hot paths
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+
+    Property reads such as Tile.position happen millions of times per game, so even a
+    disabled LOGGER.debug call with its eagerly built arguments dominates their cost.
+    HOT_PATH_LOGGING is read once from the `hotpathlog` environment variable (on/off),
+    defaulting to on only when `logconf` is `develop`. Modules consult it while they are
+    imported, so changing it afterwards has no effect.
+"""
+
+import os
+
+HOT_PATH_LOGGING = os.getenv(
+        'hotpathlog',
+        'on' if os.getenv('logconf', 'release') == 'develop' else 'off'
+        ).lower() == 'on'
+
+def hot_property(untraced: callable, enabled: bool = HOT_PATH_LOGGING) -> callable:
+    """
+        Build a read-only property from a logging getter, swapped once for untraced
+        when hot path logging is off. Use it in place of @property
+        :arg untraced: the getter to use when hot path logging is off,
+            e.g. operator.attrgetter('_position')
+        :arg enabled: whether hot path logging is on
+        :arg type: callable
+        :arg type: bool
+        :returns: a decorator turning the logging getter into a property
+        :rtype: callable
+    """
+    def decorator(traced: callable) -> property:
+        return property(traced if enabled else untraced, doc=traced.__doc__)
+    return decorator
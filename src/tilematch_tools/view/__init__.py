@@ -2,11 +2,41 @@
     :module_name: view
     :module_summary: a module responsible for the view of the tile game
     :module_author: Matthew Isayan, Nathan Mendoza
+
+    Every Tk-based view is imported on first use, so headless code can import
+    this package (e.g. for NullView) on hosts without tkinter
 """
 
-from .game_event import GameEvent, MouseEvent
-from .game_widgets import GameWidget, GameInfo
-from .score_view import ScoreView
-from .board_view import BoardView
-from .game_view import GameView
-from .game_title import GameTitle
+import importlib
+
+from .null_view import NullView
+
+_LAZY_EXPORTS = {
+        'GameEvent': '.game_event',
+        'MouseEvent': '.game_event',
+        'GameWidget': '.game_widgets',
+        'GameInfo': '.game_widgets',
+        'ScoreView': '.score_view',
+        'BoardView': '.board_view',
+        'RasterBoardView': '.raster_board_view',
+        'GameView': '.game_view',
+        'GameTitle': '.game_title'
+        }
+
+__all__ = ['NullView', *_LAZY_EXPORTS]
+
+def __getattr__(name: str):
+    """
+        Import Tk-based views the first time they are requested
+        :arg name: the attribute being looked up
+        :returns: the exported object
+        :raises: AttributeError if name is not exported by this package
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -18,17 +18,33 @@ class BoundingBox:
     end_y: int
 
 class BoardView(GameInfo):
-    """GUI widget for displaying a tilematching game board"""
+    """
+        GUI widget for displaying a tilematching game board. Only positions recorded in the
+        board's change journal are redrawn. Placed tiles record their own border changes;
+        other in-place edits show up once the board is told with mark_changed
+    """
     tile_side_length = 30
 
     def __init__(self, parent, board_to_watch: GameBoard, **options):
         self._watching = board_to_watch
+        self._changes = board_to_watch.open_journal()
         super().__init__(parent, **options)
 
     def update(self):
+        """Redraw only the tiles whose positions changed since the last update"""
+        for x, y in self._changes.drain():
+            self._update_tile(self.watching.tile_at(x, y))
+
+    def needs_update(self):
+        """Only positions changed since the last update need redrawing"""
+        return bool(self._changes.pending)
+
+    def refresh(self):
+        """Redraw every tile on the board, regardless of what changed"""
+        self._changes.drain()
         for tile in self.watching:
             self._update_tile(tile)
-        
+
 
     @property
     def watching(self):
@@ -53,6 +69,41 @@ class BoardView(GameInfo):
 
         return self._tiles_map
 
+    @property
+    def item_positions(self):
+        """
+            Inverse of tiles_map: the board position drawn by each canvas item
+            :returns: canvas item id -> (x, y)
+            :rtype: dict
+        """
+        if not hasattr(self, '_item_positions'):
+            self._item_positions = {}
+
+        return self._item_positions
+
+    def position_at(self, px: int, py: int, clamp: bool = False) -> (int, int) or None:
+        """
+            Hit test a canvas pixel, computing the board position drawn there from the tile size
+            :arg px: horizontal canvas coordinate, e.g. event.x
+            :arg py: vertical canvas coordinate, e.g. event.y
+            :arg clamp: when true, pixels outside the board map to the nearest position
+            :arg type: int
+            :arg type: int
+            :arg type: bool
+            :returns: the (x, y) board position, None if the pixel is outside the board
+            :rtype: tuple or None
+        """
+        x = int(px // self.tile_side_length) + 1
+        y = int((self.board_height - py - 1) // self.tile_side_length) + 1
+        if clamp:
+            return (
+                    min(max(x, 1), self.watching.num_cols),
+                    min(max(y, 1), self.watching.num_rows)
+                    )
+        if 1 <= x <= self.watching.num_cols and 1 <= y <= self.watching.num_rows:
+            return (x, y)
+        return None
+
     def create_widgets(self):
         self._board_display = tk.Canvas(self, width=self.board_width, height=self.board_height)
         self._init_board()
@@ -74,7 +125,8 @@ class BoardView(GameInfo):
 
     def _create_tile(self, tile):
         bbox = self.bbox_for_tile(tile)
-        self.tiles_map[(tile.position.x, tile.position.y)] = self._board_display.create_rectangle(
+        position = (tile.position.x, tile.position.y)
+        self.tiles_map[position] = self._board_display.create_rectangle(
                 bbox.start_x, 
                 bbox.start_y, 
                 bbox.end_x,
@@ -83,9 +135,9 @@ class BoardView(GameInfo):
                 outline=tile.border, 
                 width=1
             )
+        self.item_positions[self.tiles_map[position]] = position
 
     def _update_tile(self, tile):
-        bbox = self.bbox_for_tile(tile)
         self._board_display.itemconfig(
                 self.tiles_map.get((tile.position.x, tile.position.y)),
                 fill=tile.color,
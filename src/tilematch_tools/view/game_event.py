@@ -43,9 +43,11 @@ class MouseEvent(GameEvent):
         self.board_display = board_clicked_on
 
     def __call__(self, event):
-        object_clicked_on = event.widget.find_closest(event.x, event.y)
-        if object_clicked_on:
-            for tile, drawing in self.board_display.tiles_map.items():
-                if drawing == object_clicked_on[0]:
-                    return tile
-             
+        """
+            Find the board position that was clicked on
+            :arg event: the mouse event on the board's canvas
+            :arg type: tk.Event
+            :returns: the (x, y) position under the pointer, or the closest one
+            :rtype: tuple
+        """
+        return self.board_display.position_at(event.x, event.y, clamp=True)
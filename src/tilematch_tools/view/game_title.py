@@ -30,3 +30,6 @@ class GameTitle(GameInfo):
 
     def update(self):
         pass
+
+    def needs_update(self):
+        return False
@@ -13,21 +13,30 @@ from .board_view import BoardView
 from .game_widgets import GameWidget
 from .game_event import GameEvent
 from .game_title import GameTitle
+from .input_dispatch import InputDispatcher, KEY, CLICK
 
-class GameView(GameWidget):
+class GameView(InputDispatcher, GameWidget):
     """
-        GUI widget for displaying a game's widgets
+        GUI widget for displaying a game's widgets. Bound handlers receive their
+        events through dispatch
+        :board_view_class: the widget drawing the board; set it to RasterBoardView
+            in a subclass for boards too large for one canvas item per cell
+        :QUEUE_INPUT: set it in a subclass to handle input in one batch per tick,
+            coalescing held keys, instead of inside each Tk callback
     """
+    board_view_class = BoardView
 
     def __init__(self, parent, game_to_watch: GameState, game_title=None):
         self._game = game_to_watch
         self._title = game_title
+        self._blocked = False
+        self._init_handlers()
         super().__init__(parent)
 
     def create_widgets(self):
         self._game_widgets  = {
                 'score': ScoreView(self, self._game.score),
-                'board': BoardView(self, self._game.board),
+                'board': self.board_view_class(self, self._game.board),
                 'title': GameTitle(self, self._title if self._title else 'A Game')
             }
 
@@ -38,10 +47,19 @@ class GameView(GameWidget):
 
     def update(self):
         if self._game.gameover():
-            self._block_board()
+            if not self._blocked:
+                self._block_board()
+                self._blocked = True
             return
         for w in self._game_widgets.values():
-            w.update()
+            if w.needs_update():
+                w.update()
+
+    def needs_update(self):
+        """Only widgets that have something new to show are updated"""
+        if self._game.gameover():
+            return not self._blocked
+        return any(w.needs_update() for w in self._game_widgets.values())
 
     @property
     def board_view(self):
@@ -52,10 +70,14 @@ class GameView(GameWidget):
         return self._game_widgets['score']
 
     def bind_key(self, key_sequence: str, handler: GameEvent) -> None:
-        self.bind_all(key_sequence, handler)
+        self.key_handlers[key_sequence] = handler
+        self.bind_all(key_sequence, lambda event: self.dispatch(KEY, key_sequence, event))
 
     def bind_click(self, mouse_button: str, handler: GameEvent) -> None:
-        self._game_widgets['board'].showing.bind(mouse_button, handler)
+        self.click_handlers[mouse_button] = handler
+        self._game_widgets['board'].showing.bind(
+                mouse_button, lambda event: self.dispatch(CLICK, mouse_button, event)
+                )
 
     def _block_board(self):
         board = self._game_widgets['board']
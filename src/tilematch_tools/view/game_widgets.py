@@ -24,6 +24,12 @@ class GameWidget(tk.Frame):
         """
         raise NotImplementedError(f'No implementation for {self.update}')
 
+    def needs_update(self) -> bool:
+        """
+            Whether update would change what the widget shows. Render schedulers skip
+            widgets that return false; by default a widget always needs updating
+        """
+        return True
 
     def create_widgets(self):
         """
@@ -0,0 +1,111 @@
+"""
+    :module_name: input_dispatch
+    :module_summary: delivery of key and click events to a view's bound handlers
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+KEY = 'key'
+CLICK = 'click'
+
+class InputDispatcher:
+    """
+        Mixin for views that keeps the handlers bound to each key sequence and mouse
+        button, and routes every event through dispatch, so recorders and replayers
+        see exactly the input the handlers do
+        :recorder: when set, told about every event before its handler runs
+        :on_delivered: when set, called with no arguments after every handler runs, e.g. so
+            an engine can redraw what the handler changed without waiting for the next tick
+        :QUEUE_INPUT: when true, events are queued as they arrive and handled together
+            by process_input, which the game loop calls right before each tick
+        :COALESCE: kinds of queued events dropped when they repeat the event queued
+            just before them, e.g. a held key's auto-repeat
+        :MAX_QUEUED_INPUT: the most events queued between two ticks; later ones are dropped
+    """
+    recorder = None
+    on_delivered = None
+    QUEUE_INPUT = False
+    COALESCE = frozenset({KEY})
+    MAX_QUEUED_INPUT = 16
+
+    def _init_handlers(self) -> None:
+        self.key_handlers = {}
+        self.click_handlers = {}
+        self._queued = []
+        self._last_queued = None
+
+    def dispatch(self, kind: str, sequence: str, event):
+        """
+            Deliver an event to the handler bound to its key sequence or mouse button,
+            or queue it for the next tick if QUEUE_INPUT is set
+            :arg kind: KEY or CLICK
+            :arg sequence: the key sequence or mouse button the handler is bound to
+            :arg event: the Tk event, or anything with the attributes the handler reads
+            :arg type: str
+            :arg type: str
+            :arg type: tk.Event
+            :returns: whatever the handler returns, None if the event was queued
+            :rtype: object
+        """
+        if not self.QUEUE_INPUT:
+            return self.deliver(kind, sequence, event)
+        if sequence not in (self.key_handlers if kind == KEY else self.click_handlers):
+            raise KeyError(sequence)
+        if kind in self.COALESCE:
+            identity = (kind, sequence, getattr(event, 'keysym', None), getattr(event, 'x', None), getattr(event, 'y', None))
+            if identity == self._last_queued:
+                return None
+            self._last_queued = identity
+        else:
+            self._last_queued = None
+        if len(self._queued) >= self.MAX_QUEUED_INPUT:
+            LOGGER.debug('Dropped %s %s: %d events are already queued', kind, sequence, len(self._queued))
+            return None
+        self._queued.append((kind, sequence, event))
+        return None
+
+    def deliver(self, kind: str, sequence: str, event):
+        """
+            Run the handler bound to an event's key sequence or mouse button now, telling the
+            recorder first and on_delivered after
+            :arg kind: KEY or CLICK
+            :arg sequence: the key sequence or mouse button the handler is bound to
+            :arg event: the Tk event, or anything with the attributes the handler reads
+            :arg type: str
+            :arg type: str
+            :arg type: tk.Event
+            :returns: whatever the handler returns
+            :rtype: object
+        """
+        handler = (self.key_handlers if kind == KEY else self.click_handlers)[sequence]
+        if self.recorder is not None:
+            self.recorder.record(kind, sequence, event)
+        try:
+            return handler(event)
+        finally:
+            if self.on_delivered is not None:
+                self.on_delivered()
+
+    def process_input(self) -> int:
+        """
+            Deliver every queued event, in the order they arrived
+            :returns: the number of events delivered
+            :rtype: int
+        """
+        queued, self._queued = self._queued, []
+        self._last_queued = None
+        for kind, sequence, event in queued:
+            self.deliver(kind, sequence, event)
+        return len(queued)
+
+    @property
+    def queued_input(self) -> int:
+        """
+            Number of events waiting for the next tick
+            :returns: event count
+            :rtype: int
+        """
+        return len(self._queued)
@@ -0,0 +1,40 @@
+"""
+    :module_name: null_view
+    :module_summary: a view that displays nothing, for games running without a display
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+from ..core import GameState
+from .input_dispatch import InputDispatcher
+
+class NullView(InputDispatcher):
+    """
+        Stand-in for GameView that draws nothing. Key and click handlers are kept
+        so bots and tests can fire them directly or through dispatch
+        :arg parent: ignored, accepted for parity with GameView
+        :arg game_to_watch: the game state this view stands in for
+    """
+
+    def __init__(self, parent, game_to_watch: GameState, game_title=None):
+        self._game = game_to_watch
+        self._title = game_title
+        self._init_handlers()
+
+    def update(self) -> None:
+        """Nothing to draw"""
+
+    def needs_update(self) -> bool:
+        """Nothing to draw"""
+        return False
+
+    def grid(self, *args, **options) -> None:
+        """Nothing to place"""
+
+    def pack(self, *args, **options) -> None:
+        """Nothing to place"""
+
+    def bind_key(self, key_sequence: str, handler) -> None:
+        self.key_handlers[key_sequence] = handler
+
+    def bind_click(self, mouse_button: str, handler) -> None:
+        self.click_handlers[mouse_button] = handler
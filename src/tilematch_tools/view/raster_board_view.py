@@ -0,0 +1,119 @@
+"""
+    :module_name: raster_board_view
+    :module_summary: GUI widget drawing a whole tilematching game board into a single image
+    :module_author: Nathan Mendoza (nathancm@uci.edu)
+"""
+
+import tkinter as tk
+
+from .board_view import BoardView
+
+class CellPainter:
+    """
+        Builds Tk photo image data for rows of tiles. Each tile is a square of
+        side pixels filled with its color and outlined one pixel wide in its border color
+        :arg side: the side length of a tile in pixels, at least 2
+    """
+
+    def __init__(self, side: int):
+        self._side = max(side, 2)
+        self._cells = {}
+
+    @property
+    def side(self) -> int:
+        return self._side
+
+    def data_for(self, tiles: list) -> str:
+        """
+            Image data for a horizontal run of tiles, suitable for PhotoImage.put
+            :arg tiles: adjacent tiles, left to right
+            :arg type: list
+            :returns: side rows of pixel colors covering every tile in the run
+            :rtype: str
+        """
+        cells = [self._cell(tile.color, tile.border) for tile in tiles]
+        edge = '{' + ' '.join(edge for edge, _ in cells) + '}'
+        middle = '{' + ' '.join(middle for _, middle in cells) + '}'
+        return ' '.join([edge] + [middle] * (self._side - 2) + [edge])
+
+    def _cell(self, color: str, border: str) -> (str, str):
+        """
+            The pixel colors of one tile's outline rows and inner rows, cached by appearance
+        """
+        cell = self._cells.get((color, border))
+        if cell is None:
+            edge = ' '.join([str(border)] * self._side)
+            middle = ' '.join([str(border)] + [str(color)] * (self._side - 2) + [str(border)])
+            cell = self._cells[(color, border)] = (edge, middle)
+        return cell
+
+def horizontal_runs(positions) -> [(int, int, int)]:
+    """
+        Group board positions into runs of horizontally adjacent positions
+        :arg positions: (x, y) positions
+        :arg type: iterable
+        :returns: (y, first x, last x) for every run, ordered by y then x
+        :rtype: list
+    """
+    runs = []
+    for x, y in sorted(positions, key=lambda position: (position[1], position[0])):
+        if runs and runs[-1][0] == y and runs[-1][2] == x - 1:
+            runs[-1][2] = x
+        else:
+            runs.append([y, x, x])
+    return [tuple(run) for run in runs]
+
+class RasterBoardView(BoardView):
+    """
+        GUI widget for displaying a tilematching game board as one PhotoImage on
+        the canvas instead of one rectangle per cell, for boards too large for
+        Tk's canvas items. Changed cells are redrawn with one put of row data per
+        run of adjacent changes. There are no per-tile canvas items, so tiles_map
+        and item_positions stay empty; use position_at for hit testing
+    """
+
+    def create_widgets(self):
+        self._painter = CellPainter(self.tile_side_length)
+        self._image = tk.PhotoImage(width=self.board_width, height=self.board_height)
+        self._board_display = tk.Canvas(
+                self,
+                width=self.board_width,
+                height=self.board_height,
+                highlightthickness=0
+                )
+        self._board_display.create_image(0, 0, anchor=tk.NW, image=self._image)
+        self._init_board()
+
+    def update(self):
+        """Redraw only the tiles whose positions changed since the last update"""
+        self._paint(self._changes.drain())
+
+    def refresh(self):
+        """Redraw every tile on the board, regardless of what changed"""
+        self._changes.drain()
+        self._init_board()
+
+    @property
+    def image(self) -> tk.PhotoImage:
+        return self._image
+
+    def _init_board(self):
+        for y in range(1, self.watching.num_rows + 1):
+            self._put_run(y, 1, self.watching.num_cols)
+
+    def _paint(self, positions) -> None:
+        """
+            Redraw the given positions, one put per run of adjacent positions
+        """
+        for y, first_x, last_x in horizontal_runs(positions):
+            self._put_run(y, first_x, last_x)
+
+    def _put_run(self, y: int, first_x: int, last_x: int) -> None:
+        tiles = [self.watching.tile_at(x, y) for x in range(first_x, last_x + 1)]
+        self._image.put(
+                self._painter.data_for(tiles),
+                to=(
+                    (first_x - 1) * self._painter.side,
+                    self.board_height - y * self._painter.side
+                    )
+                )
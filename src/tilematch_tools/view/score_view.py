@@ -41,6 +41,10 @@ class ScoreView(GameInfo):
         elif current_display > self.watching:
             self.showing.set(str(current_display - 1))
 
+    def needs_update(self):
+        """The displayed score counts towards the real one a point per update"""
+        return int(self.showing.get()) != self.watching
+
     def create_widgets(self):
         self._score_label = tk.Label(self, text='Score: ', font=self.font, width=10, anchor=tk.W)
         self._score_display = tk.Label(self, textvariable=self.showing, font=self.font, width=4, anchor=tk.E)
@@ -0,0 +1,79 @@
+"""Tests for the batch runner"""
+
+import random
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from tilematch_tools.core import (
+        BatchRunner, SimulationJob, SimulationResult, Game, GameFactory, GameLoop, GameState, BoardFactory
+        )
+from tilematch_tools.model import Scoring, GameBoard, MatchCondition
+
+class RandomPointsState(GameState):
+    def gameover(self):
+        return self.score.score >= 500
+
+class RandomPointsLoop(GameLoop):
+    def tick(self):
+        self.state.adjust_score(MatchCondition.MatchFound(random.randint(1, 10), []))
+
+    def find_matches(self, match_rules):
+        return []
+
+    def clear_matches(self, matches_found):
+        pass
+
+    def clean_up_state(self):
+        pass
+
+class RandomPointsFactory(GameFactory):
+    @staticmethod
+    def create_game() -> Game:
+        state = RandomPointsState(BoardFactory.create_board(GameBoard, 3, 3), Scoring())
+        return Game(state, RandomPointsLoop, Mock(), 100)
+
+def award(points, state):
+    state.adjust_score(MatchCondition.MatchFound(points, []))
+
+def test_in_process_results_are_deterministic_per_seed():
+    runner = BatchRunner(RandomPointsFactory, max_workers=0)
+    first = list(runner.run_seeds([1, 2, 3]))
+    second = list(runner.run_seeds([1, 2, 3]))
+    assert first == second
+    assert all(isinstance(result, SimulationResult) for result in first)
+    assert [result.seed for result in first] == [1, 2, 3]
+    assert all(result.ended and result.score >= 500 for result in first)
+
+def test_tick_budget_is_respected():
+    runner = BatchRunner(RandomPointsFactory, max_workers=0)
+    result, = runner.run_seeds([7], max_ticks=5)
+    assert result.ticks == 5
+    assert not result.ended
+
+def test_script_actions_run_at_their_tick():
+    runner = BatchRunner(RandomPointsFactory, max_workers=0)
+    plain, = runner.run([SimulationJob(3, max_ticks=10)])
+    scripted, = runner.run([SimulationJob(3, script=((4, partial(award, 50)),), max_ticks=10)])
+    assert scripted.score == plain.score + 50
+
+def test_process_pool_matches_in_process_results():
+    seeds = list(range(8))
+    serial = list(BatchRunner(RandomPointsFactory, max_workers=0).run_seeds(seeds))
+    pooled = list(BatchRunner(RandomPointsFactory, max_workers=2, chunksize=2).run_seeds(seeds))
+    assert pooled == serial
+
+def test_game_ending_on_the_last_budgeted_tick_is_reported_ended():
+    runner = BatchRunner(RandomPointsFactory, max_workers=0)
+    unbounded, = runner.run_seeds([5])
+    exact, = runner.run_seeds([5], max_ticks=unbounded.ticks)
+    assert exact == unbounded and exact.ended
+
+def test_only_completed_ticks_are_counted():
+    runner = BatchRunner(RandomPointsFactory, max_workers=0)
+    unbounded, = runner.run_seeds([5])
+    roomy, = runner.run_seeds([5], max_ticks=unbounded.ticks + 5)
+    assert roomy.ticks == unbounded.ticks
+    ended, = runner.run([SimulationJob(5, script=((2, partial(award, 500)),), max_ticks=10)])
+    assert ended.ended and ended.ticks == 2
@@ -1,9 +1,12 @@
 """Tests for board factory"""
 
+import numpy as np
 import pytest
 
 from tilematch_tools.core import BoardFactory
-from tilematch_tools.model.board import GameBoard
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard
+from tilematch_tools.model.exceptions import IllegalBoardContentException
+from tilematch_tools.model.tiles import Tile, NullTile, TileColor, TileShape
 from tilematch_tools import TileBuilder
 
 class TestBoardFactory:
@@ -48,3 +51,36 @@ class TestBoardFactory:
         for x in range(TestBoardFactory.width):
             for y in range(TestBoardFactory.height):
                 assert board.tile_at(x + 1, y + 1) in tiles
+
+    @pytest.mark.parametrize("board_type", [GameBoard, ArrayGameBoard])
+    def test_factory_loads_boards_from_codes(self, board_type):
+        tables = ([NullTile, Tile], [NullTile.EMPTY_COLOR, TileColor.GRAY, TileColor.RED], [TileShape.SQUARE])
+        kinds = np.zeros((3, 2), dtype=np.uint8)
+        colors = np.zeros((3, 2), dtype=np.uint16)
+        borders = np.ones((3, 2), dtype=np.uint16)
+        kinds[1, 0], colors[1, 0] = 1, 2
+        board = BoardFactory.create_board_from_codes(
+                board_type, tables, kinds, colors, np.zeros((3, 2), dtype=np.uint8), borders
+                )
+        assert (board.num_cols, board.num_rows) == (3, 2)
+        tile = board.tile_at(2, 1)
+        assert type(tile) == Tile
+        assert tile.color == TileColor.RED
+        assert (tile.position.x, tile.position.y) == (2, 1)
+        assert all(type(board.tile_at(x, y)) == NullTile for x in (1, 3) for y in (1, 2))
+        board.place_tile(TileBuilder().add_position(1, 1).construct())
+
+    def test_factory_rejects_codes_outside_their_tables(self):
+        codes = np.full((2, 2), 5, dtype=np.uint8)
+        with pytest.raises(IllegalBoardContentException):
+            BoardFactory.create_board_from_codes(
+                    GameBoard, ([NullTile], [TileColor.GRAY], [TileShape.SQUARE]), codes, codes, codes, codes
+                    )
+
+    @pytest.mark.parametrize('board_type, kind', [(print, NullTile), (Tile, NullTile), (GameBoard, print)])
+    def test_factory_rejects_non_board_and_non_tile_types(self, board_type, kind):
+        codes = np.zeros((2, 2), dtype=np.uint8)
+        with pytest.raises(IllegalBoardContentException):
+            BoardFactory.create_board_from_codes(
+                    board_type, ([kind], [TileColor.GRAY], [TileShape.SQUARE]), codes, codes, codes, codes
+                    )
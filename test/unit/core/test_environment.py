@@ -0,0 +1,212 @@
+"""Tests for the reinforcement learning environments"""
+
+import random
+
+import numpy as np
+import pytest
+
+from tilematch_tools.core import (
+        GameEnv, VectorGameEnv, Game, GameFactory, GameLoop, GameState, BoardFactory, TileBuilder
+        )
+from tilematch_tools.core.exceptions import GameEndedException
+from tilematch_tools.model import Scoring, GameBoard, ArrayGameBoard, RunMatchCondition, TileEncoder
+from tilematch_tools.model.match import ScanDelta
+from tilematch_tools.model import MatchCondition
+from tilematch_tools.model.tiles import Tile, NullTile, TileColor, TileShape
+from tilematch_tools.model.exceptions import UnregisteredTileKeyException
+
+COLORS = (TileColor.RED, TileColor.BLUE)
+KEYS = [(Tile, color, TileShape.SQUARE) for color in COLORS]
+
+class RowState(GameState):
+    def gameover(self):
+        return self.score.score >= 30 or all(type(tile) != NullTile for tile in self.board)
+
+class RowLoop(GameLoop):
+    """Drops a random colored tile into a random free cell each tick"""
+    def tick(self):
+        board = self.state.board
+        free = [(tile.position.x, tile.position.y) for tile in board if type(tile) == NullTile]
+        if free:
+            x, y = random.choice(free)
+            board.place_tile(TileBuilder().add_position(x, y).add_color(random.choice(COLORS)).construct())
+
+    def find_matches(self, match_rules):
+        return self.state.find_matches(match_rules)
+
+    def clear_matches(self, matches_found):
+        super().clear_matches(matches_found)
+
+    def clean_up_state(self):
+        pass
+
+class RowFactory(GameFactory):
+    board_type = GameBoard
+
+    @classmethod
+    def create_game(cls) -> Game:
+        state = RowState(BoardFactory.create_board(cls.board_type, 3, 4), Scoring())
+        state.add_match_condition(RunMatchCondition(ScanDelta.RIGHT, 10))
+        return Game(state, RowLoop, None, 100)
+
+class ArrayRowFactory(RowFactory):
+    board_type = ArrayGameBoard
+
+def clear_cell(state, action):
+    """Actions are positions to empty"""
+    state.board.clear_tile(*action)
+
+def award(state, points):
+    state.adjust_score(MatchCondition.MatchFound(points, []))
+
+@pytest.fixture(params=[RowFactory, ArrayRowFactory])
+def factory(request):
+    return request.param
+
+def test_reset_returns_the_encoded_board(factory):
+    env = GameEnv(factory, clear_cell)
+    observation, info = env.reset(seed=1)
+    assert observation.shape == env.observation_shape == (3, 4)
+    assert not observation.any()
+    assert info == {'score': 0, 'ticks': 0}
+
+def test_observations_track_the_board(factory):
+    encoder = TileEncoder()
+    env = GameEnv(factory, clear_cell, encoder)
+    env.reset(seed=2)
+    for step in range(20):
+        observation, reward, terminated, truncated, info = env.step((1, 1) if step % 3 else None)
+        assert np.array_equal(observation, encoder.encode(env.state.board))
+        if terminated:
+            break
+
+def test_rewards_add_up_to_the_score(factory):
+    env = GameEnv(factory, clear_cell)
+    env.reset(seed=3)
+    total, terminated, info = 0, False, None
+    while not terminated:
+        _, reward, terminated, truncated, info = env.step(None)
+        total += reward
+        assert not truncated
+    assert total == info['score'] == env.state.score.score
+    with pytest.raises(GameEndedException):
+        env.step(None)
+
+def test_actions_count_towards_the_reward(factory):
+    env = GameEnv(factory, award)
+    env.reset(seed=4)
+    _, reward, *_ = env.step(7)
+    assert reward >= 7
+
+def test_episodes_are_truncated_after_max_ticks(factory):
+    env = GameEnv(factory, clear_cell, max_ticks=2)
+    env.reset(seed=5)
+    assert env.step(None)[3] is False
+    assert env.step(None)[3] is True
+
+def test_episodes_are_reproducible_per_seed(factory):
+    env = GameEnv(factory, clear_cell)
+    runs = []
+    for _ in range(2):
+        env.reset(seed=6)
+        runs.append([env.step(None)[0] for _ in range(5)])
+    assert all(np.array_equal(a, b) for a, b in zip(*runs))
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_vector_env_steps_in_lockstep(max_workers):
+    with VectorGameEnv(RowFactory, clear_cell, 4, max_workers, TileEncoder(KEYS), max_ticks=50) as envs:
+        observations, infos = envs.reset(seed=10)
+        assert observations.shape == (4, 3, 4)
+        assert list(infos['ticks']) == [0] * 4
+        finished = 0
+        for _ in range(60):
+            observations, rewards, terminated, truncated, infos = envs.step([None] * 4)
+            finished += int(terminated.sum() + truncated.sum())
+            assert rewards.shape == (4,)
+        assert finished >= 4
+
+def test_vector_env_matches_single_envs():
+    single = []
+    for i in range(3):
+        env = GameEnv(RowFactory, clear_cell, TileEncoder(KEYS))
+        env.reset(seed=20 + i)
+        single.append([env.step(None)[0] for _ in range(4)])
+    with VectorGameEnv(RowFactory, clear_cell, 3, 3, TileEncoder(KEYS)) as envs:
+        envs.reset(seed=20)
+        vector = [envs.step([None] * 3)[0] for _ in range(4)]
+    for i in range(3):
+        assert all(np.array_equal(single[i][t], vector[t][i]) for t in range(4))
+
+def test_vector_env_workers_need_declared_tile_keys():
+    with pytest.raises(ValueError):
+        VectorGameEnv(RowFactory, clear_cell, 2, max_workers=2)
+
+def test_vector_env_workers_refuse_undeclared_tiles():
+    with VectorGameEnv(RowFactory, clear_cell, 2, max_workers=2, tile_keys=KEYS[:1]) as envs:
+        envs.reset(seed=1)
+        with pytest.raises(UnregisteredTileKeyException):
+            for _ in range(6):
+                envs.step([None] * 2)
+
+def test_vector_env_registers_the_tiles_of_a_new_game():
+    class PrefilledFactory(RowFactory):
+        @classmethod
+        def create_game(cls):
+            game = super().create_game()
+            game.state.board.place_tile(TileBuilder().add_position(1, 1).add_color(TileColor.GREEN).construct())
+            return game
+    encoder = TileEncoder()
+    with VectorGameEnv(PrefilledFactory, clear_cell, 2, max_workers=2, encoder=encoder, tile_keys=KEYS) as envs:
+        observations, _ = envs.reset(seed=1)
+    assert encoder.keys == KEYS + [(Tile, TileColor.GREEN, TileShape.SQUARE)]
+    assert list(observations[:, 0, 0]) == [3, 3]
+
+class LateGreenLoop(RowLoop):
+    """Drops a green tile, a color no fresh game shows, on its third tick"""
+    def tick(self):
+        if self.ticks == 3:
+            self.state.board.place_tile(TileBuilder().add_position(3, 4).add_color(TileColor.GREEN).construct())
+        else:
+            super().tick()
+
+class LateGreenFactory(RowFactory):
+    @classmethod
+    def create_game(cls) -> Game:
+        game = super().create_game()
+        return Game(game.state, LateGreenLoop, None, game.tick_speed)
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_vector_env_shows_declared_tiles_first_seen_mid_episode(max_workers):
+    keys = KEYS + [(Tile, TileColor.GREEN, TileShape.SQUARE)]
+    with VectorGameEnv(LateGreenFactory, clear_cell, 2, max_workers, tile_keys=keys) as envs:
+        envs.reset(seed=30)
+        vector = [envs.step([None] * 2)[0] for _ in range(4)]
+    assert list(vector[3][:, 2, 3]) == [3, 3]
+    if max_workers: # one environment per worker, so each slot replays like a single env
+        for i in range(2):
+            env = GameEnv(LateGreenFactory, clear_cell, TileEncoder(keys))
+            env.reset(seed=30 + i)
+            assert all(np.array_equal(env.step(None)[0], vector[t][i]) for t in range(4))
+
+def test_in_process_vector_env_registers_tiles_first_seen_mid_episode():
+    encoder = TileEncoder()
+    with VectorGameEnv(LateGreenFactory, clear_cell, 2, encoder=encoder) as envs:
+        envs.reset(seed=30)
+        for _ in range(4):
+            envs.step([None] * 2)
+    assert (Tile, TileColor.GREEN, TileShape.SQUARE) in encoder.keys
+
+def test_vector_env_leaves_the_random_module_alone():
+    random.seed(3)
+    expected = random.random()
+    random.seed(3)
+    VectorGameEnv(RowFactory, clear_cell, 2).close()
+    assert random.random() == expected
+
+def test_vector_env_checks_batch_sizes():
+    envs = VectorGameEnv(RowFactory, clear_cell, 2)
+    with pytest.raises(ValueError):
+        envs.reset(seed=[1])
+    envs.reset(seed=1)
+    with pytest.raises(ValueError):
+        envs.step([None])
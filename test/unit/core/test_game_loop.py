@@ -4,7 +4,8 @@ import pytest
 import time
 from unittest.mock import Mock
 
-from tilematch_tools.model import Scoring, GameBoard
+from tilematch_tools.model import Scoring, GameBoard, RunMatchCondition, MatchCondition, Tile, NullTile
+from tilematch_tools.model.match import ScanDelta
 from tilematch_tools.core import GameLoop, GameState, BoardFactory
 from tilematch_tools.core.exceptions import GameEndedException
 from tilematch_tools.view import GameView
@@ -52,6 +53,9 @@ def test_game_loop_subclass_implements_template():
     with pytest.raises(TypeError):
         InvalidGameLoop()
 
+def test_find_matches_does_not_need_overriding():
+    assert 'find_matches' not in GameLoop.__abstractmethods__
+
 def test_game_loop_is_callable(simple_game_loop):
     loop = simple_game_loop
     loop()
@@ -60,3 +64,90 @@ def test_game_loop_cannot_be_run_if_game_is_over(simple_game_loop):
     simple_game_loop.state.gameover = Mock(return_value=True)
     with pytest.raises(GameEndedException):
         simple_game_loop()
+
+@pytest.fixture
+def incremental_game_loop():
+    class IncrementalGameLoop(GameLoop):
+        INCREMENTAL_MATCHING = True
+
+        def clear_matches(self, matches_found):
+            super().clear_matches(matches_found)
+
+        def tick(self):
+            pass
+
+        def clean_up_state(self):
+            pass
+
+    state = GameState(BoardFactory.create_board(GameBoard, 5, 5), Scoring())
+    state.add_match_condition(RunMatchCondition(ScanDelta.RIGHT, 10))
+    loop = IncrementalGameLoop(state, Mock(), 0)
+    loop.can_advance = Mock(return_value=True)
+    return loop
+
+def test_first_incremental_check_covers_whole_board(incremental_game_loop):
+    for x in range(1, 4):
+        incremental_game_loop.state.board.place_tile(Tile(**{'position': (x, 1)}))
+    incremental_game_loop()
+    assert incremental_game_loop.state.score.score == 10
+
+def test_incremental_checks_only_touched_positions(incremental_game_loop):
+    incremental_game_loop()
+    for x in range(1, 4):
+        incremental_game_loop.state.board.place_tile(Tile(**{'position': (x, 2)}))
+    rule = incremental_game_loop.state.match_rules[0]
+    rule.find_all = Mock(wraps=rule.find_all)
+    incremental_game_loop()
+    assert rule.find_all.call_args_list[0].args[1] == {(1, 2), (2, 2), (3, 2)}
+    assert incremental_game_loop.state.score.score == 10
+    assert incremental_game_loop.touched == {(1, 2), (2, 2), (3, 2)}
+
+def test_incremental_checks_find_matches_starting_outside_touched_positions(incremental_game_loop):
+    class BelowMatch(MatchCondition):
+        """Matches a tile with the one below it, scanning from the upper tile"""
+        def check_match(self, board, start_x, start_y):
+            if start_y < 2 or type(board.tile_at(start_x, start_y)) == NullTile:
+                return None
+            upper, lower = board.tile_at(start_x, start_y), board.tile_at(start_x, start_y - 1)
+            return self.MatchFound(self.point_value, [upper, lower]) if upper == lower else None
+
+    state = incremental_game_loop.state
+    state.match_rules.clear()
+    state.add_match_condition(BelowMatch(ScanDelta.DOWN, 4))
+    state.board.place_tile(Tile(**{'position': (1, 2)}))
+    incremental_game_loop()
+    state.board.place_tile(Tile(**{'position': (1, 1)}))
+    rule = state.match_rules[0]
+    rule.find_all = Mock(wraps=rule.find_all)
+    incremental_game_loop()
+    assert rule.find_all.call_args_list[0].args[1] == {(1, 1)}
+    assert state.score.score == 4
+
+def test_needs_view_update_asks_the_view(simple_game_loop):
+    simple_game_loop.view.needs_update.return_value = False
+    assert not simple_game_loop.needs_view_update()
+    simple_game_loop.view.needs_update.return_value = True
+    assert simple_game_loop.needs_view_update()
+
+def test_queued_input_is_handled_before_each_tick(simple_game_state):
+    from tilematch_tools.view import NullView
+    class QueuedView(NullView):
+        QUEUE_INPUT = True
+    calls = []
+    class InputLoop(GameLoop):
+        def find_matches(self, match_conditions):
+            return []
+        def clear_matches(self, matches_found):
+            pass
+        def tick(self):
+            calls.append('tick')
+        def clean_up_state(self):
+            pass
+    view = QueuedView(None, simple_game_state)
+    view.bind_key('<Left>', lambda event: calls.append('left'))
+    loop = InputLoop(simple_game_state, view, 0)
+    for _ in range(5):
+        view.dispatch('key', '<Left>', Mock(keysym='Left', x=0, y=0))
+    assert calls == []
+    loop.step()
+    assert calls == ['left', 'tick']
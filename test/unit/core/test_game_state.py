@@ -1,6 +1,7 @@
 import pytest
 from tilematch_tools.core import GameState, BoardFactory, TileBuilder
-from tilematch_tools.model import Scoring, MovementRule, MatchCondition, TileColor, GameBoard
+from tilematch_tools.model import Scoring, MovementRule, MatchCondition, TileColor, GameBoard, ArrayGameBoard, RunMatchCondition
+from tilematch_tools.model.match import ScanDelta
 from tilematch_tools.model.exceptions import IllegalTileMovementException, InvalidBoardPositionError
 from tilematch_tools.model.tiles.tile import NullTile
 
@@ -116,3 +117,42 @@ class TestGameState:
         assert tile_2.position.y == 3
         assert self.state.board.tile_at(1,3).color == TileColor.RED
         assert self.state.board.tile_at(1,2).color == TileColor.BLUE
+
+    def test_swap_with_empty_cell_moves_only_the_tile(self):
+        tile = TileBuilder().add_position(1,3).add_color(TileColor.BLUE).construct()
+        self.state.board.place_tile(tile)
+        empty = self.state.board.tile_at(1, 2)
+        self.state.swap_tiles(tile, empty)
+        assert self.state.board.tile_at(1, 2) is tile
+        assert isinstance(self.state.board.tile_at(1, 3), NullTile)
+        assert self.state.board.tile_at(1, 3).position.y == 3
+        assert empty.position.y == 2
+
+    def test_swap_keeps_colored_null_tiles(self):
+        tile = TileBuilder().add_position(1,3).add_color(TileColor.BLUE).construct()
+        colored = TileBuilder().add_position(1,2).add_color(TileColor.GREEN).construct(tile_type=NullTile)
+        self.state.board.place_tile(tile)
+        self.state.board.place_tile(colored)
+        self.state.swap_tiles(tile, colored)
+        assert self.state.board.tile_at(1, 2) is tile
+        assert self.state.board.tile_at(1, 3) is colored
+        assert colored.color == TileColor.GREEN and colored.position.y == 3
+
+    def test_find_matches_over_whole_board_and_positions(self):
+        rule = RunMatchCondition(ScanDelta.UP, 4)
+        for y in range(1, 4):
+            self.state.board.place_tile(TileBuilder().add_position(2, y).add_color(TileColor.RED).construct())
+        assert len(self.state.find_matches([rule])) == 1
+        assert len(self.state.find_matches([rule], {(2, 2)})) == 1
+        assert self.state.find_matches([rule], {(5, 5)}) == []
+        assert self.state.find_matches([rule], set()) == []
+
+@pytest.mark.parametrize('board_type', [GameBoard, ArrayGameBoard])
+def test_swap_keeps_null_tile_appearance(board_type):
+    state = GameState(BoardFactory.create_board(board_type, 3, 3), Scoring())
+    state.board.place_tile(TileBuilder().add_position(1, 1).add_color(TileColor.BLUE).construct())
+    state.board.place_tile(TileBuilder().add_position(1, 2).add_color(TileColor.GREEN).construct(tile_type=NullTile))
+    state.swap_tiles(state.board.tile_at(1, 1), state.board.tile_at(1, 2))
+    assert type(state.board.tile_at(1, 1)) == NullTile
+    assert state.board.tile_at(1, 1).color == TileColor.GREEN
+    assert state.board.tile_at(1, 2).color == TileColor.BLUE
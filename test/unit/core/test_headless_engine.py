@@ -0,0 +1,76 @@
+"""Tests for the headless engine"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from tilematch_tools.core import Game, GameLoop, GameState, BoardFactory, HeadlessEngine
+from tilematch_tools.model import Scoring, GameBoard
+from tilematch_tools.view import NullView
+
+class EndingState(GameState):
+    def __init__(self, ends_after):
+        super().__init__(BoardFactory.create_board(GameBoard, 3, 3), Scoring())
+        self.turns = 0
+        self.ends_after = ends_after
+
+    def gameover(self):
+        return self.ends_after is not None and self.turns >= self.ends_after
+
+class CountingLoop(GameLoop):
+    def tick(self):
+        self.state.turns += 1
+
+    def find_matches(self, match_rules):
+        return []
+
+    def clear_matches(self, matches_found):
+        pass
+
+    def clean_up_state(self):
+        pass
+
+def make_game(tick_speed, ends_after=None):
+    return Game(EndingState(ends_after), CountingLoop, Mock(), tick_speed)
+
+def test_games_get_null_views():
+    engine = HeadlessEngine([make_game(10)])
+    assert isinstance(engine.loops[0].view, NullView)
+
+def test_steps_ignore_wall_clock():
+    engine = HeadlessEngine([make_game(1_000_000_000)])
+    assert engine.run(max_ticks=1000) == 1000
+    assert engine.loops[0].ticks == 1000
+    assert engine.clock == 1000 * 1_000_000_000
+
+def test_faster_games_tick_more_often():
+    engine = HeadlessEngine([make_game(10), make_game(30)])
+    engine.advance(300)
+    fast, slow = engine.loops
+    assert fast.ticks == 30
+    assert slow.ticks == 10
+    assert engine.clock == 300
+
+def test_ended_games_are_finished():
+    engine = HeadlessEngine([make_game(10, ends_after=5), make_game(10)])
+    engine.run(max_ticks=100)
+    assert engine.loops[0].ticks == 5
+    assert engine.finished == [engine.loops[0]]
+    assert engine.active == [engine.loops[1]]
+
+def test_run_stops_when_all_games_end():
+    engine = HeadlessEngine([make_game(10, ends_after=3)])
+    assert engine.run() == 3
+    assert engine.active == []
+
+def test_retiring_an_ended_game_does_not_use_up_the_budget():
+    engine = HeadlessEngine([make_game(10, ends_after=2), make_game(10)])
+    assert engine.run(max_ticks=6) == 6
+    assert [loop.ticks for loop in engine.loops] == [2, 4]
+
+def test_null_view_keeps_handlers():
+    view = NullView(None, Mock())
+    handler = Mock()
+    view.bind_key('<KeyRelease-a>', handler)
+    view.update()
+    assert view.key_handlers == {'<KeyRelease-a>': handler}
@@ -0,0 +1,103 @@
+"""Tests for loop profiling"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from tilematch_tools.core import (
+        GameLoop, GameState, BoardFactory, DurationHistogram, TickProfiler, ProfileDumper, NullProfiler, PHASES
+        )
+from tilematch_tools.model import Scoring, GameBoard, MatchCondition
+
+class CascadingLoop(GameLoop):
+    """Finds one match on each of the first two checks of every tick"""
+    def tick(self):
+        self.pending = 2
+
+    def find_matches(self, match_rules):
+        if self.pending:
+            self.pending -= 1
+            return [MatchCondition.MatchFound(1, [])]
+        return []
+
+    def clear_matches(self, matches_found):
+        pass
+
+    def clean_up_state(self):
+        pass
+
+@pytest.fixture
+def loop():
+    state = GameState(BoardFactory.create_board(GameBoard, 3, 3), Scoring())
+    return CascadingLoop(state, Mock(), 0)
+
+def test_histogram_buckets_by_power_of_two():
+    hist = DurationHistogram(buckets=8)
+    for duration in (1, 3, 3, 100, 10_000):
+        hist.record(duration)
+    summary = hist.as_dict()
+    assert summary['count'] == 5
+    assert summary['max_ns'] == 10_000
+    assert summary['buckets'] == [0, 1, 2, 0, 0, 0, 0, 2]
+    assert hist.percentile(0.5) == 4
+
+def test_profiling_is_off_by_default(loop):
+    loop.step()
+    assert loop.profiler is None
+
+def test_profiled_step_records_every_phase(loop):
+    profiler = loop.enable_profiling()
+    loop.step()
+    loop.step()
+    loop.update_view()
+    assert isinstance(profiler, TickProfiler)
+    assert profiler.phase('tick').count == 2
+    assert profiler.phase('find_matches').count == 6
+    assert profiler.phase('clear_matches').count == 4
+    assert profiler.phase('clean_up_state').count == 4
+    assert profiler.phase('view_update').count == 1
+    assert profiler.cascades[2] == 2
+    assert loop.matches_found == 4
+
+def test_profiling_does_not_change_what_a_tick_does(loop):
+    state = GameState(BoardFactory.create_board(GameBoard, 3, 3), Scoring())
+    profiled = CascadingLoop(state, Mock(), 0)
+    profiled.enable_profiling()
+    for each in (loop, profiled):
+        each.step()
+        each.update_view()
+    assert loop.matches_found == profiled.matches_found == 2
+    loop.view.update.assert_called_once()
+    profiled.view.update.assert_called_once()
+
+def test_timed_records_phases_that_raise():
+    profiler = TickProfiler()
+    with pytest.raises(ZeroDivisionError):
+        profiler.timed('tick', lambda: 1 / 0)
+    assert profiler.phase('tick').count == 1
+    assert profiler.timed('tick', max, 1, 2) == 2
+
+def test_null_profiler_only_runs_the_phase():
+    profiler = NullProfiler()
+    assert profiler.timed('tick', max, 1, 2) == 2
+    profiler.record_cascades(3)
+
+def test_disable_profiling_drops_profiler(loop):
+    loop.enable_profiling()
+    loop.disable_profiling()
+    loop.step()
+    assert loop.profiler is None
+
+def test_dumper_appends_json_lines(loop, tmp_path):
+    loop.enable_profiling()
+    loop.step()
+    path = tmp_path / 'profile.jsonl'
+    dumper = ProfileDumper(str(path), [loop])
+    dumper.dump()
+    dumper.dump()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record['games'][0]['ticks'] == 1
+    assert set(record['games'][0]['phases']) == set(PHASES)
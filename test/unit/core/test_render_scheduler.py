@@ -0,0 +1,97 @@
+"""Tests for the render scheduler"""
+
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from tilematch_tools.core import RenderScheduler
+from tilematch_tools.view import NullView
+from tilematch_tools.view.input_dispatch import KEY
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+class FakeRoot:
+    """Records callbacks instead of running a Tk event loop"""
+    def __init__(self):
+        self.idle = []
+        self.timers = []
+
+    def after_idle(self, func, *args):
+        self.idle.append((func, args))
+
+    def after(self, ms, func, *args):
+        self.timers.append((ms, func, args))
+
+    def run_idle(self):
+        idle, self.idle = self.idle, []
+        for func, args in idle:
+            func(*args)
+
+def make_loop(still_changing=False):
+    loop = Mock()
+    loop.needs_view_update.return_value = still_changing
+    return loop
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+def test_dirty_views_are_coalesced_into_one_pass(clock, root):
+    renderer = RenderScheduler(root, max_fps=10, clock=clock)
+    loops = [make_loop() for _ in range(16)]
+    for loop in loops + loops:
+        renderer.mark_dirty(loop)
+    assert len(root.idle) == 1
+    root.run_idle()
+    assert renderer.frames == 1
+    assert all(loop.update_view.call_count == 1 for loop in loops)
+    assert renderer.dirty == []
+
+def test_unchanged_loops_are_not_marked(clock, root):
+    renderer = RenderScheduler(root, clock=clock)
+    renderer.mark_if_changed(make_loop(still_changing=False))
+    assert renderer.dirty == []
+    assert root.idle == []
+
+def test_passes_are_capped_at_max_fps(clock, root):
+    renderer = RenderScheduler(root, max_fps=10, clock=clock)
+    loop = make_loop()
+    renderer.mark_dirty(loop)
+    root.run_idle()
+    clock.now = 40_000_000
+    renderer.mark_dirty(loop)
+    assert root.idle == []
+    ms, func, args = root.timers[0]
+    assert ms == 60
+    func(*args)
+    root.run_idle()
+    assert renderer.frames == 2
+
+def test_still_changing_views_are_redrawn_next_frame(clock, root):
+    renderer = RenderScheduler(root, max_fps=10, clock=clock)
+    loop = make_loop(still_changing=True)
+    renderer.mark_dirty(loop)
+    root.run_idle()
+    assert renderer.dirty == [loop]
+    assert root.timers[0][0] == 100
+
+def test_input_changes_are_drawn_without_waiting_for_a_tick(clock, root):
+    renderer = RenderScheduler(root, max_fps=10, clock=clock)
+    loop = make_loop(still_changing=True)
+    loop.view = NullView(None, None)
+    loop.view.on_delivered = partial(renderer.mark_if_changed, loop)
+    loop.view.bind_key('<Key>', lambda event: None)
+    loop.view.dispatch(KEY, '<Key>', None)
+    assert renderer.dirty == [loop]
+    root.run_idle()
+    loop.update_view.assert_called_once()
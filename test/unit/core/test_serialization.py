@@ -0,0 +1,104 @@
+"""Tests for saving and loading game states"""
+
+import pickle
+import sys
+
+import pytest
+
+from tilematch_tools.core import GameState, TileBuilder, serialization
+from tilematch_tools.core.exceptions import InvalidSaveDataException
+from tilematch_tools.model import Scoring, RunMatchCondition
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard
+from tilematch_tools.model.tiles import NullTile, TileColor, TileShape
+
+tile_module = NullTile.__module__
+
+def contents(board):
+    return [
+            (type(tile), tile.color, tile.shape, tile.border, tile.position.x, tile.position.y)
+            for tile in board
+            ]
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def state(request):
+    state = GameState(request.param(6, 5), Scoring())
+    colors = (TileColor.RED, TileColor.BLUE, TileColor.GREEN)
+    for x in range(1, 7):
+        for y in range(1, 4):
+            state.board.place_tile(
+                    TileBuilder().add_position(x, y).add_color(colors[(x + y) % 3]).construct()
+                    )
+    highlighted = state.board.tile_at(2, 2)
+    highlighted.border = TileColor.YELLOW
+    state.board.clear_tile(2, 2)
+    state.board.place_tile(highlighted)
+    diamond = TileBuilder().add_position(1, 5).add_color(TileColor.VIOLET).add_shape(TileShape.DIAMOND).construct()
+    state.board.place_tile(diamond)
+    state.score.multiplier = 2
+    state.score.award_for_match(RunMatchCondition.MatchFound(3, []))
+    return state
+
+@pytest.mark.parametrize("board_type", [None, GameBoard, ArrayGameBoard])
+def test_round_trip_keeps_board_and_score(state, board_type):
+    loaded = serialization.loads(serialization.dumps(state), board_type=board_type)
+    assert type(loaded.board) == (board_type or type(state.board))
+    assert contents(loaded.board) == contents(state.board)
+    assert (loaded.score.score, loaded.score.multiplier) == (state.score.score, state.score.multiplier)
+    assert loaded.board.state_hash == state.board.state_hash
+
+def test_saves_are_smaller_than_pickles(state):
+    assert len(serialization.dumps(state)) < len(pickle.dumps(list(state.board))) / 2
+
+def test_save_and_load_through_memory_maps(state, tmp_path):
+    path = tmp_path / 'game.tmgs'
+    size = serialization.save(state, str(path))
+    assert path.stat().st_size == size
+    loaded = serialization.load(str(path))
+    assert contents(loaded.board) == contents(state.board)
+    loaded.board.clear_tile(1, 1)
+    assert type(loaded.board.tile_at(1, 1)) == NullTile
+    assert contents(serialization.load(str(path)).board) == contents(state.board)
+
+def test_dump_into_writes_at_an_offset(state):
+    data = serialization.dumps(state)
+    buffer = bytearray(len(data) + 16)
+    assert serialization.dump_into(state, buffer, 16) == len(data)
+    assert contents(serialization.loads(buffer, 16).board) == contents(state.board)
+    with pytest.raises(ValueError):
+        serialization.dump_into(state, bytearray(8))
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b'XXXX' + data[4:],
+    lambda data: data[:40],
+    lambda data: data[:-1],
+    lambda data: data[:4] + (serialization.FORMAT_VERSION + 1).to_bytes(2, 'little') + data[6:]
+    ])
+def test_damaged_saves_are_rejected(state, damage):
+    with pytest.raises(InvalidSaveDataException):
+        serialization.loads(damage(serialization.dumps(state)))
+
+@pytest.mark.parametrize("hostile", [
+    {GameBoard: 'builtins:print', ArrayGameBoard: 'builtins:print'},
+    {NullTile: 'builtins:print'},
+    {NullTile: 'builtins:int'},
+    {GameBoard: tile_module + ':Tile', ArrayGameBoard: tile_module + ':Tile'},
+    ])
+def test_saves_naming_other_types_are_rejected(state, hostile, monkeypatch, capsys):
+    names = lambda kind: hostile.get(kind, f'{kind.__module__}:{kind.__qualname__}')
+    monkeypatch.setattr(serialization, '_name_of', names)
+    data = serialization.dumps(state)
+    monkeypatch.undo()
+    with pytest.raises(InvalidSaveDataException):
+        serialization.loads(data)
+    assert capsys.readouterr().out == ''
+
+def test_saves_never_import_modules(state, monkeypatch, capsys):
+    assert 'this' not in sys.modules
+    names = lambda kind: 'this:Tile' if kind is NullTile else f'{kind.__module__}:{kind.__qualname__}'
+    monkeypatch.setattr(serialization, '_name_of', names)
+    data = serialization.dumps(state)
+    monkeypatch.undo()
+    with pytest.raises(InvalidSaveDataException):
+        serialization.loads(data)
+    assert 'this' not in sys.modules
+    assert capsys.readouterr().out == ''
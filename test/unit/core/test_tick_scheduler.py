@@ -0,0 +1,70 @@
+"""Tests for the tick scheduler"""
+
+import pytest
+
+from tilematch_tools.core import TickScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_empty_scheduler_has_nothing_due(clock):
+    scheduler = TickScheduler(clock)
+    assert scheduler.next_due() is None
+    assert scheduler.time_until_due() is None
+    assert scheduler.pop_due() == []
+
+def test_items_come_due_in_interval_order(clock):
+    scheduler = TickScheduler(clock)
+    scheduler.schedule('slow', 30)
+    scheduler.schedule('fast', 10)
+    assert scheduler.next_due() == 10
+    clock.now = 30
+    assert scheduler.pop_due() == [('fast', 1), ('slow', 1)]
+    assert scheduler.skipped == 2
+    assert scheduler.next_due() == 40
+
+def test_nothing_is_popped_early(clock):
+    scheduler = TickScheduler(clock)
+    scheduler.schedule('game', 10)
+    clock.now = 9
+    assert scheduler.pop_due() == []
+    assert scheduler.time_until_due() == 1
+
+def test_late_items_skip_frames_beyond_catch_up(clock):
+    scheduler = TickScheduler(clock, max_catch_up=2)
+    scheduler.schedule('game', 10)
+    clock.now = 55
+    assert scheduler.pop_due() == [('game', 2)]
+    assert scheduler.skipped == 3
+    assert scheduler.next_due() == 60
+
+def test_limit_leaves_remaining_items_due(clock):
+    scheduler = TickScheduler(clock)
+    scheduler.schedule('a', 10)
+    scheduler.schedule('b', 10)
+    clock.now = 10
+    assert scheduler.pop_due(limit=1) == [('a', 1)]
+    assert scheduler.pop_due() == [('b', 1)]
+
+def test_cancelled_items_are_never_popped(clock):
+    scheduler = TickScheduler(clock)
+    scheduler.schedule('a', 10)
+    scheduler.schedule('b', 20)
+    scheduler.cancel('a')
+    clock.now = 20
+    assert scheduler.pop_due() == [('b', 1)]
+    assert len(scheduler) == 1
+
+def test_rescheduling_replaces_previous_schedule(clock):
+    scheduler = TickScheduler(clock)
+    scheduler.schedule('a', 10)
+    scheduler.schedule('a', 50)
+    assert scheduler.next_due() == 50
@@ -0,0 +1,37 @@
+from tilematch_tools.core import TranspositionTable
+
+def test_stored_values_are_found():
+    table = TranspositionTable(4)
+    table.put(1, 'one')
+    assert table.get(1) == 'one'
+    assert 1 in table
+    assert table.get(2, 'missing') == 'missing'
+    assert (table.hits, table.misses) == (1, 1)
+
+def test_least_recently_used_entry_is_evicted():
+    table = TranspositionTable(2)
+    table.put(1, 'one')
+    table.put(2, 'two')
+    table.get(1)
+    table.put(3, 'three')
+    assert len(table) == 2
+    assert 2 not in table
+    assert 1 in table and 3 in table
+
+def test_storing_an_existing_key_replaces_it_without_evicting():
+    table = TranspositionTable(2)
+    table.put(1, 'one')
+    table.put(2, 'two')
+    table.put(1, 'uno')
+    assert len(table) == 2
+    assert table.get(1) == 'uno'
+    assert table.get(2) == 'two'
+
+def test_clear_forgets_everything():
+    table = TranspositionTable(0)
+    assert table.capacity == 1
+    table.put(1, 'one')
+    table.get(1)
+    table.clear()
+    assert len(table) == 0
+    assert (table.hits, table.misses) == (0, 0)
@@ -0,0 +1,104 @@
+import pytest
+
+from tilematch_tools.model.exceptions import InvalidBoardPositionError, IllegalBoardContentException
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard
+from tilematch_tools.model.tiles import Tile, NullTile, TileColor, TileShape
+
+width = 10
+height = 24
+
+class TestArrayGameBoard:
+
+    def setup_method(self):
+        self.board = ArrayGameBoard(width, height)
+
+    def test_array_board_is_a_game_board(self):
+        assert isinstance(self.board, GameBoard)
+        assert self.board.num_cols == width
+        assert self.board.num_rows == height
+
+    def test_array_board_starts_with_null_tiles(self):
+        assert len(self.board.board) == width
+        assert all(len(col) == height for col in self.board.board)
+        assert all(type(tile) == NullTile for tile in self.board)
+        assert not self.board.occupied.any()
+
+    @pytest.mark.parametrize("x, y", [(1, 1), (width, height), (3, 7)])
+    def test_tile_at_materializes_positioned_tiles(self, x, y):
+        tile = self.board.tile_at(x, y)
+        assert tile.position.x == x
+        assert tile.position.y == y
+        assert tile.color is TileColor.LIGHT_GRAY
+
+    def test_placed_tile_round_trips(self):
+        self.board.place_tile(Tile(**{
+            'position': (2, 3),
+            'color': TileColor.BLUE,
+            'shape': TileShape.DIAMOND,
+            'border': TileColor.RED
+            }))
+        tile = self.board.tile_at(2, 3)
+        assert type(tile) == Tile
+        assert tile.color == TileColor.BLUE
+        assert tile.shape == TileShape.DIAMOND
+        assert tile.border == TileColor.RED
+        assert self.board.occupied[1, 2]
+
+    def test_tile_subclasses_are_preserved(self):
+        class SomeTile(Tile):
+            pass
+        self.board.place_tile(SomeTile(**{'position': (2, 2)}))
+        assert type(self.board.tile_at(2, 2)) == SomeTile
+
+    def test_occupied_position_rejects_tile(self):
+        self.board.place_tile(Tile(**{'position': (2, 2)}))
+        with pytest.raises(InvalidBoardPositionError):
+            self.board.place_tile(Tile(**{'position': (2, 2)}))
+
+    def test_null_tile_frees_position(self):
+        self.board.place_tile(Tile(**{'position': (2, 2)}))
+        self.board.place_tile(NullTile(**{'position': (2, 2), 'color': TileColor.LIGHT_GRAY}))
+        self.board.place_tile(Tile(**{'position': (2, 2)}))
+        assert not self.board.occupied[0, 0]
+
+    def test_clear_tile_resets_every_code(self):
+        self.board.place_tile(Tile(**{'position': (2, 2), 'color': TileColor.BLUE, 'border': TileColor.RED}))
+        self.board.clear_tile(2, 2)
+        assert not self.board.occupied[1, 1]
+        assert self.board.borders[1, 1] == self.board.color_table.index(TileColor.GRAY)
+        assert self.board.tile_at(2, 2) is self.board.tile_at(2, 2)
+
+    @pytest.mark.parametrize("x, y", [(0, 0), (width + 1, 1), (1, height + 1)])
+    def test_invalid_positions_raise(self, x, y):
+        with pytest.raises(InvalidBoardPositionError):
+            self.board.tile_at(x, y)
+        with pytest.raises(InvalidBoardPositionError):
+            self.board.place_tile(Tile(**{'position': (x, y)}))
+
+    @pytest.mark.parametrize("o", [int, str, list])
+    def test_non_tiles_are_rejected(self, o):
+        with pytest.raises(IllegalBoardContentException):
+            self.board.place_tile(o())
+
+    def test_exposed_arrays_are_read_only(self):
+        with pytest.raises(ValueError):
+            self.board.kinds[0, 0] = 1
+
+    def test_large_board_stays_compact(self):
+        assert ArrayGameBoard(200, 200).nbytes < 512 * 1024
+
+@pytest.mark.parametrize("board_type", [GameBoard, ArrayGameBoard])
+def test_tile_key_at_reads_type_color_and_shape(board_type):
+    board = board_type(3, 3)
+    board.place_tile(Tile(**{'position': (2, 3), 'color': TileColor.BLUE, 'shape': TileShape.DIAMOND}))
+    assert board.tile_key_at(2, 3) == (Tile, TileColor.BLUE, TileShape.DIAMOND)
+    assert board.tile_key_at(1, 1)[0] is NullTile
+    with pytest.raises(InvalidBoardPositionError):
+        board.tile_key_at(4, 1)
+
+@pytest.mark.parametrize("board_type", [GameBoard, ArrayGameBoard])
+def test_empty_cells_use_the_light_gray_color_member(board_type):
+    board = board_type(2, 2)
+    assert all(tile.color is TileColor.LIGHT_GRAY for tile in board)
+    if board_type is ArrayGameBoard:
+        assert board.color_table[0] is TileColor.LIGHT_GRAY
@@ -0,0 +1,108 @@
+"""Tests for the board change journal"""
+
+import pickle
+
+import pytest
+
+from tilematch_tools.core import GameState, TileBuilder
+from tilematch_tools.model import Scoring, MovementRule, MatchCondition, TileColor
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard, ChangeJournal
+from tilematch_tools.model.tiles import Tile, NullTile
+
+@pytest.fixture
+def simple_down():
+    class SimpleDown(MovementRule):
+        def apply(self, board, tile):
+            tile.position = (tile.position.x, tile.position.y - 1)
+            board.place_tile(tile)
+
+    return SimpleDown()
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def board(request):
+    return request.param(5, 5)
+
+def test_journal_starts_empty(board):
+    journal = board.open_journal()
+    assert isinstance(journal, ChangeJournal)
+    assert journal.pending == 0
+    assert journal.drain() == set()
+
+def test_place_tile_is_recorded(board):
+    journal = board.open_journal()
+    board.place_tile(Tile(**{'position': (2, 3)}))
+    assert journal.drain() == {(2, 3)}
+    assert journal.drain() == set()
+
+def test_journals_drain_independently(board):
+    first = board.open_journal()
+    second = board.open_journal()
+    board.place_tile(Tile(**{'position': (1, 1)}))
+    assert first.drain() == {(1, 1)}
+    assert second.drain() == {(1, 1)}
+
+def test_movement_records_origin_and_destination(board, simple_down):
+    tile = Tile(**{'position': (2, 3)})
+    board.place_tile(tile)
+    journal = board.open_journal()
+    simple_down.move(board, tile)
+    assert journal.drain() == {(2, 3), (2, 2)}
+
+def test_clear_match_and_swap_are_recorded(board):
+    state = GameState(board, Scoring())
+    tile1 = TileBuilder().add_position(1, 1).add_color(TileColor.RED).construct()
+    tile2 = TileBuilder().add_position(1, 2).add_color(TileColor.BLUE).construct()
+    board.place_tile(tile1)
+    board.place_tile(tile2)
+    journal = board.open_journal()
+
+    state.swap_tiles(tile1, tile2)
+    assert journal.drain() == {(1, 1), (1, 2)}
+
+    state.clear_match(MatchCondition.MatchFound(1, [board.tile_at(1, 1)]))
+    assert journal.drain() == {(1, 1)}
+
+def test_mark_changed_records_in_place_updates(board):
+    journal = board.open_journal()
+    board.mark_changed(4, 4)
+    assert journal.drain() == {(4, 4)}
+
+def test_border_edits_of_placed_tiles_are_recorded():
+    board = GameBoard(5, 5)
+    tile = TileBuilder().add_position(2, 2).add_color(TileColor.RED).construct()
+    board.place_tile(tile)
+    journal = board.open_journal()
+    tile.border = TileColor.BLUE
+    board.tile_at(3, 3).border = TileColor.BLUE
+    assert journal.drain() == {(2, 2), (3, 3)}
+
+def test_border_edits_of_removed_tiles_are_not_recorded():
+    board = GameBoard(5, 5)
+    tile = TileBuilder().add_position(2, 2).add_color(TileColor.RED).construct()
+    board.place_tile(tile)
+    board.clear_tile(2, 2)
+    journal = board.open_journal()
+    tile.border = TileColor.BLUE
+    tile.position = (9, 9)
+    tile.border = TileColor.GREEN
+    assert journal.pending == 0
+
+def test_border_edits_reach_only_the_board_holding_the_tile():
+    board = GameBoard(5, 5)
+    board.place_tile(TileBuilder().add_position(2, 2).add_color(TileColor.RED).construct())
+    clone = board.clone()
+    parent_changes, clone_changes = board.open_journal(), clone.open_journal()
+    clone.tile_at(2, 2).border = TileColor.BLUE
+    assert clone_changes.drain() == {(2, 2)} and parent_changes.pending == 0
+    board.tile_at(2, 2).border = TileColor.GREEN
+    assert parent_changes.drain() == {(2, 2)} and clone_changes.pending == 0
+
+def test_placed_tiles_pickle_without_their_board():
+    board = GameBoard(5, 5)
+    tile = TileBuilder().add_position(2, 2).add_color(TileColor.RED).construct()
+    board.place_tile(tile)
+    copy = pickle.loads(pickle.dumps(tile))
+    journal = board.open_journal()
+    copy.border = TileColor.BLUE
+    assert copy.border == TileColor.BLUE and copy.color == TileColor.RED
+    assert journal.pending == 0
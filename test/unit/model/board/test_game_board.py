@@ -2,7 +2,8 @@ import pytest
 
 from tilematch_tools.model.exceptions import InvalidBoardPositionError, IllegalBoardContentException
 from tilematch_tools.model.board.game_board import GameBoard
-from tilematch_tools.model.tiles.tile import Tile
+from tilematch_tools.model.tiles.tile import Tile, NullTile
+from tilematch_tools.model.tiles import TileColor
 
 width = 10
 height = 24
@@ -64,3 +65,28 @@ class TestGameBoard:
             pass
         with pytest.raises(InvalidBoardPositionError):
             self.board.place_tile(SomeTile(**{'position': (x, y)}))
+
+    def test_clear_tile_reuses_the_shared_null_tile(self):
+        empty = self.board.tile_at(2, 2)
+        self.board.place_tile(Tile(**{'position': (2, 2)}))
+        self.board.clear_tile(2, 2)
+        assert self.board.tile_at(2, 2) is empty
+        assert type(empty) == NullTile
+
+    def test_clear_tile_replaces_a_modified_null_tile(self):
+        empty = self.board.tile_at(2, 2)
+        empty.border = TileColor.RED
+        self.board.clear_tile(2, 2)
+        cleared = self.board.tile_at(2, 2)
+        assert cleared is not empty
+        assert cleared.border == TileColor.GRAY
+        assert (cleared.position.x, cleared.position.y) == (2, 2)
+
+    def test_clear_tile_at_invalid_position(self):
+        with pytest.raises(InvalidBoardPositionError):
+            self.board.clear_tile(0, 1)
+
+    @pytest.mark.parametrize('x, y, available', [(1, 1, False), (2, 1, True), (0, 1, False), (1, height + 1, False)])
+    def test_is_available(self, x, y, available):
+        self.board.place_tile(Tile(**{'position': (1, 1)}))
+        assert self.board.is_available(x, y) is available
@@ -0,0 +1,131 @@
+"""Tests for board snapshots and copy-on-write clones"""
+
+import pytest
+
+from tilematch_tools.core import GameState, TileBuilder
+from tilematch_tools.model import Scoring, RunMatchCondition
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard
+from tilematch_tools.model.exceptions import IllegalBoardContentException
+from tilematch_tools.model.tiles import NullTile, TileColor
+
+def colors(board):
+    return [[board.tile_at(x, y).color for y in range(1, board.num_rows + 1)] for x in range(1, board.num_cols + 1)]
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def state(request):
+    state = GameState(request.param(4, 5), Scoring())
+    for x, color in ((1, TileColor.RED), (2, TileColor.BLUE), (3, TileColor.GREEN)):
+        state.board.place_tile(TileBuilder().add_position(x, 1).add_color(color).construct())
+    return state
+
+def test_restore_undoes_swaps_and_clears(state):
+    board = state.board
+    before = colors(board)
+    snapshot = board.snapshot()
+    state.swap_tiles(board.tile_at(1, 1), board.tile_at(2, 1))
+    board.clear_tile(3, 1)
+    board.restore(snapshot)
+    assert colors(board) == before
+    assert all((tile.position.x, tile.position.y) == (x, y)
+               for x in range(1, 5) for y in range(1, 6)
+               for tile in [board.tile_at(x, y)])
+
+def test_restore_reuses_the_captured_tiles():
+    board = GameBoard(3, 3)
+    tile = TileBuilder().add_position(1, 1).construct()
+    board.place_tile(tile)
+    snapshot = board.snapshot()
+    GameState(board, Scoring()).swap_tiles(tile, board.tile_at(1, 2))
+    board.restore(snapshot)
+    assert board.tile_at(1, 1) is tile
+    assert tile.position.y == 1
+
+def test_restore_records_only_changed_positions(state):
+    board = state.board
+    snapshot = board.snapshot()
+    board.clear_tile(3, 1)
+    journal = board.open_journal()
+    board.restore(snapshot)
+    assert journal.drain() == {(3, 1)}
+
+def test_restore_rejects_other_boards(state):
+    with pytest.raises(IllegalBoardContentException):
+        state.board.restore(GameBoard(2, 2).snapshot())
+
+def test_clone_changes_do_not_reach_the_parent(state):
+    board = state.board
+    before = colors(board)
+    twin = board.clone()
+    GameState(twin, Scoring()).swap_tiles(twin.tile_at(1, 1), twin.tile_at(2, 1))
+    twin.clear_tile(3, 1)
+    assert colors(board) == before
+    assert board.tile_at(1, 1).position.x == 1
+    assert twin.tile_at(1, 1).color == TileColor.BLUE
+    assert isinstance(twin.tile_at(3, 1), NullTile)
+
+def test_parent_changes_do_not_reach_the_clone(state):
+    board = state.board
+    twin = board.clone()
+    grandchild = twin.clone()
+    before = colors(twin)
+    board.clear_tile(1, 1)
+    board.place_tile(TileBuilder().add_position(4, 4).construct())
+    assert colors(twin) == before
+    assert colors(grandchild) == before
+
+def borders(board):
+    return [[board.tile_at(x, y).border for y in range(1, board.num_rows + 1)] for x in range(1, board.num_cols + 1)]
+
+def test_restore_undoes_border_edits(state):
+    board = state.board
+    before = borders(board)
+    tile, empty = board.tile_at(1, 1), board.tile_at(4, 4)
+    snapshot = board.snapshot()
+    tile.border = TileColor.RED
+    empty.border = TileColor.RED
+    board.mark_changed(1, 1)
+    journal = board.open_journal()
+    board.restore(snapshot)
+    assert borders(board) == before
+    if type(board) is GameBoard:
+        assert journal.drain() == {(1, 1), (4, 4)}
+
+@pytest.mark.parametrize('x, y', [(1, 1), (4, 4)])
+def test_parent_border_edits_do_not_reach_the_clone(state, x, y):
+    board = state.board
+    held = board.tile_at(x, y)
+    twin = board.clone()
+    grandchild = twin.clone()
+    before = borders(twin)
+    held.border = TileColor.BLUE
+    assert borders(twin) == before
+    assert borders(grandchild) == before
+    board.tile_at(x, y).border = TileColor.RED
+    assert borders(twin) == before
+
+def test_clone_border_edits_do_not_reach_the_parent(state):
+    board = state.board
+    before = borders(board)
+    twin = board.clone()
+    twin.tile_at(1, 1).border = TileColor.BLUE
+    twin.tile_at(4, 4).border = TileColor.BLUE
+    assert borders(board) == before
+
+def test_list_clones_share_untouched_columns():
+    board = GameBoard(3, 3)
+    twin = board.clone()
+    twin.clear_tile(1, 1)
+    assert twin._board[1] is board._board[1]
+    assert twin._board[0] is not board._board[0]
+
+def test_game_state_snapshot_and_clone(state):
+    snapshot = state.snapshot()
+    match = RunMatchCondition.MatchFound(10, [state.board.tile_at(1, 1)])
+    state.adjust_score(match)
+    state.clear_match(match)
+    twin = state.clone()
+    twin.adjust_score(match)
+    assert (state.score.score, twin.score.score) == (10, 20)
+    state.restore(snapshot)
+    assert state.score.score == 0
+    assert state.board.tile_at(1, 1).color == TileColor.RED
@@ -0,0 +1,123 @@
+"""Tests for incrementally maintained Zobrist hashes of game boards"""
+
+import random
+
+import pytest
+
+from tilematch_tools.core import GameState, TileBuilder
+from tilematch_tools.model import Scoring, RunMatchCondition
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard
+from tilematch_tools.model.board import zobrist
+from tilematch_tools.model.tiles import Tile, NullTile, TileColor, TileShape
+
+PALETTE = (TileColor.RED, TileColor.GREEN, TileColor.BLUE)
+
+def tile(x, y, color=TileColor.RED):
+    return TileBuilder().add_position(x, y).add_color(color).construct()
+
+def recomputed(board):
+    fresh = board.clone()
+    fresh._hash = None
+    return fresh.state_hash
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def board_type(request):
+    return request.param
+
+def test_empty_board_hashes_to_zero(board_type):
+    assert board_type(4, 5).state_hash == 0
+
+def test_hash_depends_on_tiles_and_positions(board_type):
+    first, second = board_type(4, 5), board_type(4, 5)
+    first.place_tile(tile(1, 1, TileColor.RED))
+    second.place_tile(tile(1, 1, TileColor.BLUE))
+    assert first.state_hash != second.state_hash
+    moved = board_type(4, 5)
+    moved.place_tile(tile(1, 2, TileColor.RED))
+    assert moved.state_hash not in (0, first.state_hash)
+
+def test_hash_ignores_borders(board_type):
+    first, second = board_type(4, 5), board_type(4, 5)
+    first.place_tile(tile(2, 2))
+    highlighted = tile(2, 2)
+    highlighted.border = TileColor.YELLOW
+    second.place_tile(highlighted)
+    assert first.state_hash == second.state_hash
+
+def test_hash_is_maintained_through_place_clear_and_swap(board_type):
+    rng = random.Random(0)
+    state = GameState(board_type(5, 6), Scoring())
+    board = state.board
+    assert board.state_hash == 0
+    for _ in range(200):
+        x, y = rng.randint(1, 5), rng.randint(1, 6)
+        action = rng.randrange(3)
+        if action == 0 and board._board_position_is_available(x, y):
+            board.place_tile(tile(x, y, rng.choice(PALETTE)))
+        elif action == 1:
+            board.clear_tile(x, y)
+        else:
+            other = (x % 5) + 1
+            state.swap_tiles(board.tile_at(x, y), board.tile_at(other, y))
+        assert board.state_hash == recomputed(board)
+
+def test_hash_is_maintained_when_placing_null_tiles(board_type):
+    board = board_type(3, 3)
+    board.state_hash
+    board.place_tile(tile(1, 1))
+    board.place_tile(NullTile(**{'position': (1, 1)}))
+    assert board.state_hash == 0
+
+def test_hash_is_maintained_when_clearing_matches(board_type):
+    state = GameState(board_type(4, 4), Scoring())
+    tiles = [tile(x, 1) for x in range(1, 4)]
+    for placed in tiles:
+        state.board.place_tile(placed)
+    assert state.board.state_hash != 0
+    state.clear_match(RunMatchCondition.MatchFound(1, tiles))
+    assert state.board.state_hash == 0
+
+def test_transposed_move_orders_reach_the_same_hash(board_type):
+    first, second = board_type(4, 4), board_type(4, 4)
+    first.place_tile(tile(1, 1, TileColor.RED))
+    first.place_tile(tile(2, 1, TileColor.BLUE))
+    second.place_tile(tile(2, 1, TileColor.BLUE))
+    second.place_tile(tile(1, 1, TileColor.RED))
+    assert first.state_hash == second.state_hash
+
+def test_hash_survives_restore_and_clone(board_type):
+    board = board_type(4, 4)
+    board.place_tile(tile(1, 1))
+    before = board.state_hash
+    snapshot = board.snapshot()
+    assert snapshot.state_hash == before
+    board.place_tile(tile(3, 3, TileColor.GREEN))
+    twin = board.clone()
+    assert twin.state_hash == board.state_hash
+    board.restore(snapshot)
+    assert board.state_hash == before
+    twin.clear_tile(3, 3)
+    assert twin.state_hash == before
+
+def test_restoring_an_unhashed_snapshot_recomputes_the_hash(board_type):
+    board = board_type(4, 4)
+    board.place_tile(tile(1, 1))
+    snapshot = board.snapshot()
+    assert snapshot.state_hash is None
+    board.place_tile(tile(2, 2))
+    board.state_hash
+    board.restore(snapshot)
+    assert board.state_hash == recomputed(board)
+
+def test_list_and_array_boards_agree():
+    first, second = GameBoard(3, 3), ArrayGameBoard(3, 3)
+    for board in (first, second):
+        board.place_tile(tile(1, 2, TileColor.BLUE))
+        board.place_tile(tile(3, 3, TileColor.GREEN))
+    assert first.state_hash == second.state_hash
+
+def test_values_are_stable_64_bit_integers():
+    value = zobrist.key_value(1, 1, Tile, TileColor.RED, TileShape.SQUARE)
+    assert value == zobrist.key_value(1, 1, Tile, TileColor.RED, TileShape.SQUARE)
+    assert 0 < value < 1 << 64
+    assert zobrist.key_value(1, 1, NullTile, TileColor.RED, TileShape.SQUARE) == 0
@@ -0,0 +1,85 @@
+"""Tests for the cluster match condition"""
+
+import pytest
+
+from tilematch_tools.model.match import ClusterMatchCondition, ORTHOGONAL, ScanDelta
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard, TileEncoder
+from tilematch_tools.model.tiles import Tile, TileColor
+
+def place(board, color, *positions):
+    for x, y in positions:
+        board.place_tile(Tile(**{'position': (x, y), 'color': color}))
+
+def cluster_positions(match):
+    return {(tile.position.x, tile.position.y) for tile in match.matching_tiles}
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def board(request):
+    return request.param(6, 6)
+
+def test_finds_connected_cluster(board):
+    place(board, TileColor.RED, (1, 1), (2, 1), (2, 2), (2, 3))
+    matches = ClusterMatchCondition(ORTHOGONAL, 7).find_all(board)
+    assert len(matches) == 1
+    assert matches[0].value == 7
+    assert cluster_positions(matches[0]) == {(1, 1), (2, 1), (2, 2), (2, 3)}
+
+def test_small_and_other_colored_clusters_are_ignored(board):
+    place(board, TileColor.RED, (1, 1), (2, 1), (3, 1))
+    place(board, TileColor.BLUE, (4, 1))
+    assert ClusterMatchCondition(ORTHOGONAL, 7).find_all(board) == []
+
+def test_diagonals_only_connect_when_requested(board):
+    place(board, TileColor.GREEN, (1, 1), (2, 2), (3, 3), (4, 4))
+    assert ClusterMatchCondition(ORTHOGONAL, 1).find_all(board) == []
+    diagonal = ClusterMatchCondition((ScanDelta.UPANDRIGHT,), 1)
+    assert len(diagonal.find_all(board)) == 1
+
+def test_each_cluster_reported_once(board):
+    place(board, TileColor.RED, *[(x, y) for x in range(1, 3) for y in range(1, 3)])
+    place(board, TileColor.BLUE, *[(x, y) for x in range(5, 7) for y in range(5, 7)])
+    assert len(ClusterMatchCondition(ORTHOGONAL, 1).find_all(board)) == 2
+
+def test_large_cluster_does_not_recurse(board):
+    big = GameBoard(120, 120) if type(board) == GameBoard else ArrayGameBoard(120, 120)
+    place(big, TileColor.RED, *[(x, y) for x in range(1, 121) for y in range(1, 121)])
+    matches = ClusterMatchCondition(ORTHOGONAL, 1).find_all(big)
+    assert len(matches[0].matching_tiles) == 120 * 120
+
+def test_positions_limit_search(board):
+    place(board, TileColor.RED, *[(x, y) for x in range(1, 3) for y in range(1, 3)])
+    place(board, TileColor.BLUE, *[(x, y) for x in range(5, 7) for y in range(5, 7)])
+    rule = ClusterMatchCondition(ORTHOGONAL, 1)
+    assert [cluster_positions(m) for m in rule.find_all(board, {(6, 6), (5, 5)})] == [
+            {(5, 5), (5, 6), (6, 5), (6, 6)}
+            ]
+    assert rule.check_match(board, 3, 3) is None
+    assert rule.check_match(board, 1, 1)
+
+def test_custom_equality_rule_is_respected(board):
+    place(board, TileColor.RED, (1, 1), (1, 3))
+    place(board, TileColor.BLUE, (1, 2), (1, 4))
+    assert ClusterMatchCondition(ORTHOGONAL, 1).find_all(board) == []
+    anything = ClusterMatchCondition(ORTHOGONAL, 1, equality_rule=lambda a, b: True)
+    assert len(anything.find_all(board)) == 1
+
+class Gem(Tile):
+    __slots__ = ()
+
+def test_subclass_tiles_cluster_the_same_way_everywhere(board):
+    place(board, TileColor.RED, (1, 1))
+    for x in (2, 3):
+        board.place_tile(Gem(**{'position': (x, 1), 'color': TileColor.RED}))
+    rule = ClusterMatchCondition(ORTHOGONAL, 7, min_size=3)
+    expected = {(1, 1), (2, 1), (3, 1)}
+    assert cluster_positions(rule.check_match(board, 1, 1)) == expected
+    assert [cluster_positions(m) for m in rule.find_all(board, [(1, 1)])] == [expected]
+    assert [cluster_positions(m) for m in rule.find_all(board)] == [expected]
+
+def test_positional_checks_do_not_encode_the_board(board, monkeypatch):
+    place(board, TileColor.RED, (1, 1), (2, 1), (3, 1), (3, 2))
+    rule = ClusterMatchCondition(ORTHOGONAL, 7)
+    monkeypatch.setattr(TileEncoder, 'encode', None)
+    assert cluster_positions(rule.check_match(board, 1, 1)) == {(1, 1), (2, 1), (3, 1), (3, 2)}
+    assert rule.check_match(board, 6, 6) is None
+    assert len(rule.find_all(board, [(1, 1), (3, 2), (9, 9)])) == 1
@@ -0,0 +1,84 @@
+"""Tests for the run match condition"""
+
+import pytest
+
+from tilematch_tools.model.match import MatchCondition, RunMatchCondition, ScanDelta
+from tilematch_tools.model.board import GameBoard, ArrayGameBoard
+from tilematch_tools.model.tiles import Tile, TileColor
+
+def place(board, color, *positions):
+    for x, y in positions:
+        board.place_tile(Tile(**{'position': (x, y), 'color': color}))
+
+def run_positions(match):
+    return [(tile.position.x, tile.position.y) for tile in match.matching_tiles]
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def board(request):
+    return request.param(6, 6)
+
+def test_run_length_must_be_at_least_two():
+    with pytest.raises(ValueError):
+        RunMatchCondition(ScanDelta.RIGHT, 1, run_length=1)
+
+def test_finds_horizontal_run(board):
+    place(board, TileColor.RED, (2, 1), (3, 1), (4, 1))
+    matches = RunMatchCondition(ScanDelta.RIGHT, 5).find_all(board)
+    assert len(matches) == 1
+    assert isinstance(matches[0], MatchCondition.MatchFound)
+    assert matches[0].value == 5
+    assert run_positions(matches[0]) == [(2, 1), (3, 1), (4, 1)]
+
+def test_runs_shorter_than_run_length_are_ignored(board):
+    place(board, TileColor.RED, (1, 1), (2, 1))
+    assert RunMatchCondition(ScanDelta.RIGHT, 5).find_all(board) == []
+
+def test_different_colors_break_runs(board):
+    place(board, TileColor.RED, (1, 1), (2, 1), (4, 1), (5, 1))
+    place(board, TileColor.BLUE, (3, 1))
+    assert RunMatchCondition(ScanDelta.RIGHT, 5).find_all(board) == []
+
+def test_maximal_run_is_reported_once(board):
+    place(board, TileColor.RED, *[(x, 2) for x in range(1, 7)])
+    matches = RunMatchCondition((ScanDelta.RIGHT, ScanDelta.LEFT), 5).find_all(board)
+    assert len(matches) == 1
+    assert len(matches[0].matching_tiles) == 6
+
+def test_finds_diagonal_runs(board):
+    place(board, TileColor.GREEN, (1, 1), (2, 2), (3, 3))
+    place(board, TileColor.BLUE, (6, 1), (5, 2), (4, 3))
+    rule = RunMatchCondition((ScanDelta.UPANDRIGHT, ScanDelta.DOWNANDRIGHT), 1)
+    runs = sorted(run_positions(m) for m in rule.find_all(board))
+    assert runs == [[(1, 1), (2, 2), (3, 3)], [(4, 3), (5, 2), (6, 1)]]
+
+def test_crossing_runs_are_found_per_axis(board):
+    place(board, TileColor.RED, (1, 3), (2, 3), (3, 3), (2, 2), (2, 4))
+    rule = RunMatchCondition((ScanDelta.RIGHT, ScanDelta.UP), 1)
+    assert len(rule.find_all(board)) == 2
+
+def test_check_match_through_position(board):
+    place(board, TileColor.RED, (3, 2), (3, 3), (3, 4))
+    rule = RunMatchCondition((ScanDelta.RIGHT, ScanDelta.UP), 1)
+    assert run_positions(rule.check_match(board, 3, 3)) == [(3, 2), (3, 3), (3, 4)]
+    assert rule.check_match(board, 1, 1) is None
+    assert rule.check_match(board, 0, 0) is None
+
+def test_custom_equality_rule_is_respected(board):
+    place(board, TileColor.RED, (1, 1), (3, 1))
+    place(board, TileColor.BLUE, (2, 1))
+    anything = RunMatchCondition(ScanDelta.RIGHT, 1, equality_rule=lambda a, b: True)
+    assert len(anything.find_all(board)) == 1
+    assert RunMatchCondition(ScanDelta.RIGHT, 1).find_all(board) == []
+
+class Gem(Tile):
+    __slots__ = ()
+
+def test_subclass_tiles_match_the_same_way_everywhere(board):
+    board.place_tile(Tile(**{'position': (1, 1), 'color': TileColor.RED}))
+    for x in (2, 3):
+        board.place_tile(Gem(**{'position': (x, 1), 'color': TileColor.RED}))
+    rule = RunMatchCondition(ScanDelta.RIGHT, 10)
+    through = rule.check_match(board, 1, 1)
+    assert through is not None and run_positions(through) == [(1, 1), (2, 1), (3, 1)]
+    assert [run_positions(m) for m in rule.find_all(board, [(1, 1)])] == [[(1, 1), (2, 1), (3, 1)]]
+    assert [run_positions(m) for m in rule.find_all(board)] == [[(1, 1), (2, 1), (3, 1)]]
@@ -63,3 +63,58 @@ class TestMovementRule:
         simple_down._after = Mock()
         simple_down.move(self.board, self.tile, 1, 2, 3)
         simple_down._after.assert_called_once_with(1, 2, 3)
+
+@pytest.fixture
+def checked_down():
+    class CheckedDown(MovementRule):
+        def __init__(self):
+            super().__init__()
+            self.applied = 0
+
+        def destination(self, board, tile):
+            return (tile.position.x, tile.position.y - 1)
+
+        def apply(self, board, tile):
+            self.applied += 1
+            tile.position = self.destination(board, tile)
+            board.place_tile(tile)
+
+    return CheckedDown()
+
+class TestCanMove:
+    def setup_method(self):
+        self.board = GameBoard(3, 3)
+        self.tile = Tile(**{'position': (2, 2)})
+        self.board.place_tile(self.tile)
+
+    def test_rules_without_destination_are_assumed_movable(self, simple_down):
+        assert simple_down.can_move(self.board, self.tile)
+
+    def test_free_destination_can_be_moved_to(self, checked_down):
+        assert checked_down.can_move(self.board, self.tile)
+        assert checked_down.move(self.board, self.tile)
+        assert self.board.tile_at(2, 1) is self.tile
+
+    def test_blocked_moves_are_skipped_without_applying(self, checked_down):
+        checked_down.move(self.board, self.tile)
+        checked_down._after = Mock()
+        assert not checked_down.can_move(self.board, self.tile)
+        assert not checked_down.move(self.board, self.tile, 'done')
+        assert checked_down.applied == 1
+        assert self.board.tile_at(2, 1) is self.tile
+        checked_down._after.assert_called_once_with('done')
+
+    def test_occupied_destination_is_blocked(self, checked_down):
+        self.board.place_tile(Tile(**{'position': (2, 1)}))
+        assert not checked_down.can_move(self.board, self.tile)
+        assert not checked_down.move(self.board, self.tile)
+        assert self.tile.position.y == 2
+
+    def test_immovable_tiles_cannot_move(self, checked_down):
+        self.tile._movable = False
+        assert not checked_down.can_move(self.board, self.tile)
+
+    def test_failed_apply_reports_no_move(self, simple_down):
+        self.board.place_tile(Tile(**{'position': (2, 1)}))
+        assert not simple_down.move(self.board, self.tile)
+        assert self.tile.position.y == 2
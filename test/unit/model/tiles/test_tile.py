@@ -77,3 +77,39 @@ class TestTiles:
         the_tile = Tile(**{'position': (x, y)})
         the_tile.border = "blue"
         assert the_tile.border == "blue"
+
+    def test_tiles_are_slotted(self):
+        the_tile = Tile(**{'position': (1, 1)})
+        assert not hasattr(the_tile, '__dict__')
+        assert not hasattr(the_tile.position, '__dict__')
+        assert not hasattr(the_tile._appearance, '__dict__')
+
+    def test_unslotted_subclasses_keep_a_dict(self):
+        class TaggedTile(Tile):
+            pass
+        the_tile = TaggedTile(**{'position': (1, 1)})
+        the_tile.tag = 'bomb'
+        assert the_tile.tag == 'bomb'
+
+    def test_border_change_does_not_leak_into_alike_tiles(self):
+        first = Tile(**{'position': (1, 1)})
+        second = Tile(**{'position': (2, 1)})
+        assert first._appearance is second._appearance
+        first.border = TileColor.BLUE
+        assert second.border == TileColor.GRAY
+
+    def test_copy_at_keeps_subclass_state(self):
+        class ChargedTile(Tile):
+            __slots__ = ('charge', 'spare')
+        class TaggedTile(ChargedTile):
+            pass
+        the_tile = TaggedTile(**{'position': (1, 1), 'color': TileColor.BLUE})
+        the_tile.charge = 3
+        the_tile.tag = 'bomb'
+        duplicate = the_tile.copy_at(4, 5)
+        assert type(duplicate) == TaggedTile
+        assert (duplicate.position.x, duplicate.position.y) == (4, 5)
+        assert (the_tile.position.x, the_tile.position.y) == (1, 1)
+        assert duplicate._appearance is the_tile._appearance
+        assert (duplicate.charge, duplicate.tag) == (3, 'bomb')
+        assert not hasattr(duplicate, 'spare')
@@ -1,5 +1,6 @@
 """Tests for tile appearance"""
 
+from dataclasses import FrozenInstanceError
 from itertools import product
 
 import pytest
@@ -12,3 +13,13 @@ def test_appearance_dataclass(color, shape, border):
     assert ta.color == color
     assert ta.shape == shape
     assert ta.border == border
+
+def test_appearances_are_interned():
+    ta = TileAppearance.intern(TileColor.RED, TileShape.SQUARE, TileColor.GRAY)
+    assert ta is TileAppearance.intern(TileColor.RED, TileShape.SQUARE, TileColor.GRAY)
+    assert ta is not TileAppearance.intern(TileColor.RED, TileShape.SQUARE, TileColor.BLUE)
+
+def test_appearances_are_immutable():
+    ta = TileAppearance.intern(TileColor.RED, TileShape.SQUARE, TileColor.GRAY)
+    with pytest.raises(FrozenInstanceError):
+        ta.border = TileColor.BLUE
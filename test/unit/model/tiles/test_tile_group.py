@@ -2,9 +2,9 @@
 
 import pytest
 
-from tilematch_tools.model import TileGroup
+from tilematch_tools.model import TileGroup, GameBoard, ArrayGameBoard, Tile, NullTile, TileColor
 from tilematch_tools.model.exceptions import TileGroupPositionOccupiedError, \
-                                         TileGroupDisbandedException
+                                         TileGroupDisbandedException, InvalidBoardPositionError
 from tilematch_tools.core import TileBuilder
 
 class TestTileGroup:
@@ -40,3 +40,89 @@ class TestTileGroup:
                     1,
                     1
                     )
+
+@pytest.fixture(params=[GameBoard, ArrayGameBoard])
+def board(request):
+    return request.param(6, 6)
+
+@pytest.fixture
+def l_group(board):
+    """An L of three tiles centered at (3, 3), placed on the board"""
+    center = Tile(**{'position': (3, 3), 'color': TileColor.RED})
+    above = Tile(**{'position': (1, 1), 'color': TileColor.BLUE})
+    right = Tile(**{'position': (1, 1), 'color': TileColor.GREEN})
+    group = TileGroup(center)
+    group.add_sibling_tile(above, 0, 1)
+    group.add_sibling_tile(right, 1, 0)
+    for tile in (center, above, right):
+        board.place_tile(tile)
+    return group
+
+def colors_at(board, positions):
+    return [board.tile_at(x, y).color for x, y in positions]
+
+class TestTileGroupMovement:
+    def test_siblings_sit_at_their_offsets(self, board, l_group):
+        assert l_group.orientation == 0
+        assert l_group.footprint() == [(3, 3), (3, 4), (4, 3)]
+        assert colors_at(board, l_group.footprint()) == [TileColor.RED, TileColor.BLUE, TileColor.GREEN]
+
+    def test_shift_moves_every_tile(self, board, l_group):
+        journal = board.open_journal()
+        assert l_group.shift(board, 0, -1)
+        assert l_group.footprint() == [(3, 2), (3, 3), (4, 2)]
+        assert colors_at(board, l_group.footprint()) == [TileColor.RED, TileColor.BLUE, TileColor.GREEN]
+        assert type(board.tile_at(4, 3)) == NullTile
+        assert journal.drain() == {(3, 3), (3, 4), (4, 3), (3, 2), (4, 2)}
+
+    def test_blocked_shift_changes_nothing(self, board, l_group):
+        board.place_tile(Tile(**{'position': (4, 2)}))
+        journal = board.open_journal()
+        assert not l_group.can_shift(board, 0, -1)
+        assert not l_group.shift(board, 0, -1)
+        assert l_group.footprint() == [(3, 3), (3, 4), (4, 3)]
+        assert journal.pending == 0
+
+    def test_shift_off_the_board_is_blocked(self, board, l_group):
+        assert l_group.can_shift(board, 2, 0)
+        assert not l_group.can_shift(board, 3, 0)
+        assert not l_group.shift(board, 0, 3)
+
+    def test_rotation_uses_the_turned_offsets(self, board, l_group):
+        assert l_group.rotate(board)
+        assert l_group.orientation == 1
+        assert l_group.footprint() == [(3, 3), (2, 3), (3, 4)]
+        assert colors_at(board, l_group.footprint()) == [TileColor.RED, TileColor.BLUE, TileColor.GREEN]
+        assert l_group.rotate(board, -1)
+        assert l_group.orientation == 0
+        assert l_group.footprint() == [(3, 3), (3, 4), (4, 3)]
+
+    def test_blocked_rotation_keeps_the_orientation(self, board, l_group):
+        board.place_tile(Tile(**{'position': (2, 3)}))
+        assert not l_group.rotate(board)
+        assert l_group.orientation == 0
+
+    def test_moves_keep_the_state_hash(self, board, l_group):
+        board.state_hash
+        l_group.shift(board, 1, 1)
+        l_group.rotate(board, 2)
+        fresh = type(board)(6, 6)
+        for x, y in l_group.footprint():
+            fresh.place_tile(board.tile_at(x, y))
+        assert board.state_hash == fresh.state_hash
+
+    def test_siblings_added_after_rotating_keep_their_place(self, board, l_group):
+        l_group.rotate(board)
+        l_group.add_sibling_tile(Tile(**{'position': (1, 1)}), 1, 0)
+        assert (4, 3) in l_group.footprint()
+
+    def test_disbanded_groups_cannot_move(self, board, l_group):
+        l_group.disband()
+        with pytest.raises(TileGroupDisbandedException):
+            l_group.shift(board, 0, -1)
+
+    def test_relocating_onto_another_tile_raises(self, board, l_group):
+        board.place_tile(Tile(**{'position': (5, 5)}))
+        tile = board.tile_at(3, 3)
+        with pytest.raises(InvalidBoardPositionError):
+            board.relocate([(tile, 5, 5)])
@@ -1,5 +1,9 @@
 """Tests for tilematch_tools"""
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 def test_vacuous():
@@ -22,3 +26,58 @@ def test_exception_is_raised():
     """Test that an exception is raised"""
     with pytest.raises(ValueError):
         raise ValueError
+
+def run_isolated(source):
+    """Run source in a fresh interpreter and return what it prints"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, '-c', source], env=env, capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+def test_core_and_model_import_without_tk_or_dotenv():
+    loaded = run_isolated(
+            "import sys\n"
+            "import tilematch_tools.core, tilematch_tools.model\n"
+            "print(sorted(m for m in ('tkinter', 'dotenv') if m in sys.modules))"
+            )
+    assert loaded == '[]'
+
+def test_package_imports_without_numpy_or_multiprocessing():
+    loaded = run_isolated(
+            "import sys\n"
+            "import tilematch_tools\n"
+            "print(sorted(m for m in ('numpy', 'multiprocessing', 'concurrent.futures') if m in sys.modules))"
+            )
+    assert loaded == '[]'
+
+def test_star_import_exports_lazy_names():
+    names = run_isolated(
+            "from tilematch_tools import *\n"
+            "print(' '.join(sorted(n for n in dir() if not n.startswith('_'))))"
+            ).split()
+    for name in ('GameEngine', 'BoardView', 'GameView', 'GameTitle', 'NullView', 'GameBoard',
+                 'ArrayGameBoard', 'TileEncoder', 'RunMatchCondition', 'BatchRunner', 'VectorGameEnv'):
+        assert name in names
+
+def test_core_imports_on_hosts_without_tk():
+    result = run_isolated(
+            "import sys\n"
+            "sys.modules['tkinter'] = None\n"
+            "from tilematch_tools.core import HeadlessEngine, GameState\n"
+            "from tilematch_tools.view import NullView\n"
+            "try:\n"
+            "    from tilematch_tools import GameEngine\n"
+            "except ImportError:\n"
+            "    print('lazy')\n"
+            )
+    assert result == 'lazy'
+
+def test_view_exports_resolve_lazily():
+    import tilematch_tools
+    from tilematch_tools.view.game_view import GameView
+    from tilematch_tools.core.game_engine import GameEngine
+    assert tilematch_tools.GameView is GameView
+    assert tilematch_tools.GameEngine is GameEngine
+    assert tilematch_tools.TileEncoder is tilematch_tools.model.board.TileEncoder
+    assert 'GameView' in dir(tilematch_tools)
+    with pytest.raises(AttributeError):
+        tilematch_tools.NotAThing
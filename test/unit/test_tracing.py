@@ -0,0 +1,45 @@
+"""Tests for the hot path logging switch"""
+
+import os
+import subprocess
+import sys
+from operator import attrgetter
+
+import pytest
+
+from tilematch_tools.tracing import hot_property
+
+def make_holder(enabled, calls):
+    class Holder:
+        def __init__(self):
+            self._value = 7
+
+        @hot_property(attrgetter('_value'), enabled=enabled)
+        def value(self):
+            """the held value"""
+            calls.append('traced')
+            return self._value
+    return Holder()
+
+@pytest.mark.parametrize("enabled, traced_calls", [(True, 1), (False, 0)])
+def test_hot_property_picks_implementation(enabled, traced_calls):
+    calls = []
+    holder = make_holder(enabled, calls)
+    assert holder.value == 7
+    assert len(calls) == traced_calls
+    assert type(holder).value.__doc__ == 'the held value'
+
+@pytest.mark.parametrize("env, expected", [
+    ({'logconf': 'release'}, 'False'),
+    ({'logconf': 'develop'}, 'True'),
+    ({'logconf': 'release', 'hotpathlog': 'on'}, 'True'),
+    ({'logconf': 'develop', 'hotpathlog': 'off'}, 'False'),
+    ])
+def test_switch_is_read_from_environment(env, expected):
+    environ = {k: v for k, v in os.environ.items() if k not in ('logconf', 'hotpathlog')}
+    environ.update(env, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+            [sys.executable, '-c', 'from tilematch_tools.tracing import HOT_PATH_LOGGING; print(HOT_PATH_LOGGING)'],
+            env=environ, capture_output=True, text=True, check=True
+            )
+    assert out.stdout.strip() == expected
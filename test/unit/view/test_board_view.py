@@ -3,6 +3,7 @@
 import tkinter as tk
 import random
 import time
+from unittest.mock import Mock
 
 import pytest
 
@@ -122,3 +123,29 @@ def test_tile_movement(simple_board, move_rule_up, move_rule_down, move_rule_lef
 
     root.after(100, update_board_view)
     root.mainloop()
+
+@pytest.fixture
+def hit_target():
+    """Stands in for a BoardView over a 300x300 board, without a display"""
+    board = BoardFactory.create_board(GameBoard, 300, 300)
+    return Mock(
+            watching=board,
+            tile_side_length=BoardView.tile_side_length,
+            board_height=BoardView.tile_side_length * board.num_rows
+            )
+
+@pytest.mark.parametrize("x, y", [(1, 1), (300, 300), (17, 243), (300, 1)])
+def test_position_at_inverts_tile_bounding_boxes(hit_target, x, y):
+    tile = TileBuilder().add_position(x, y).construct()
+    bbox = BoardView.bbox_for_tile(hit_target, tile)
+    assert BoardView.position_at(hit_target, bbox.start_x, bbox.start_y) == (x, y)
+    assert BoardView.position_at(hit_target, bbox.end_x - 1, bbox.end_y - 1) == (x, y)
+
+@pytest.mark.parametrize("px, py, clamped", [
+    (-5, 10, (1, 300)),
+    (10, -5, (1, 300)),
+    (300 * 30 + 3, 300 * 30 + 3, (300, 1))
+    ])
+def test_position_at_outside_the_board(hit_target, px, py, clamped):
+    assert BoardView.position_at(hit_target, px, py) is None
+    assert BoardView.position_at(hit_target, px, py, clamp=True) == clamped
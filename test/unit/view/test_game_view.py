@@ -283,3 +283,10 @@ def test_board_blocked_by_gameover_screen_when_game_ended(simple_game_state):
     root.mainloop()
 
 
+
+def test_mouse_event_hit_tests_through_board_view():
+    board_view = Mock()
+    board_view.position_at.return_value = (4, 2)
+    clicked = MouseEvent(Mock(), board_view)(Mock(x=100, y=50))
+    assert clicked == (4, 2)
+    board_view.position_at.assert_called_once_with(100, 50, clamp=True)
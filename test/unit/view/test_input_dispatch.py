@@ -0,0 +1,87 @@
+"""Tests for input_dispatch"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tilematch_tools.view import NullView
+from tilematch_tools.view.input_dispatch import KEY, CLICK
+
+class QueuedView(NullView):
+    QUEUE_INPUT = True
+    MAX_QUEUED_INPUT = 4
+
+def key(keysym):
+    return SimpleNamespace(keysym=keysym, x=0, y=0)
+
+def click(x, y):
+    return SimpleNamespace(x=x, y=y)
+
+@pytest.fixture
+def handled():
+    return []
+
+@pytest.fixture
+def view(handled):
+    view = QueuedView(None, None)
+    view.bind_key('<Key>', lambda event: handled.append(event.keysym))
+    view.bind_click('<Button-1>', lambda event: handled.append((event.x, event.y)))
+    return view
+
+def test_events_are_handled_immediately_by_default(handled):
+    view = NullView(None, None)
+    view.bind_key('<Key>', lambda event: handled.append(event.keysym))
+    view.dispatch(KEY, '<Key>', key('a'))
+    assert handled == ['a']
+
+def test_queued_events_wait_for_process_input(view, handled):
+    view.dispatch(KEY, '<Key>', key('Left'))
+    view.dispatch(CLICK, '<Button-1>', click(1, 2))
+    assert handled == [] and view.queued_input == 2
+    assert view.process_input() == 2
+    assert handled == ['Left', (1, 2)] and view.queued_input == 0
+
+def test_repeated_keys_are_coalesced(view, handled):
+    for keysym in ('Left', 'Left', 'Left', 'Right', 'Left', 'Left'):
+        view.dispatch(KEY, '<Key>', key(keysym))
+    view.process_input()
+    assert handled == ['Left', 'Right', 'Left']
+
+def test_repeated_clicks_are_kept(view, handled):
+    view.dispatch(CLICK, '<Button-1>', click(1, 1))
+    view.dispatch(CLICK, '<Button-1>', click(1, 1))
+    view.process_input()
+    assert handled == [(1, 1), (1, 1)]
+
+def test_queue_is_bounded(view, handled):
+    for keysym in 'abcdefgh':
+        view.dispatch(KEY, '<Key>', key(keysym))
+    view.process_input()
+    assert handled == list('abcd')
+
+def test_unbound_events_are_rejected(view):
+    with pytest.raises(KeyError):
+        view.dispatch(KEY, '<Up>', key('Up'))
+
+def test_recorder_sees_events_when_handled(view, handled):
+    recorded = []
+    view.recorder = SimpleNamespace(record=lambda kind, sequence, event: recorded.append(sequence))
+    view.dispatch(KEY, '<Key>', key('a'))
+    view.dispatch(KEY, '<Key>', key('a'))
+    assert recorded == []
+    view.process_input()
+    assert recorded == ['<Key>']
+
+def test_on_delivered_runs_after_each_handler(handled):
+    view = NullView(None, None)
+    view.bind_key('<Key>', lambda event: handled.append(event.keysym))
+    view.on_delivered = lambda: handled.append('delivered')
+    view.dispatch(KEY, '<Key>', key('a'))
+    assert handled == ['a', 'delivered']
+
+def test_on_delivered_waits_for_queued_events(view, handled):
+    view.on_delivered = lambda: handled.append('delivered')
+    view.dispatch(KEY, '<Key>', key('a'))
+    assert handled == []
+    view.process_input()
+    assert handled == ['a', 'delivered']
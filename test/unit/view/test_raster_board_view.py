@@ -0,0 +1,50 @@
+"""Tests for the raster board view"""
+
+import tkinter as tk
+
+import pytest
+
+from tilematch_tools import BoardFactory, GameBoard, TileBuilder
+from tilematch_tools.model.tiles import TileColor
+from tilematch_tools.view import RasterBoardView
+from tilematch_tools.view.raster_board_view import CellPainter, horizontal_runs
+
+def test_cell_painter_outlines_tiles_in_their_border_color():
+    painter = CellPainter(3)
+    tile = TileBuilder().add_position(1, 1).add_color(TileColor.RED).add_border(TileColor.BLUE).construct()
+    data = painter.data_for([tile])
+    assert data == '{#0000FF #0000FF #0000FF} {#0000FF #FF0000 #0000FF} {#0000FF #0000FF #0000FF}'
+
+def test_cell_painter_joins_a_run_row_by_row():
+    painter = CellPainter(2)
+    red = TileBuilder().add_position(1, 1).add_border(TileColor.RED).construct()
+    blue = TileBuilder().add_position(2, 1).add_border(TileColor.BLUE).construct()
+    assert painter.data_for([red, blue]) == '{#FF0000 #FF0000 #0000FF #0000FF} {#FF0000 #FF0000 #0000FF #0000FF}'
+
+@pytest.mark.parametrize("positions, runs", [
+    (set(), []),
+    ({(3, 1), (1, 1), (2, 1)}, [(1, 1, 3)]),
+    ({(1, 2), (3, 2), (1, 1)}, [(1, 1, 1), (2, 1, 1), (2, 3, 3)]),
+    ])
+def test_horizontal_runs(positions, runs):
+    assert horizontal_runs(positions) == runs
+
+@pytest.mark.integration
+def test_raster_board_view():
+    board = BoardFactory.create_board(GameBoard, 300, 300)
+    root = tk.Tk()
+    board_view = RasterBoardView(root, board)
+    board_view.pack()
+
+    def flash(event):
+        x, y = board_view.position_at(event.x, event.y)
+        board.place_tile(TileBuilder().add_position(x, y).add_color(TileColor.RED).construct())
+
+    board_view.showing.bind('<Button-1>', flash)
+
+    def update_board_view():
+        board_view.update()
+        root.after(100, update_board_view)
+
+    root.after(100, update_board_view)
+    root.mainloop()